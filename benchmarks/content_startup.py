@@ -0,0 +1,104 @@
+"""
+Бенчмарк старта: загрузка всего контента из отдельных JSON-файлов
+и из упакованного бандла (utils/bundle.py).
+
+Каждый замер — отдельный процесс Python, как при запуске игры:
+открывается хранилище контента, компилируются все диалоги,
+загружаются новости и персонажи.
+
+Запуск из корня репозитория:
+    python -m benchmarks.content_startup --runs 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from utils.bundle import build_bundle
+from utils.content import CONTENT_ROOT
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Код, выполняемый в свежем процессе; печатает время загрузки контента в мс
+# (импорт модулей игры одинаков в обоих режимах и не замеряется)
+_LOAD_SCRIPT = """
+import sys, time
+from utils.content import ContentRepository
+from utils.bundle import open_bundle
+from dialog.compiler import compile_dialog
+from news.news import News
+
+start = time.perf_counter()
+bundle = open_bundle(sys.argv[1]) if sys.argv[1] else None
+repo = ContentRepository(bundle=bundle)
+for name in repo.list("data/dialogs"):
+    repo.get(f"data/dialogs/{name}.json", build=compile_dialog)
+for name in repo.list("data/news"):
+    repo.get(f"data/news/{name}.json", build=News)
+repo.get("characters/characters.json")
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _run(bundle_path, runs):
+    """Время загрузки (мс) в runs свежих процессах"""
+    times = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _LOAD_SCRIPT, bundle_path],
+            cwd=CONTENT_ROOT
+        )
+        times.append(float(output.decode().strip()))
+    return times
+
+
+def _summary(times):
+    return {
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "max_ms": max(times),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк загрузки контента при старте")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument(
+        "--output", default=os.path.join(RESULTS_DIR, "content_startup.json")
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_path = os.path.join(tmp, "content.bundle")
+        files = build_bundle(path=bundle_path)
+        bundle_size = os.path.getsize(bundle_path)
+
+        loose = _summary(_run("", args.runs))
+        bundled = _summary(_run(bundle_path, args.runs))
+
+    print(f"Файлов контента: {files}, размер бандла: {bundle_size} байт")
+    print(f"Отдельные файлы: {loose['median_ms']:.2f} мс (медиана)")
+    print(f"Бандл:           {bundled['median_ms']:.2f} мс (медиана)")
+
+    report = {
+        "benchmark": "content_startup",
+        "runs": args.runs,
+        "files": files,
+        "bundle_bytes": bundle_size,
+        "loose": loose,
+        "bundle": bundled,
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Отчёт сохранён: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Бенчмарк K кратчайших маршрутов (алгоритм Йена) на сгенерированных галактиках.
+
+Сравнивает версию с переиспользованием дерева кратчайших путей до цели
+и классический Йен с полной Дейкстрой на каждое ответвление.
+
+Запуск из корня репозитория:
+    python -m benchmarks.k_shortest --sizes 1000 10000 --max-k 10
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+from core import map as galaxy_map
+from core.galaxy_gen import generate_galaxy
+from core.routing import k_shortest_paths
+
+
+DEFAULT_SIZES = [1000, 10000]
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _time_queries(graph, pairs, k, reuse_trees):
+    """Среднее время одного запроса в миллисекундах"""
+    start = time.perf_counter()
+    for source, target in pairs:
+        k_shortest_paths(graph, source, target, k, reuse_trees=reuse_trees)
+    return (time.perf_counter() - start) * 1000 / max(1, len(pairs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк K кратчайших маршрутов")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--max-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--skip-baseline", action="store_true",
+                        help="не замерять Йена без переиспользования деревьев")
+    parser.add_argument(
+        "--output", default=os.path.join(RESULTS_DIR, "k_shortest.json")
+    )
+    args = parser.parse_args(argv)
+
+    original_graph = dict(galaxy_map.GALAXY_GRAPH)
+    results = []
+    try:
+        for size in args.sizes:
+            galaxy_map.set_galaxy_graph(generate_galaxy(size, seed=args.seed))
+            graph = galaxy_map.get_compiled_graph()
+            rng = random.Random(args.seed)
+            pairs = [(rng.randrange(size), rng.randrange(size)) for _ in range(args.queries)]
+
+            for k in range(1, args.max_k + 1):
+                result = {
+                    "systems": size,
+                    "k": k,
+                    "reuse_trees_ms": _time_queries(graph, pairs, k, True),
+                }
+                if not args.skip_baseline:
+                    result["baseline_ms"] = _time_queries(graph, pairs, k, False)
+                results.append(result)
+
+                line = f"{size:>7} систем, k={k:>2}: {result['reuse_trees_ms']:.1f} мс"
+                if "baseline_ms" in result:
+                    line += f" (без деревьев: {result['baseline_ms']:.1f} мс)"
+                print(line)
+    finally:
+        galaxy_map.set_galaxy_graph(original_graph)
+
+    report = {
+        "benchmark": "k_shortest",
+        "seed": args.seed,
+        "queries": args.queries,
+        "results": results,
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Отчёт сохранён: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
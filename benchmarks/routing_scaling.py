@@ -0,0 +1,134 @@
+"""
+Бенчмарк масштабирования маршрутизации на сгенерированных галактиках.
+
+Для каждого размера карты замеряет get_path, get_max_reachable_path,
+generate_order, раскладку и отрисовку карты и пишет кривые в JSON-отчёт.
+
+Запуск из корня репозитория:
+    python -m benchmarks.routing_scaling --sizes 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+from core import map as galaxy_map
+from core.galaxy_gen import generate_galaxy, DEGREE_UNIFORM, DEGREE_POWER_LAW
+from core.game import render_map
+from core.layout import compute_layout
+from core.state import GameState
+from orders.generator import generate_order
+
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _time_per_call(func, args_list):
+    """Среднее время одного вызова в миллисекундах"""
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / max(1, len(args_list))
+
+
+def run_size(size, seed, queries, degree_distribution):
+    """Замеры для одной галактики"""
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    graph = generate_galaxy(size, seed=seed, degree_distribution=degree_distribution)
+    generate_ms = (time.perf_counter() - start) * 1000
+
+    galaxy_map.set_galaxy_graph(graph)
+    planets = list(graph.keys())
+    pairs = [(rng.choice(planets), rng.choice(planets)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    compiled = galaxy_map.get_compiled_graph()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    # Первый запрос отдельно: он может включать построение таблицы маршрутов
+    start = time.perf_counter()
+    galaxy_map.get_path(*pairs[0])
+    first_path_ms = (time.perf_counter() - start) * 1000
+
+    state = GameState()
+    state.current_planet = planets[0]
+
+    # Раскладка считается один раз на карту (и кэшируется на диск),
+    # поэтому замеряется отдельно от отрисовки окна карты
+    start = time.perf_counter()
+    compute_layout(compiled)
+    layout_ms = (time.perf_counter() - start) * 1000
+    render_map(state)
+
+    result = {
+        "systems": size,
+        "edges": compiled.edge_count,
+        "generate_ms": generate_ms,
+        "compile_ms": compile_ms,
+        "first_get_path_ms": first_path_ms,
+        "get_path_ms": _time_per_call(galaxy_map.get_path, pairs),
+        "get_max_reachable_path_ms": _time_per_call(
+            galaxy_map.get_max_reachable_path,
+            [(a, b, 500) for a, b in pairs]
+        ),
+        "generate_order_ms": _time_per_call(generate_order, [(state,)] * queries),
+        "layout_ms": layout_ms,
+        "render_map_ms": _time_per_call(render_map, [(state,)]),
+    }
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк масштабирования маршрутизации")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument(
+        "--degree-distribution",
+        choices=[DEGREE_UNIFORM, DEGREE_POWER_LAW],
+        default=DEGREE_UNIFORM
+    )
+    parser.add_argument(
+        "--output", default=os.path.join(RESULTS_DIR, "routing_scaling.json")
+    )
+    args = parser.parse_args(argv)
+
+    original_graph = dict(galaxy_map.GALAXY_GRAPH)
+    results = []
+    try:
+        for size in args.sizes:
+            result = run_size(size, args.seed, args.queries, args.degree_distribution)
+            results.append(result)
+            print(
+                f"{size:>7} систем: get_path {result['get_path_ms']:.2f} мс, "
+                f"max_reachable {result['get_max_reachable_path_ms']:.2f} мс, "
+                f"generate_order {result['generate_order_ms']:.3f} мс, "
+                f"карта {result['render_map_ms']:.1f} мс"
+            )
+    finally:
+        galaxy_map.set_galaxy_graph(original_graph)
+
+    report = {
+        "benchmark": "routing_scaling",
+        "seed": args.seed,
+        "queries": args.queries,
+        "degree_distribution": args.degree_distribution,
+        "results": results,
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Отчёт сохранён: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
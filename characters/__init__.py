@@ -1 +1,24 @@
 # Characters data
+"""
+Персонажи игры (characters/characters.json).
+"""
+
+import os
+
+from utils.content import get_repository
+
+CHARACTERS_FILE = os.path.join("characters", "characters.json")
+
+
+def _index_characters(data):
+    return {c["id"]: c for c in data.get("characters", [])}
+
+
+def get_characters():
+    """Все персонажи: {id: dict с описанием}"""
+    return get_repository().get(CHARACTERS_FILE, build=_index_characters) or {}
+
+
+def get_character(character_id):
+    """Персонаж по id или None"""
+    return get_characters().get(character_id)
@@ -0,0 +1,193 @@
+"""
+Шина игровых событий: кто-то изменил состояние — подписчики узнают.
+
+События — небольшие классы с полями (Travelled, OrderCompleted, ...),
+публикуются в местах изменения состояния:
+    Travelled        — перелёт на соседнюю планету (core/game.py, эффект set_planet)
+    OrderCompleted   — заказ выполнен (orders/order.py)
+    OrderFailed      — заказ провален
+    ReputationChanged — изменилась репутация (GameState.change_reputation)
+    PlayerDied       — игрок погиб (GameState.die)
+
+Подписчики:
+- subscribe — вызывается сразу, в момент публикации;
+- subscribe_batched — получает список накопленных событий при flush()
+  (игровой цикл вызывает его раз за ход); coalesce(событие) -> ключ
+  схлопывает события с одинаковым ключом в последнее.
+
+Пока на тип события никто не подписан, emit не создаёт объект события —
+публикация стоит одного поиска в словаре.
+
+    bus = get_bus()
+    bus.subscribe(PlayerDied, lambda event: print(event.reason))
+    bus.subscribe_batched((OrderCompleted, OrderFailed), save_stats)
+"""
+
+from collections import deque
+
+
+class GameEvent:
+    """Базовый класс событий"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Travelled(GameEvent):
+    __slots__ = ("origin", "destination", "day")
+
+    def __init__(self, origin, destination, day):
+        self.origin = origin            # Имя планеты отправления
+        self.destination = destination  # Имя планеты прибытия
+        self.day = day
+
+
+class OrderCompleted(GameEvent):
+    __slots__ = ("order", "reward", "day")
+
+    def __init__(self, order, reward, day):
+        self.order = order
+        self.reward = reward
+        self.day = day
+
+
+class OrderFailed(GameEvent):
+    __slots__ = ("order", "day")
+
+    def __init__(self, order, day):
+        self.order = order
+        self.day = day
+
+
+class ReputationChanged(GameEvent):
+    __slots__ = ("faction", "amount", "value")
+
+    def __init__(self, faction, amount, value):
+        self.faction = faction
+        self.amount = amount  # Изменение
+        self.value = value    # Новая репутация
+
+
+class PlayerDied(GameEvent):
+    __slots__ = ("reason", "planet", "day")
+
+    def __init__(self, reason, planet, day):
+        self.reason = reason
+        self.planet = planet
+        self.day = day
+
+
+class _Batch:
+    """Подписчик с отложенной доставкой"""
+
+    __slots__ = ("handler", "coalesce", "events")
+
+    def __init__(self, handler, coalesce):
+        self.handler = handler
+        self.coalesce = coalesce
+        self.events = []
+
+
+class EventBus:
+    """Шина событий: подписка по типу события, сразу или пачками"""
+
+    def __init__(self):
+        # Тип события -> подписчики
+        self._inline = {}
+        self._batched = {}
+        # Подписчики-пачки, у которых есть недоставленные события
+        self._pending = deque()
+
+    def _types(self, event_types):
+        return event_types if isinstance(event_types, tuple) else (event_types,)
+
+    def subscribe(self, event_types, handler):
+        """Вызывать handler(событие) при каждой публикации (тип или кортеж типов)"""
+        for event_type in self._types(event_types):
+            self._inline.setdefault(event_type, []).append(handler)
+        return handler
+
+    def subscribe_batched(self, event_types, handler, coalesce=None):
+        """
+        Получать накопленные события пачкой при flush().
+
+        Args:
+            event_types: тип события или кортеж типов
+            handler: функция handler(list[событие])
+            coalesce: функция событие -> ключ; из событий с одним ключом
+                      доставляется последнее (None — доставлять все)
+        """
+        batch = _Batch(handler, coalesce)
+        for event_type in self._types(event_types):
+            self._batched.setdefault(event_type, []).append(batch)
+        return handler
+
+    def unsubscribe(self, event_types, handler):
+        """Отписать handler (обычного или пачечного подписчика)"""
+        for event_type in self._types(event_types):
+            inline = self._inline.get(event_type, [])
+            if handler in inline:
+                inline.remove(handler)
+            batched = self._batched.get(event_type, [])
+            batched[:] = [batch for batch in batched if batch.handler is not handler]
+            # Пустые списки убираются, чтобы emit без подписчиков ничего не делал
+            if not inline:
+                self._inline.pop(event_type, None)
+            if not batched:
+                self._batched.pop(event_type, None)
+
+    def wants(self, event_type):
+        """Есть ли подписчики на тип события"""
+        return event_type in self._inline or event_type in self._batched
+
+    def emit(self, event_type, *args):
+        """Опубликовать событие event_type(*args); без подписчиков объект не создаётся"""
+        inline = self._inline.get(event_type)
+        batched = self._batched.get(event_type)
+        if inline is None and batched is None:
+            return
+
+        event = event_type(*args)
+        if inline is not None:
+            for handler in tuple(inline):
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"[ОШИБКА] Подписчик события {event_type.__name__}: {e}")
+        if batched is not None:
+            for batch in batched:
+                if not batch.events:
+                    self._pending.append(batch)
+                batch.events.append(event)
+
+    def flush(self):
+        """Доставить накопленные события пачечным подписчикам"""
+        while self._pending:
+            batch = self._pending.popleft()
+            events, batch.events = batch.events, []
+            if batch.coalesce is not None:
+                latest = {}
+                for event in events:
+                    key = batch.coalesce(event)
+                    latest.pop(key, None)  # Порядок — по последнему событию с ключом
+                    latest[key] = event
+                events = list(latest.values())
+            try:
+                batch.handler(events)
+            except Exception as e:
+                print(f"[ОШИБКА] Подписчик событий: {e}")
+
+
+# Шина текущей сессии
+_bus = None
+
+
+def get_bus():
+    """Шина событий текущей сессии"""
+    global _bus
+    if _bus is None:
+        _bus = EventBus()
+    return _bus
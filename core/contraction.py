@@ -0,0 +1,454 @@
+"""
+Иерархии сжатия (contraction hierarchies) для очень больших галактик.
+
+Предобработка один раз упорядочивает системы по «важности» и сжимает их,
+добавляя рёбра-сокращения. Запрос — двунаправленный поиск только вверх
+по иерархии, который затрагивает лишь небольшую часть карты.
+
+Индекс сохраняется на диск рядом с данными игры (data/cache) и
+привязывается к отпечатку графа, поэтому строится один раз на карту.
+
+Проверка совпадения с Дейкстрой:
+    python -m core.contraction --size 10000 --verify 500
+"""
+
+import heapq
+import json
+import os
+import random
+import time
+
+from core.routing import INF, dijkstra, extract_path
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cache")
+
+# Ограничения поиска свидетелей при сжатии: меньше — быстрее
+# предобработка, но больше лишних сокращений (на корректность не влияет)
+WITNESS_SETTLE_LIMIT = 60
+
+INDEX_FORMAT_VERSION = 1
+
+
+class ContractionHierarchy:
+    """
+    Индекс иерархии сжатия.
+
+    up_out[v] — рёбра v -> x к системам с более высоким рангом
+    up_in[v]  — рёбра u -> v от систем с более высоким рангом
+    middle[(u, x)] — средняя вершина сокращения u -> x (-1 для исходного ребра)
+    """
+
+    def __init__(self, names, rank, up_out, up_in, middle, fingerprint=None):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.rank = rank
+        self.up_out = up_out
+        self.up_in = up_in
+        self.middle = middle
+        self.fingerprint = fingerprint
+        self.build_seconds = None  # None — индекс загружен с диска
+
+        # Статистика последнего запроса
+        self.last_settled = 0
+
+    @property
+    def shortcut_count(self):
+        return sum(1 for mid in self.middle.values() if mid != -1)
+
+    def query(self, source, target):
+        """
+        Кратчайший путь source -> target (индексы вершин).
+
+        Returns:
+            (path, distance) или (None, inf)
+        """
+        if source == target:
+            self.last_settled = 0
+            return [source], 0
+
+        up_out = self.up_out
+        up_in = self.up_in
+
+        dist_f = {source: 0}
+        dist_b = {target: 0}
+        pred_f = {source: -1}
+        pred_b = {target: -1}
+        heap_f = [(0, source)]
+        heap_b = [(0, target)]
+        done_f = set()
+        done_b = set()
+
+        best = INF
+        meet = -1
+        settled = 0
+
+        while heap_f or heap_b:
+            # Направление останавливается, когда его минимум не лучше найденного
+            if heap_f and heap_f[0][0] >= best:
+                heap_f = []
+            if heap_b and heap_b[0][0] >= best:
+                heap_b = []
+            if not heap_f and not heap_b:
+                break
+
+            forward = bool(heap_f) and (not heap_b or heap_f[0][0] <= heap_b[0][0])
+            if forward:
+                heap, dist, pred, done, edges = heap_f, dist_f, pred_f, done_f, up_out
+                other = dist_b
+            else:
+                heap, dist, pred, done, edges = heap_b, dist_b, pred_b, done_b, up_in
+                other = dist_f
+
+            d, u = heapq.heappop(heap)
+            if u in done:
+                continue
+            done.add(u)
+            settled += 1
+
+            if u in other and d + other[u] < best:
+                best = d + other[u]
+                meet = u
+
+            for v, w in edges[u]:
+                nd = d + w
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    pred[v] = u
+                    heapq.heappush(heap, (nd, v))
+
+        self.last_settled = settled
+        if meet == -1:
+            return None, INF
+
+        # Цепочка вверх от source до точки встречи и вниз до target
+        up_chain = []
+        node = meet
+        while node != -1:
+            up_chain.append(node)
+            node = pred_f[node]
+        up_chain.reverse()
+
+        node = pred_b[meet]
+        down_chain = []
+        while node != -1:
+            down_chain.append(node)
+            node = pred_b[node]
+
+        packed = up_chain + down_chain
+        path = [packed[0]]
+        for i in range(len(packed) - 1):
+            self._unpack(packed[i], packed[i + 1], path)
+        return path, best
+
+    def _unpack(self, u, x, path):
+        """Развернуть ребро u -> x (возможно, сокращение) и дописать вершины в path"""
+        stack = [(u, x)]
+        while stack:
+            a, b = stack.pop()
+            mid = self.middle[(a, b)]
+            if mid == -1:
+                path.append(b)
+            else:
+                # Сначала a -> mid, затем mid -> b
+                stack.append((mid, b))
+                stack.append((a, mid))
+
+    def get_path(self, start, end):
+        """То же, что map.get_path: (список планет, дистанция)"""
+        source = self.index.get(start)
+        target = self.index.get(end)
+        if source is None or target is None:
+            return None, INF
+
+        path, dist = self.query(source, target)
+        if path is None:
+            return None, INF
+        return [self.names[v] for v in path], dist
+
+    def to_dict(self):
+        """Для сохранения на диск"""
+        return {
+            "format": INDEX_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "names": self.names,
+            "rank": self.rank,
+            "up_out": [[x for edge in edges for x in edge] for edges in self.up_out],
+            "up_in": [[x for edge in edges for x in edge] for edges in self.up_in],
+            "middle": [[u, x, mid] for (u, x), mid in self.middle.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Для загрузки с диска"""
+        def pairs(flat):
+            return [(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)]
+
+        return cls(
+            names=data["names"],
+            rank=data["rank"],
+            up_out=[pairs(edges) for edges in data["up_out"]],
+            up_in=[pairs(edges) for edges in data["up_in"]],
+            middle={(u, x): mid for u, x, mid in data["middle"]},
+            fingerprint=data.get("fingerprint"),
+        )
+
+
+def build_hierarchy(graph, fingerprint=None):
+    """
+    Построить иерархию сжатия для CompiledGraph.
+
+    Порядок сжатия — по разности рёбер (сколько сокращений добавится минус
+    сколько рёбер исчезнет) плюс число уже сжатых соседей, с ленивым
+    пересчётом приоритетов.
+    """
+    start_time = time.perf_counter()
+    n = len(graph)
+
+    # Текущий (ещё не сжатый) граф: out_edges[u] = {v: (w, mid)}
+    out_edges = [dict() for _ in range(n)]
+    in_edges = [dict() for _ in range(n)]
+    for u in range(n):
+        for v, w in graph.neighbors(u):
+            if u == v:
+                continue
+            if w < out_edges[u].get(v, (INF,))[0]:
+                out_edges[u][v] = (w, -1)
+                in_edges[v][u] = (w, -1)
+
+    contracted = bytearray(n)
+    deleted_neighbors = [0] * n
+    rank = [0] * n
+    up_out = [None] * n
+    up_in = [None] * n
+    middle = {}
+
+    def shortcuts_for(v):
+        """Сокращения, необходимые при сжатии v: список (u, x, w)"""
+        result = []
+        outs = out_edges[v]
+        if not outs:
+            return result
+        max_out = max(w for w, _ in outs.values())
+
+        for u, (w_in, _) in in_edges[v].items():
+            limit = w_in + max_out
+            witness = _witness_search(out_edges, u, v, limit)
+            for x, (w_out, _) in outs.items():
+                if x == u:
+                    continue
+                via = w_in + w_out
+                if witness.get(x, INF) <= via:
+                    continue
+                result.append((u, x, via))
+        return result
+
+    def priority(v):
+        edge_difference = len(shortcuts_for(v)) - len(in_edges[v]) - len(out_edges[v])
+        return edge_difference + deleted_neighbors[v]
+
+    heap = [(priority(v), v) for v in range(n)]
+    heapq.heapify(heap)
+    order = 0
+
+    while heap:
+        _, v = heapq.heappop(heap)
+        if contracted[v]:
+            continue
+
+        # Ленивое обновление: если приоритет вырос, вернуть в очередь
+        current = priority(v)
+        if heap and current > heap[0][0]:
+            heapq.heappush(heap, (current, v))
+            continue
+
+        for u, x, w in shortcuts_for(v):
+            existing = out_edges[u].get(x)
+            if existing is None or w < existing[0]:
+                out_edges[u][x] = (w, v)
+                in_edges[x][u] = (w, v)
+
+        # Оставшиеся рёбра ведут к системам с более высоким рангом
+        up_out[v] = [(x, w) for x, (w, _) in out_edges[v].items()]
+        up_in[v] = [(u, w) for u, (w, _) in in_edges[v].items()]
+        for x, (_, mid) in out_edges[v].items():
+            middle[(v, x)] = mid
+        for u, (_, mid) in in_edges[v].items():
+            middle[(u, v)] = mid
+
+        for x in out_edges[v]:
+            del in_edges[x][v]
+            deleted_neighbors[x] += 1
+        for u in in_edges[v]:
+            del out_edges[u][v]
+            deleted_neighbors[u] += 1
+        out_edges[v] = {}
+        in_edges[v] = {}
+
+        contracted[v] = 1
+        rank[v] = order
+        order += 1
+
+    hierarchy = ContractionHierarchy(list(graph.names), rank, up_out, up_in, middle, fingerprint)
+    hierarchy.build_seconds = time.perf_counter() - start_time
+    return hierarchy
+
+
+def _witness_search(out_edges, source, skip, limit):
+    """Ограниченный Дейкстра от source в несжатом графе в обход вершины skip"""
+    dist = {source: 0}
+    heap = [(0, source)]
+    settled = 0
+
+    while heap and settled < WITNESS_SETTLE_LIMIT:
+        d, u = heapq.heappop(heap)
+        if d > dist.get(u, INF):
+            continue
+        if d > limit:
+            break
+        settled += 1
+        for v, (w, _) in out_edges[u].items():
+            if v == skip:
+                continue
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def index_path(fingerprint):
+    """Путь к файлу индекса для карты с данным отпечатком"""
+    return os.path.join(CACHE_DIR, f"ch_{fingerprint}.json")
+
+
+def save_hierarchy(hierarchy, path=None):
+    """Сохранить индекс на диск"""
+    path = path or index_path(hierarchy.fingerprint)
+    dir_path = os.path.dirname(path)
+    if dir_path and not os.path.exists(dir_path):
+        os.makedirs(dir_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(hierarchy.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+    return path
+
+
+def load_hierarchy(fingerprint, path=None):
+    """Загрузить индекс с диска или None, если его нет или он устарел"""
+    path = path or index_path(fingerprint)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if data.get("format") != INDEX_FORMAT_VERSION or data.get("fingerprint") != fingerprint:
+        return None
+    return ContractionHierarchy.from_dict(data)
+
+
+def load_or_build_hierarchy(graph, fingerprint):
+    """Загрузить индекс для карты или построить и сохранить новый"""
+    hierarchy = load_hierarchy(fingerprint)
+    if hierarchy is None:
+        hierarchy = build_hierarchy(graph, fingerprint)
+        save_hierarchy(hierarchy)
+    return hierarchy
+
+
+def verify_hierarchy(hierarchy, graph, pairs=200, seed=None):
+    """
+    Сравнить запросы к иерархии с Дейкстрой на случайных парах.
+
+    Дистанции обязаны совпадать. Пути при равных по длине альтернативах
+    могут отличаться, поэтому путь иерархии проверяется на корректность
+    (существующие рёбра, сумма равна дистанции).
+
+    Returns:
+        dict: отчёт о проверке
+    """
+    rng = random.Random(seed)
+    n = len(graph)
+    report = {
+        "pairs": pairs,
+        "distance_mismatches": 0,
+        "invalid_paths": 0,
+        "different_paths": 0,
+        "avg_settled": 0.0,
+        "failures": [],
+    }
+    settled_total = 0
+
+    for _ in range(pairs):
+        source = rng.randrange(n)
+        target = rng.randrange(n)
+
+        dist, pred = dijkstra(graph, source, target)
+        expected_path = extract_path(pred, source, target)
+        expected_dist = dist[target]
+
+        path, ch_dist = hierarchy.query(source, target)
+        settled_total += hierarchy.last_settled
+
+        if ch_dist != expected_dist:
+            report["distance_mismatches"] += 1
+            report["failures"].append([graph.names[source], graph.names[target]])
+            continue
+
+        if path is None:
+            continue
+
+        length = 0
+        valid = path[0] == source and path[-1] == target
+        for i in range(len(path) - 1):
+            w = graph.edge_weight(path[i], path[i + 1])
+            if w is None:
+                valid = False
+                break
+            length += w
+        if not valid or length != expected_dist:
+            report["invalid_paths"] += 1
+            report["failures"].append([graph.names[source], graph.names[target]])
+        elif path != expected_path:
+            report["different_paths"] += 1
+
+    report["avg_settled"] = settled_total / max(1, pairs)
+    report["ok"] = report["distance_mismatches"] == 0 and report["invalid_paths"] == 0
+    return report
+
+
+def main(argv=None):
+    import argparse
+    from core import map as galaxy_map
+    from core.galaxy_gen import generate_galaxy
+
+    parser = argparse.ArgumentParser(description="Иерархия сжатия: построение и проверка")
+    parser.add_argument("--size", type=int, default=None,
+                        help="сгенерировать галактику такого размера (по умолчанию — текущая карта)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verify", type=int, default=200, metavar="PAIRS")
+    args = parser.parse_args(argv)
+
+    if args.size:
+        galaxy_map.set_galaxy_graph(generate_galaxy(args.size, seed=args.seed))
+
+    graph = galaxy_map.get_compiled_graph()
+    hierarchy = load_or_build_hierarchy(graph, galaxy_map.graph_fingerprint())
+    if hierarchy.build_seconds is None:
+        built = "загружен с диска"
+    else:
+        built = f"построение: {hierarchy.build_seconds:.2f} с"
+    print(f"Систем: {len(graph)}, сокращений: {hierarchy.shortcut_count}, {built}")
+
+    report = verify_hierarchy(hierarchy, graph, pairs=args.verify, seed=args.seed)
+    print(f"Пар: {report['pairs']}, расхождений дистанции: {report['distance_mismatches']}, "
+          f"некорректных путей: {report['invalid_paths']}, "
+          f"других равных путей: {report['different_paths']}, "
+          f"в среднем просмотрено вершин: {report['avg_settled']:.0f}")
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
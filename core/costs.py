@@ -0,0 +1,188 @@
+"""
+Модель стоимости перелётов: топливо и очки действий.
+
+Формулы расхода записаны только здесь. Для каждого уровня двигателя
+строится CostModel с вектором топлива по рёбрам графа и (для небольших
+карт) матрицей топлива по кратчайшим маршрутам между всеми парами систем.
+Модели кэшируются до смены карты.
+
+NumPy используется, если установлен: векторы и матрицы считаются целиком,
+без цикла по рёбрам. Без NumPy те же величины считаются в чистом Python.
+"""
+
+from array import array
+
+from core import map as galaxy_map
+from core.routing import INF
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен
+    np = None
+
+
+# Очки действий на один вылет при двигателе 1-го уровня
+BASE_FLIGHT_AP = 25
+
+# Модели стоимости текущей версии карты: {уровень двигателя: CostModel}
+_models = {}
+_models_version = None
+
+
+def fuel_per_distance(engine_level):
+    """Расход топлива на единицу дистанции"""
+    return 0.5 * (1 + (engine_level * 0.2))
+
+
+def segment_fuel_cost(distance, engine_level):
+    """Топливо на один перелёт между соседними системами"""
+    return int(distance * fuel_per_distance(engine_level))
+
+
+def flight_ap_cost(engine_level):
+    """Очки действий за один вылет (независимо от числа прыжков)"""
+    return int(BASE_FLIGHT_AP / engine_level)
+
+
+class CostModel:
+    """Стоимости перелётов для одного уровня двигателя на текущей карте"""
+
+    def __init__(self, graph, engine_level):
+        self.graph = graph
+        self.engine_level = engine_level
+        self.flight_ap = flight_ap_cost(engine_level)
+
+        # Топливо по каждому ребру CSR-графа (округление как в segment_fuel_cost)
+        if np is not None:
+            weights = np.frombuffer(graph.weights, dtype=graph.weights.typecode)
+            self.edge_fuel = (weights * fuel_per_distance(engine_level)).astype(np.int64)
+        else:
+            self.edge_fuel = array('q', (
+                segment_fuel_cost(w, engine_level) for w in graph.weights
+            ))
+
+        self._route_fuel = None
+
+    def segment_fuel(self, u, v):
+        """Топливо на перелёт u -> v (id планет) или inf, если ребра нет"""
+        k = self.graph.edge_index(u, v)
+        return INF if k == -1 else int(self.edge_fuel[k])
+
+    def path_fuel(self, path):
+        """Топливо на маршрут по id планет — сумма по перелётам"""
+        return sum(self.segment_fuel(u, v) for u, v in zip(path, path[1:]))
+
+    def route_fuel(self, path):
+        """Топливо на маршрут по именам планет (для меню)"""
+        index = self.graph.index
+        return self.path_fuel([index[planet] for planet in path])
+
+    def distance_budget(self, fuel):
+        """Какую дистанцию можно пролететь на fuel топлива"""
+        return fuel / fuel_per_distance(self.engine_level)
+
+    def fuel_between(self, source, target):
+        """
+        Топливо по кратчайшему маршруту source -> target (id планет).
+        На небольших картах — из матрицы всех пар, иначе по найденному пути.
+        """
+        matrix = self.route_fuel_matrix()
+        if matrix is not None:
+            value = matrix[source][target]
+            return INF if value < 0 else int(value)
+
+        graph = self.graph
+        path, _ = galaxy_map.get_path(graph.names[source], graph.names[target])
+        return INF if path is None else self.route_fuel(path)
+
+    def route_fuel_matrix(self):
+        """
+        Матрица топлива по кратчайшим маршрутам между всеми парами
+        (-1 — пути нет). Строится лениво по таблице маршрутов,
+        только для карт не больше ROUTE_TABLE_MAX_SYSTEMS.
+        """
+        if self._route_fuel is None and len(self.graph) <= galaxy_map.ROUTE_TABLE_MAX_SYSTEMS:
+            table = galaxy_map.get_route_table()
+            if np is not None:
+                self._route_fuel = self._route_fuel_numpy(table)
+            else:
+                self._route_fuel = self._route_fuel_python(table)
+        return self._route_fuel
+
+    def _dense_edge_fuel(self):
+        """Топливо по рёбрам в виде плотной матрицы n x n (NumPy)"""
+        graph = self.graph
+        n = len(graph)
+        dense = np.zeros((n, n), dtype=np.int64)
+        offsets = np.frombuffer(graph.offsets, dtype=graph.offsets.typecode)
+        sources = np.repeat(np.arange(n), np.diff(offsets))
+        targets = np.frombuffer(graph.targets, dtype=graph.targets.typecode)
+        dense[sources, targets] = self.edge_fuel
+        return dense
+
+    def _route_fuel_numpy(self, table):
+        """
+        R[s, t] = топливо(s -> h) + R[h, t], где h — следующий прыжок.
+        Итерации по всей матрице сразу, пока значения не перестанут меняться
+        (не больше числа прыжков самого длинного маршрута).
+        """
+        n = table.size
+        next_hop = np.frombuffer(table.next_hop, dtype=table.next_hop.typecode).reshape(n, n)
+        edge = self._dense_edge_fuel()
+
+        reachable = next_hop != -1
+        hop = np.where(reachable, next_hop, 0)
+        rows = np.arange(n)[:, None]
+        cols = np.arange(n)[None, :]
+
+        route = np.zeros((n, n), dtype=np.int64)
+        while True:
+            updated = np.where(reachable, edge[rows, hop] + route[hop, cols], 0)
+            if np.array_equal(updated, route):
+                break
+            route = updated
+
+        route[~reachable] = -1
+        np.fill_diagonal(route, 0)
+        return route
+
+    def _route_fuel_python(self, table):
+        """То же без NumPy: для каждой цели — источники по возрастанию дистанции"""
+        n = table.size
+        dist = table.dist
+        next_hop = table.next_hop
+        edge_fuel = self.edge_fuel
+        graph = self.graph
+
+        route = [[-1] * n for _ in range(n)]
+        for target in range(n):
+            route[target][target] = 0
+            sources = sorted(
+                (s for s in range(n) if s != target and next_hop[s * n + target] != -1),
+                key=lambda s: dist[s * n + target]
+            )
+            for source in sources:
+                hop = next_hop[source * n + target]
+                k = graph.edge_index(source, hop)
+                route[source][target] = edge_fuel[k] + route[hop][target]
+        return route
+
+
+def get_cost_model(engine_level):
+    """Модель стоимости для уровня двигателя (кэш до смены карты)"""
+    global _models_version
+    version = galaxy_map.graph_version()
+    if _models_version != version:
+        _models.clear()
+        _models_version = version
+
+    model = _models.get(engine_level)
+    if model is None:
+        model = CostModel(galaxy_map.get_compiled_graph(), engine_level)
+        _models[engine_level] = model
+    return model
+
+
+def route_fuel_cost(path, engine_level):
+    """Топливо на маршрут (имена планет) — сумма по перелётам, как в реальном полёте"""
+    return get_cost_model(engine_level).route_fuel(path)
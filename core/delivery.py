@@ -0,0 +1,318 @@
+"""
+Оптимизатор порядка доставки нескольких заказов (pickup-and-delivery).
+
+Остановки — погрузка в пункте отправления (если груз ещё не на борту)
+и выгрузка в пункте назначения. Порядок остановок выбирается так, чтобы:
+- погрузка шла раньше выгрузки того же заказа
+- груз на борту не превышал вместимость грузового отсека
+- заказы с дедлайном доставлялись вовремя
+- суммарный расход топлива был минимальным
+
+Для небольших партий (до EXACT_MAX_ORDERS заказов) — точное ДП по маскам
+(погружено, доставлено); для больших — жадная вставка.
+Расстояния между остановками — кратчайшие пути из core/map.py.
+"""
+
+import math
+
+from core import map as galaxy_map
+from core.costs import get_cost_model
+from core.routing import INF
+from utils.i18n import tr
+
+
+# Максимальный размер партии для точного перебора (состояний ~ 3^n)
+EXACT_MAX_ORDERS = 6
+
+
+class Stop:
+    """Остановка плана: погрузка или выгрузка заказа на планете"""
+
+    def __init__(self, order, is_pickup):
+        self.order = order
+        self.is_pickup = is_pickup
+
+    @property
+    def planet_id(self):
+        return self.order.origin_id if self.is_pickup else self.order.destination_id
+
+    @property
+    def planet(self):
+        """Имя планеты остановки (для вывода)"""
+        return galaxy_map.planet_name(self.planet_id)
+
+    def describe(self):
+        if self.is_pickup:
+            return tr("game.plan.pickup", "Погрузка: {cargo} ({planet})", cargo=self.order.cargo_name, planet=self.planet)
+        return tr("game.plan.dropoff", "Выгрузка: {cargo} ({planet})", cargo=self.order.cargo_name, planet=self.planet)
+
+
+class DeliveryPlan:
+    """Порядок остановок и оценка его стоимости"""
+
+    def __init__(self, stops, fuel, late_orders, skipped_orders, exact):
+        self.stops = stops
+        self.fuel = fuel
+        self.late_orders = late_orders        # Доставка после дедлайна
+        self.skipped_orders = skipped_orders  # Не помещаются или недостижимы
+        self.exact = exact                    # Найден точным перебором
+
+    @property
+    def next_stop(self):
+        return self.stops[0] if self.stops else None
+
+
+class _Distances:
+    """Топливо между планетами (по id) по кратчайшим путям, с кешем"""
+
+    def __init__(self, engine_level, dead_zones):
+        self.costs = get_cost_model(engine_level)
+        self.dead_zones = dead_zones
+        self._fuel = {}
+
+    def fuel(self, start, end):
+        if start == end:
+            return 0
+        if not self.dead_zones:
+            # Без опасных зон — готовая матрица всех пар
+            return self.costs.fuel_between(start, end)
+        key = (start, end)
+        if key not in self._fuel:
+            tree = galaxy_map.get_paths_from(galaxy_map.planet_name(start), self.dead_zones)
+            path = tree.path_to(galaxy_map.planet_name(end))
+            self._fuel[key] = self.costs.route_fuel(path) if path else INF
+        return self._fuel[key]
+
+
+def _arrival_day(day, fuel_now, max_fuel, fuel_used):
+    """
+    Оценка дня прибытия: бак заправляется каждую ночь,
+    поэтому лишние max_fuel топлива — это ещё один день пути.
+    """
+    if fuel_used <= fuel_now:
+        return day
+    return day + math.ceil((fuel_used - fuel_now) / max_fuel)
+
+
+def plan_deliveries(state, orders=None):
+    """
+    Спланировать порядок погрузок и выгрузок для активных заказов.
+
+    Args:
+        state: GameState (планета, день, корабль, опасные зоны)
+        orders: заказы (по умолчанию state.orders)
+
+    Returns:
+        DeliveryPlan
+    """
+    orders = list(state.orders if orders is None else orders)
+    ship = state.ship
+    capacity = ship.cargo.capacity
+    distances = _Distances(ship.engine.level, galaxy_map.get_dead_zones(state))
+
+    context = {
+        "start": state.planet_id,
+        "day": state.day,
+        "fuel": ship.fuel,
+        "max_fuel": ship.max_fuel,
+        "capacity": capacity,
+        "load": sum(o.size for o in orders if o.picked_up),
+        "distances": distances,
+    }
+
+    # Заказы, которые нельзя выполнить при любом порядке
+    skipped = []
+    plannable = []
+    for order in orders:
+        too_big = not order.picked_up and order.size > capacity
+        pickup_fuel = 0 if order.picked_up else distances.fuel(state.planet_id, order.origin_id)
+        unreachable = pickup_fuel == INF or distances.fuel(
+            state.planet_id if order.picked_up else order.origin_id, order.destination_id
+        ) == INF
+        if too_big or unreachable:
+            skipped.append(order)
+        else:
+            plannable.append(order)
+
+    stops = None
+    exact = len(plannable) <= EXACT_MAX_ORDERS
+    if exact:
+        stops = _plan_exact(plannable, context, respect_deadlines=True)
+        if stops is None:
+            # Всё вовремя не успеть: минимум топлива, опоздания отмечаются
+            stops = _plan_exact(plannable, context, respect_deadlines=False)
+    if stops is None:
+        # Все заказы вместе не помещаются (или заказов много) —
+        # жадная вставка; невставленные заказы показываются как пропущенные
+        stops, unplaced = _plan_insertion(plannable, context)
+        skipped.extend(unplaced)
+        exact = False
+
+    fuel, late, _ = _evaluate(stops, context)
+    return DeliveryPlan(stops, fuel, late, skipped, exact)
+
+
+def _evaluate(stops, context):
+    """
+    Стоимость последовательности остановок.
+
+    Returns:
+        (fuel, late_orders, fits): топливо, опоздавшие заказы,
+        помещается ли груз на всём маршруте
+    """
+    distances = context["distances"]
+    planet = context["start"]
+    load = context["load"]
+    fuel = 0
+    late = []
+    fits = True
+
+    for stop in stops:
+        fuel += distances.fuel(planet, stop.planet_id)
+        planet = stop.planet_id
+        if stop.is_pickup:
+            load += stop.order.size
+            if load > context["capacity"]:
+                fits = False
+        else:
+            load -= stop.order.size
+            deadline = stop.order.deadline
+            arrival = _arrival_day(context["day"], context["fuel"], context["max_fuel"], fuel)
+            if deadline is not None and arrival > deadline:
+                late.append(stop.order)
+
+    return fuel, late, fits
+
+
+def _plan_exact(orders, context, respect_deadlines):
+    """
+    Точное ДП по состояниям (последняя остановка, погружено, доставлено).
+
+    Из двух путей в одно состояние достаточно хранить более дешёвый:
+    меньше топлива — не позже прибытие, значит и дедлайны не хуже.
+
+    Returns:
+        список Stop или None, если допустимого порядка нет
+    """
+    n = len(orders)
+    if n == 0:
+        return []
+
+    distances = context["distances"]
+    sizes = [order.size for order in orders]
+    full = (1 << n) - 1
+    initial_picked = sum(1 << i for i, order in enumerate(orders) if order.picked_up)
+
+    def mask_size(mask):
+        return sum(sizes[i] for i in range(n) if (mask >> i) & 1)
+
+    # Груз на борту, который в плане не участвует (например, недостижимый)
+    base_load = context["load"] - mask_size(initial_picked)
+
+    def planet_of(stop):
+        if stop is None:
+            return context["start"]
+        i, is_pickup = stop
+        return orders[i].origin_id if is_pickup else orders[i].destination_id
+
+    # Таблица ДП: состояние -> (топливо, предыдущее состояние, остановка)
+    start = (None, initial_picked, 0)
+    table = {start: (0, None, None)}
+    layer = [start]
+
+    while layer:
+        next_layer = {}
+        for key in layer:
+            last, picked, delivered = key
+            fuel_used = table[key][0]
+            here = planet_of(last)
+            load = base_load + mask_size(picked & ~delivered)
+
+            for i in range(n):
+                bit = 1 << i
+                if delivered & bit:
+                    continue
+                if picked & bit:
+                    stop = (i, False)
+                    new_state = (stop, picked, delivered | bit)
+                else:
+                    if load + sizes[i] > context["capacity"]:
+                        continue
+                    stop = (i, True)
+                    new_state = (stop, picked | bit, delivered)
+
+                cost = fuel_used + distances.fuel(here, planet_of(stop))
+                if cost == INF:
+                    continue
+
+                if respect_deadlines and not stop[1] and orders[i].deadline is not None:
+                    arrival = _arrival_day(
+                        context["day"], context["fuel"], context["max_fuel"], cost
+                    )
+                    if arrival > orders[i].deadline:
+                        continue
+
+                best = table.get(new_state)
+                if best is None or cost < best[0]:
+                    table[new_state] = (cost, key, stop)
+                    next_layer[new_state] = True
+        layer = list(next_layer)
+
+    finals = [key for key in table if key[2] == full]
+    if not finals:
+        return None
+
+    key = min(finals, key=lambda k: table[k][0])
+    stops = []
+    while table[key][1] is not None:
+        _, prev, (i, is_pickup) = table[key]
+        stops.append(Stop(orders[i], is_pickup))
+        key = prev
+    stops.reverse()
+    return stops
+
+
+def _plan_insertion(orders, context):
+    """
+    Жадная вставка: заказы по очереди (сначала срочные) встраиваются
+    в план на позиции с минимальным приростом опозданий и топлива.
+
+    Returns:
+        (список Stop, заказы, которые не удалось вставить по вместимости)
+    """
+    def urgency(order):
+        return (order.deadline is None, order.deadline or 0, -order.reward)
+
+    stops = []
+    unplaced = []
+    for order in sorted(orders, key=urgency):
+        best = None
+        delivery = Stop(order, False)
+
+        if order.picked_up:
+            candidates = (
+                stops[:j] + [delivery] + stops[j:]
+                for j in range(len(stops) + 1)
+            )
+        else:
+            pickup = Stop(order, True)
+            candidates = (
+                stops[:i] + [pickup] + stops[i:j] + [delivery] + stops[j:]
+                for i in range(len(stops) + 1)
+                for j in range(i, len(stops) + 1)
+            )
+
+        for candidate in candidates:
+            fuel, late, fits = _evaluate(candidate, context)
+            if not fits:
+                continue
+            score = (sum(o.reward for o in late), fuel)
+            if best is None or score < best[0]:
+                best = (score, candidate)
+
+        if best is not None:
+            stops = best[1]
+        else:
+            unplaced.append(order)
+
+    return stops, unplaced
@@ -3,26 +3,38 @@
 """
 
 import random
+from utils.i18n import tr
 from utils.io import print_slow
 
 
+# Вероятность встречи с полицией на каждом перелёте между системами
+POLICE_ENCOUNTER_CHANCE = 0.2
+
+# Штраф за контрабанду в долях награды (см. pay_police_fine в police_encounter.json)
+POLICE_FINE_MULTIPLIER = 1.0
+
+
 def check_police_encounter(state):
     """
     Проверка на встречу с полицией.
     Возвращает True, если можно продолжать полёт.
     Возвращает False, если полёт прерван (например, тюрьма или смерть).
     """
-    # 20% шанс встречи
-    if random.random() > 0.2:
+    if random.random() > POLICE_ENCOUNTER_CHANCE:
         return True
 
-    from dialog.loader import load_dialog
+    from dialog.loader import get_dialog
     from dialog.engine import run_dialog
 
+    # Патруль разбирается с самым ценным нелегальным грузом на борту
+    contraband = onboard_contraband(state)
+    if contraband:
+        state.focus_order(contraband)
+
     print_slow("\n" + "=" * 40)
-    print_slow("🚔 ВНИМАНИЕ! Вас останавливает Галактическая Полиция.")
+    print_slow(tr("game.police.stopped", "🚔 ВНИМАНИЕ! Вас останавливает Галактическая Полиция."))
     
-    dialog = load_dialog("police_encounter")
+    dialog = get_dialog("police_encounter")
     if dialog:
         run_dialog(dialog, state)
     
@@ -32,3 +44,19 @@ def check_police_encounter(state):
     # Если state.alive == False, значит он либо умер, либо в тюрьме (state.die устанавливает alive=False)
     return state.alive
 
+
+def expected_police_loss(order):
+    """
+    Ожидаемые потери (в кредитах) при одной встрече с полицией.
+    Чистый груз не интересует патруль; за контрабанду платим штраф
+    и теряем заказ вместе с наградой.
+    """
+    if order is None or not order.is_contraband:
+        return 0
+    return order.reward * POLICE_FINE_MULTIPLIER + order.reward
+
+
+def onboard_contraband(state):
+    """Самый ценный нелегальный груз на борту или None"""
+    orders = [o for o in state.orders if o.is_contraband and o.picked_up]
+    return max(orders, key=lambda o: o.reward, default=None)
@@ -1,178 +1,504 @@
 """
 Обработка эффектов из диалогов, новостей, заказов.
+
+Эффекты обрабатываются по таблице: тип эффекта -> функция handler(effect, state).
+Список эффектов из JSON компилируется один раз (compile_effects) в кортеж
+готовых вызовов; неизвестный тип или отсутствующее обязательное поле —
+EffectError при загрузке контента, а не молчаливый пропуск в игре.
+
+Условия (в том числе составные all/any/not) так же компилируются
+в замыкания — compile_conditions; типы условий — register_condition.
+Скомпилированное условие помнит ключи состояния, которые читает
+(атрибут reads, см. core/reactive.py).
+
+Моды добавляют свои эффекты через register_effect, не меняя этот файл:
+
+    @register_effect("heal", required=("amount",))
+    def heal(effect, state):
+        ...
 """
 
+import json
+from functools import partial
 
+from core import map as galaxy_map
+from core.bus import Travelled, get_bus
+from core.flags import EVENT_UNLOCKED, register_flag
+from core.reactive import ANY_STATE, DAY, MONEY, flag_key, reputation_key
+from orders.order import Order, cargo_name
+from utils.i18n import tr
 from utils.io import print_slow
 import random
 
+
+class EffectError(ValueError):
+    """Неизвестный тип эффекта или нет обязательного поля"""
+
+
+# Обработчики эффектов: {тип: (handler(effect, state), обязательные поля)}
+EFFECT_HANDLERS = {}
+
+
+def register_effect(effect_type, handler=None, required=()):
+    """
+    Зарегистрировать обработчик эффекта (можно как декоратор).
+
+    Args:
+        effect_type: значение поля "type" в JSON
+        handler: функция handler(effect, state)
+        required: поля эффекта, без которых он не загрузится
+    """
+    def decorator(func):
+        EFFECT_HANDLERS[effect_type] = (func, tuple(required))
+        return func
+
+    if handler is not None:
+        return decorator(handler)
+    return decorator
+
+
+def compile_effect(effect):
+    """
+    Эффект из JSON -> функция state -> None.
+
+    Raises:
+        EffectError: неизвестный тип или нет обязательного поля
+    """
+    effect_type = effect.get("type")
+    entry = EFFECT_HANDLERS.get(effect_type)
+    if entry is None:
+        raise EffectError(f"Неизвестный тип эффекта: {effect_type}")
+    handler, required = entry
+    missing = [name for name in required if name not in effect]
+    if missing:
+        raise EffectError(f"Эффект {effect_type}: нет полей {', '.join(missing)}")
+    return partial(handler, effect)
+
+
+def compile_effects(effects):
+    """Список эффектов из JSON -> кортеж готовых вызовов"""
+    return tuple(compile_effect(effect) for effect in effects or ())
+
+
+def run_effects(compiled, state):
+    """Применить скомпилированные эффекты"""
+    for effect in compiled:
+        effect(state)
+
+
 def apply_effects(effects, state):
     """
-    Применить список эффектов к состоянию игры.
-    
-    Типы эффектов:
-    - flag: установить сюжетный флаг
-    - money: добавить/отнять деньги
-    - reputation: изменить репутацию
-    - end_game: завершить игру (смерть)
-    - set_planet: переместить игрока
-    - death_if_arrive: пометить планету как смертельную
+    Применить список эффектов из JSON (компилируется на месте).
+    Для контента, загружаемого один раз, — compile_effects + run_effects.
     """
-    for effect in effects:
-        effect_type = effect.get("type")
-
-        if effect_type == "flag":
-            value = effect.get("value", True)
-            state.flags.set(effect["name"], value)
-
-        elif effect_type == "money":
-            state.add_money(effect["amount"])
-
-        elif effect_type == "reputation":
-            faction = effect["faction"]
-            amount = effect["amount"]
-            state.change_reputation(faction, amount)
-
-        elif effect_type == "end_game":
-            reason = effect.get("reason", "Игра окончена")
-            state.die(reason)
-
-        elif effect_type == "set_planet":
-            state.current_planet = effect["planet"]
-
-        elif effect_type == "death_if_arrive":
-            planet = effect["planet"]
-            state.flags.set(f"dead_zone_{planet}")
-
-        elif effect_type == "add_cargo":
-            item = effect["item"]
-            state.cargo.append(item)
-
-        elif effect_type == "remove_cargo":
-            item = effect["item"]
-            if item in state.cargo:
-                state.cargo.remove(item)
-
-        elif effect_type == "give_order":
-            from orders.order import Order
-            state.current_order = Order(
-                cargo=effect["cargo"],
-                origin=state.current_planet,
-                destination=effect["destination"],
-                reward=effect["reward"],
-                deadline=effect.get("deadline"),
-                faction=effect.get("faction")
-            )
-            print(f"\n[ЗАДАНИЕ ОБНОВЛЕНО] Доставить {effect['cargo']} на {effect['destination']}")
-
-        elif effect_type == "unlock_event":
-            event_id = effect["id"]
-            state.flags.set(f"event_unlocked_{event_id}")
-
-        elif effect_type == "confirm_pending_order":
-            if state.pending_order:
-                state.current_order = state.pending_order
-                state.pending_order = None
-                print(f"\n[ЗАДАНИЕ ПРИНЯТО] Доставить {state.current_order.cargo} на {state.current_order.destination}")
-
-        elif effect_type == "reject_pending_order":
-            state.pending_order = None
-            print("\n[ЗАДАНИЕ ОТКЛОНЕНО]")
-
-        elif effect_type == "complete_order":
-            if state.current_order:
-                print_slow("\n📦 Вы доставили заказ!")
-                reward = state.current_order.reward
-                state.current_order.complete(state)
-                state.current_order.complete(state)
-                print_slow(f"Получено: {reward} кредитов")
-
-        elif effect_type == "police_bribe_attempt":
-            # Логика попытки взятки
-            reward = state.current_order.reward
-            bribe_amount = int(reward * (2/3))
-            
-            if state.money < bribe_amount:
-                # Недостаточно денег - сразу провал
-                state.flags.set("police_bribe_success", False)
-                state.flags.set("police_bribe_no_money", True)
-                print_slow("У вас недостаточно денег для взятки.")
-            else:
-                 # Деньги есть, пробуем
-                 if random.random() < 0.5:
-                     # Успех
-                     state.spend_money(bribe_amount)
-                     state.flags.set("police_bribe_success", True)
-                     state.flags.set("police_bribe_no_money", False)
-                     # Мы не сбрасываем encounter_failed здесь, это решается в диалоге
-                 else:
-                     # Провал
-                     state.flags.set("police_bribe_success", False)
-                     state.flags.set("police_bribe_no_money", False)
-                     # Штраф будет выписан в диалоге, или тут?
-                     # Давайте просто поставим флаг провала, а диалог покажет результат.
-
-        elif effect_type == "pay_police_fine":
-             # Оплата штрафа
-             amount = effect["amount_multiplier"] * state.current_order.reward
-             if state.spend_money(int(amount)):
-                 state.flags.set("police_fine_paid", True)
-                 state.current_order.fail(state) # Конфискация и провал
-             else:
-                 state.flags.set("police_fine_paid", False)
-                 state.die("Пожизненное заключение за неуплату штрафа")
+    try:
+        compiled = compile_effects(effects)
+    except EffectError as e:
+        print(f"[ОШИБКА] {e}")
+        return
+    run_effects(compiled, state)
+
+
+@register_effect("flag", required=("name",))
+def _effect_flag(effect, state):
+    """Установить сюжетный флаг"""
+    value = effect.get("value", True)
+    name = effect["name"]
+    zone = _dead_zone_id(name)
+    if zone is not None:
+        # Флаг опасной зоны меняет и маршрутизацию
+        state.set_dead_zone(zone, bool(value))
+    else:
+        state.flags.set(name, value)
+
+
+@register_effect("money", required=("amount",))
+def _effect_money(effect, state):
+    """Добавить/отнять деньги"""
+    state.add_money(effect["amount"])
+
+
+@register_effect("reputation", required=("faction", "amount"))
+def _effect_reputation(effect, state):
+    """Изменить репутацию"""
+    state.change_reputation(effect["faction"], effect["amount"])
+
+
+@register_effect("end_game")
+def _effect_end_game(effect, state):
+    """Завершить игру (смерть)"""
+    state.die(effect.get("reason", "Игра окончена"))
+
+
+@register_effect("set_planet", required=("planet",))
+def _effect_set_planet(effect, state):
+    """Переместить игрока"""
+    planet = galaxy_map.planet_id(effect["planet"])
+    if planet is None:
+        print(f"[ОШИБКА] Неизвестная планета: {effect['planet']}")
+    else:
+        origin = state.current_planet
+        state.planet_id = planet
+        get_bus().emit(Travelled, origin, state.current_planet, state.day)
+
+
+@register_effect("death_if_arrive", required=("planet",))
+def _effect_death_if_arrive(effect, state):
+    """Пометить планету как смертельную"""
+    planet = galaxy_map.planet_id(effect["planet"])
+    if planet is None:
+        print(f"[ОШИБКА] Неизвестная планета: {effect['planet']}")
+    else:
+        state.set_dead_zone(planet)
+
+
+@register_effect("add_cargo", required=("item",))
+def _effect_add_cargo(effect, state):
+    state.cargo.append(effect["item"])
+
+
+@register_effect("remove_cargo", required=("item",))
+def _effect_remove_cargo(effect, state):
+    item = effect["item"]
+    if item in state.cargo:
+        state.cargo.remove(item)
+
+
+@register_effect("give_order", required=("cargo", "destination", "reward"))
+def _effect_give_order(effect, state):
+    if effect["destination"] not in galaxy_map.get_planet_registry():
+        print(f"[ОШИБКА] Неизвестная планета: {effect['destination']}")
+        return
+    state.add_order(Order(
+        cargo=effect["cargo"],
+        origin=state.current_planet,
+        destination=effect["destination"],
+        reward=effect["reward"],
+        deadline=effect.get("deadline"),
+        faction=effect.get("faction"),
+        size=effect.get("size", 1)
+    ))
+    print("\n" + tr(
+        "game.order.updated", "[ЗАДАНИЕ ОБНОВЛЕНО] Доставить {cargo} на {destination}",
+        cargo=cargo_name(effect["cargo"]), destination=effect["destination"]
+    ))
+
+
+@register_effect("unlock_event", required=("id",))
+def _effect_unlock_event(effect, state):
+    state.flags.set_in(EVENT_UNLOCKED, effect["id"])
+
+
+@register_effect("confirm_pending_order")
+def _effect_confirm_pending_order(effect, state):
+    if state.pending_order:
+        order = state.pending_order
+        state.add_order(order)
+        state.pending_order = None
+        print("\n" + tr(
+            "game.order.accepted", "[ЗАДАНИЕ ПРИНЯТО] Доставить {cargo} на {destination}",
+            cargo=order.cargo_name, destination=order.destination
+        ))
+        if not order.picked_up:
+            print(tr("game.order.pickup_needed", "Груз нужно забрать: {planet}", planet=order.origin))
+
+
+@register_effect("reject_pending_order")
+def _effect_reject_pending_order(effect, state):
+    state.pending_order = None
+    print("\n" + tr("game.order.rejected", "[ЗАДАНИЕ ОТКЛОНЕНО]"))
+
+
+@register_effect("complete_order")
+def _effect_complete_order(effect, state):
+    if state.current_order:
+        print_slow("\n" + tr("game.order.delivered", "📦 Вы доставили заказ!"))
+        reward = state.current_order.reward
+        state.current_order.complete(state)
+        print_slow(tr("game.order.received", "Получено: {reward} кредитов", reward=reward))
+
+
+@register_effect("police_bribe_attempt")
+def _effect_police_bribe_attempt(effect, state):
+    # Логика попытки взятки
+    reward = state.current_order.reward
+    bribe_amount = int(reward * (2/3))
+
+    if state.money < bribe_amount:
+        # Недостаточно денег - сразу провал
+        state.flags.set("police_bribe_success", False)
+        state.flags.set("police_bribe_no_money", True)
+        print_slow(tr("game.police.bribe_no_money", "У вас недостаточно денег для взятки."))
+    else:
+        # Деньги есть, пробуем
+        if random.random() < 0.5:
+            # Успех
+            state.spend_money(bribe_amount)
+            state.flags.set("police_bribe_success", True)
+            state.flags.set("police_bribe_no_money", False)
+            # Мы не сбрасываем encounter_failed здесь, это решается в диалоге
+        else:
+            # Провал: ставим флаг, результат покажет диалог
+            state.flags.set("police_bribe_success", False)
+            state.flags.set("police_bribe_no_money", False)
+
+
+@register_effect("pay_police_fine", required=("amount_multiplier",))
+def _effect_pay_police_fine(effect, state):
+    # Оплата штрафа
+    amount = effect["amount_multiplier"] * state.current_order.reward
+    if state.spend_money(int(amount)):
+        state.flags.set("police_fine_paid", True)
+        state.current_order.fail(state)  # Конфискация и провал
+    else:
+        state.flags.set("police_fine_paid", False)
+        state.die(tr("game.police.life_sentence", "Пожизненное заключение за неуплату штрафа"))
+
+
+def _dead_zone_id(flag_name):
+    """id планеты для флага dead_zone_<планета> (иначе None)"""
+    prefix = galaxy_map.DEAD_ZONE_FLAG_PREFIX
+    if not flag_name.startswith(prefix):
+        return None
+    return galaxy_map.planet_id(flag_name[len(prefix):])
+
+
+# Условия.
+# Условие в JSON — лист {"type": ...} или составное выражение:
+#     {"all": [...]}  — все условия истинны (так же трактуется обычный список)
+#     {"any": [...]}  — хотя бы одно истинно
+#     {"not": {...}}  — отрицание
+# Выражение компилируется один раз в замыкание state -> bool
+# с коротким замыканием (all/any останавливаются на первом ответе).
+
+
+class ConditionError(ValueError):
+    """Неизвестный тип условия, нет обязательного поля или неверное выражение"""
+
+
+# Построители условий:
+# {тип: (builder(condition) -> check(state), обязательные поля, reads(condition) -> ключи)}
+CONDITION_BUILDERS = {}
+
+# Счётчики листовых условий: {ключ условия: [проверок, истинных]}
+_condition_stats = {}
+
+
+def register_condition(condition_type, builder=None, required=(), reads=None):
+    """
+    Зарегистрировать тип условия (можно как декоратор).
+
+    Args:
+        condition_type: значение поля "type" в JSON
+        builder: функция builder(condition) -> check(state) -> bool
+        required: поля условия, без которых оно не загрузится
+        reads: функция reads(condition) -> ключи состояния, которые читает
+               проверка (core/reactive.py); без неё условие проверяется всегда
+    """
+    def decorator(func):
+        CONDITION_BUILDERS[condition_type] = (func, tuple(required), reads)
+        return func
 
+    if builder is not None:
+        return decorator(builder)
+    return decorator
 
-def check_condition(condition, state):
+
+def _always(state):
+    return True
+
+
+_always.reads = frozenset()
+
+
+def _reading(check, reads):
+    """Отметить, какие ключи состояния читает проверка"""
+    check.reads = frozenset(reads)
+    return check
+
+
+def _counted(key, check):
+    """Обернуть проверку счётчиком вычислений (для поиска горячих условий)"""
+    stat = _condition_stats.setdefault(key, [0, 0])
+
+    def counted(state):
+        stat[0] += 1
+        result = check(state)
+        if result:
+            stat[1] += 1
+        return result
+
+    return counted
+
+
+def compile_condition(condition):
+    """
+    Условие или выражение из JSON -> функция state -> bool.
+
+    Raises:
+        ConditionError
     """
-    Проверить условие для отображения выбора/события.
-    
-    Типы условий:
-    - flag: проверить флаг
-    - money_gte: деньги >= значение
-    - money_lte: деньги <= значение
-    - reputation_gte: репутация >= значение
-    - day_gte: день >= значение
+    if isinstance(condition, list):
+        return _compile_all(condition)
+    if not isinstance(condition, dict):
+        raise ConditionError(f"Условие должно быть объектом или списком: {condition!r}")
+
+    if "all" in condition:
+        return _compile_all(condition["all"])
+    if "any" in condition:
+        checks = tuple(compile_condition(c) for c in condition["any"])
+        if len(checks) == 1:
+            return checks[0]
+        return _reading(
+            lambda state: any(check(state) for check in checks),
+            frozenset().union(*(check.reads for check in checks))
+        )
+    if "not" in condition:
+        inner = compile_condition(condition["not"])
+        return _reading(lambda state: not inner(state), inner.reads)
+
+    condition_type = condition.get("type")
+    entry = CONDITION_BUILDERS.get(condition_type)
+    if entry is None:
+        raise ConditionError(f"Неизвестный тип условия: {condition_type}")
+    builder, required, reads = entry
+    missing = [name for name in required if name not in condition]
+    if missing:
+        raise ConditionError(f"Условие {condition_type}: нет полей {', '.join(missing)}")
+
+    key = json.dumps(condition, ensure_ascii=False, sort_keys=True)
+    return _reading(
+        _counted(key, builder(condition)),
+        (ANY_STATE,) if reads is None else reads(condition)
+    )
+
+
+def _compile_all(conditions):
+    checks = tuple(compile_condition(c) for c in conditions)
+    if not checks:
+        return _always
+    if len(checks) == 1:
+        return checks[0]
+    return _reading(
+        lambda state: all(check(state) for check in checks),
+        frozenset().union(*(check.reads for check in checks))
+    )
+
+
+def compile_conditions(conditions):
+    """Список условий из JSON (AND) -> функция state -> bool"""
+    return _compile_all(conditions or ())
+
+
+def condition_stats():
     """
-    cond_type = condition.get("type")
+    Счётчики листовых условий, самые частые — первыми.
+
+    Returns:
+        list[(условие в JSON, проверок, истинных)]
+    """
+    return sorted(
+        ((key, stat[0], stat[1]) for key, stat in _condition_stats.items()),
+        key=lambda item: -item[1]
+    )
+
+
+def reset_condition_stats():
+    for stat in _condition_stats.values():
+        stat[0] = stat[1] = 0
+
+
+def _reads_flag(condition):
+    return (flag_key(condition["name"]),)
+
+
+def _reads_reputation(condition):
+    return (reputation_key(condition["faction"]),)
 
-    if cond_type == "flag":
-        expected = condition.get("value", True)
-        return state.flags.get(condition["name"]) == expected
 
-    elif cond_type == "flag_not":
-        return not state.flags.get(condition["name"])
+@register_condition("flag", required=("name",), reads=_reads_flag)
+def _condition_flag(condition):
+    """Флаг равен значению (по умолчанию True)"""
+    name = condition["name"]
+    expected = condition.get("value", True)
+    if isinstance(expected, bool):
+        register_flag(name)  # Логические флаги контента хранятся в битах
+    return lambda state: state.flags.get(name) == expected
 
-    elif cond_type == "money_gte":
-        return state.money >= condition["value"]
 
-    elif cond_type == "money_lte":
-        return state.money <= condition["value"]
+@register_condition("flag_not", required=("name",), reads=_reads_flag)
+def _condition_flag_not(condition):
+    """Флаг не установлен (то же, что {"not": {"type": "flag", ...}})"""
+    name = condition["name"]
+    register_flag(name)
+    return lambda state: not state.flags.get(name)
 
-    elif cond_type == "reputation_gte":
-        faction = condition["faction"]
-        return state.get_reputation(faction) >= condition["value"]
 
-    elif cond_type == "reputation_lte":
-        faction = condition["faction"]
-        return state.get_reputation(faction) <= condition["value"]
+@register_condition("money_gte", required=("value",), reads=lambda condition: (MONEY,))
+def _condition_money_gte(condition):
+    value = condition["value"]
+    return lambda state: state.money >= value
 
-    elif cond_type == "day_gte":
-        return state.day >= condition["value"]
 
-    elif cond_type == "has_cargo":
-        return condition["item"] in state.cargo
+@register_condition("money_lte", required=("value",), reads=lambda condition: (MONEY,))
+def _condition_money_lte(condition):
+    value = condition["value"]
+    return lambda state: state.money <= value
 
-    elif cond_type == "is_contraband_detected":
-         # Проверка, есть ли контрабанда
-         if not state.current_order: return False
-         return state.current_order.is_contraband
 
-    return True  # Если условие неизвестно — пропускаем
+@register_condition("reputation_gte", required=("faction", "value"), reads=_reads_reputation)
+def _condition_reputation_gte(condition):
+    faction, value = condition["faction"], condition["value"]
+    return lambda state: state.get_reputation(faction) >= value
+
+
+@register_condition("reputation_lte", required=("faction", "value"), reads=_reads_reputation)
+def _condition_reputation_lte(condition):
+    faction, value = condition["faction"], condition["value"]
+    return lambda state: state.get_reputation(faction) <= value
+
+
+@register_condition("day_gte", required=("value",), reads=lambda condition: (DAY,))
+def _condition_day_gte(condition):
+    value = condition["value"]
+    return lambda state: state.day >= value
+
+
+@register_condition("day_eq", required=("value",), reads=lambda condition: (DAY,))
+def _condition_day_eq(condition):
+    value = condition["value"]
+    return lambda state: state.day == value
+
+
+# Груз и заказы меняются напрямую, без уведомлений —
+# условия на них не описывают reads и проверяются всегда
+@register_condition("has_cargo", required=("item",))
+def _condition_has_cargo(condition):
+    item = condition["item"]
+    return lambda state: item in state.cargo
+
+
+@register_condition("is_contraband_detected")
+def _condition_is_contraband_detected(condition):
+    """Заказ разговора — контрабанда, и груз уже на борту"""
+    def check(state):
+        order = state.current_order
+        if not order:
+            return False
+        return order.is_contraband and order.picked_up
+    return check
+
+
+def check_condition(condition, state):
+    """
+    Проверить условие (компилируется на месте).
+    Для контента, загружаемого один раз, — compile_condition.
+    """
+    return compile_condition(condition)(state)
 
 
 def check_conditions(conditions, state):
     """Проверить все условия (AND логика)"""
     if not conditions:
         return True
-    return all(check_condition(c, state) for c in conditions)
+    return compile_conditions(conditions)(state)
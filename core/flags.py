@@ -1,38 +1,296 @@
 """
 Сюжетные флаги — сердце ветвлений.
 Используются в диалогах, новостях, заказах, финалах.
+
+Хранение:
+- логические флаги из схемы лежат в битовых масках (int): у каждого
+  флага свой бит. Схема — флаги, зарегистрированные register_flag
+  (в том числе все флаги из условий контента, см. core/events.py),
+  и семейства register_flag_family: dead_zone_<планета>,
+  event_unlocked_<id>. Ключ семейства интернируется в бит один раз,
+  проверка члена семейства (Flags.in_family) не собирает строку имени;
+- остальные флаги и значения не-bool — в обычном словаре.
+
+Снимок (snapshot) — O(1): маски неизменяемы, словарь разделяется
+до первой записи (копирование при записи). diff_snapshots сравнивает
+снимки за время, пропорциональное числу изменённых флагов.
+Снимки используют сохранения и симуляции (попробовать ход и откатить).
 """
 
+import sys
+
+from core.reactive import flag_key
+
+_MISSING = object()
+
+# Схема: имя флага -> бит; бит -> имя
+_FLAG_BITS = {}
+_BIT_NAMES = []
+
+# Имена, которые точно не входят в схему (чтобы не проверять семейства каждый раз)
+_FREE_NAMES = set()
+
+# Семейства по префиксу имени
+FLAG_FAMILIES = {}
+
+
+class FlagFamily:
+    """Семейство флагов <префикс><ключ>; ключи интернируются в биты"""
+
+    def __init__(self, prefix, is_member=None):
+        self.prefix = prefix
+        # Фильтр ключей: какие <префикс><ключ> считать членами семейства
+        self.is_member = is_member
+        self._bits = {}  # ключ -> бит
+
+    def name(self, key):
+        return self.prefix + key
+
+    def bit(self, key):
+        """Бит члена семейства (назначается при первом обращении)"""
+        bit = self._bits.get(key)
+        if bit is None:
+            key = sys.intern(key)
+            bit = _allocate(self.prefix + key)
+            self._bits[key] = bit
+        return bit
+
+    def keys(self):
+        return self._bits.keys()
+
+
+def _allocate(name):
+    bit = _FLAG_BITS.get(name)
+    if bit is None:
+        bit = len(_BIT_NAMES)
+        _BIT_NAMES.append(sys.intern(name))
+        _FLAG_BITS[name] = bit
+        _FREE_NAMES.discard(name)
+    return bit
+
+
+def register_flag(name):
+    """Добавить логический флаг в схему; возвращает его бит"""
+    bit = _FLAG_BITS.get(name)
+    if bit is None:
+        family = _family_of(name)
+        if family is not None:
+            return family.bit(name[len(family.prefix):])
+        bit = _allocate(name)
+    return bit
+
+
+def register_flag_family(prefix, is_member=None):
+    """
+    Зарегистрировать семейство флагов с общим префиксом.
+
+    Args:
+        prefix: префикс имени ("dead_zone_")
+        is_member: функция ключ -> bool (по умолчанию членом считается любой ключ)
+
+    Returns:
+        FlagFamily
+    """
+    family = FLAG_FAMILIES.get(prefix)
+    if family is None:
+        family = FLAG_FAMILIES[prefix] = FlagFamily(prefix, is_member)
+        _FREE_NAMES.clear()
+    return family
+
+
+def _family_of(name):
+    for prefix, family in FLAG_FAMILIES.items():
+        if name.startswith(prefix) and len(name) > len(prefix):
+            if family.is_member is None or family.is_member(name[len(prefix):]):
+                return family
+    return None
+
+
+def flag_bit(name):
+    """Бит флага или None, если флаг не из схемы"""
+    bit = _FLAG_BITS.get(name)
+    if bit is None and name not in _FREE_NAMES:
+        family = _family_of(name)
+        if family is None:
+            _FREE_NAMES.add(name)
+        else:
+            bit = family.bit(name[len(family.prefix):])
+    return bit
+
+
+EVENT_UNLOCKED = register_flag_family("event_unlocked_")
+
+
+def _bit_names(mask):
+    """Имена флагов установленных битов маски"""
+    names = []
+    while mask:
+        low = mask & -mask
+        names.append(_BIT_NAMES[low.bit_length() - 1])
+        mask ^= low
+    return names
+
 
 class Flags:
     def __init__(self):
-        self.flags = {}
+        # Флаги из схемы: заданы ли (_present) и значение True (_true ⊆ _present)
+        self._present = 0
+        self._true = 0
+        # Остальные флаги: {имя: значение}; _shared — словарь есть в снимке
+        self._extra = {}
+        self._shared = False
+        # Уведомление об изменении: on_change(ключ) или on_change(None) — изменилось всё
+        self.on_change = None
+
+    def _changed(self, name):
+        if self.on_change is not None:
+            self.on_change(None if name is None else flag_key(name))
+
+    def _writable_extra(self):
+        if self._shared:
+            self._extra = dict(self._extra)
+            self._shared = False
+        return self._extra
+
+    def _bit(self, name):
+        """Бит флага; флаг, попавший в схему позже, переносится из словаря"""
+        bit = flag_bit(name)
+        if bit is not None and self._extra and name in self._extra:
+            value = self._extra[name]
+            if isinstance(value, bool):
+                del self._writable_extra()[name]
+                self._store(bit, value)
+        return bit
+
+    def _store(self, bit, value):
+        mask = 1 << bit
+        self._present |= mask
+        if value:
+            self._true |= mask
+        else:
+            self._true &= ~mask
 
     def set(self, name, value=True):
         """Установить флаг"""
-        self.flags[name] = value
+        bit = self._bit(name)
+        if bit is not None and isinstance(value, bool):
+            if self._extra and name in self._extra:
+                del self._writable_extra()[name]  # Было значение не-bool
+            mask = 1 << bit
+            if self._present & mask and bool(self._true & mask) == value:
+                return
+            self._store(bit, value)
+        else:
+            if self._extra.get(name, _MISSING) == value:
+                return
+            if bit is not None:
+                self._clear(bit)
+            self._writable_extra()[name] = value
+        self._changed(name)
 
     def get(self, name):
         """Получить значение флага (False по умолчанию)"""
-        return self.flags.get(name, False)
+        bit = self._bit(name)
+        if bit is not None and self._present >> bit & 1:
+            return bool(self._true >> bit & 1)
+        return self._extra.get(name, False)
 
     def has(self, name):
         """Проверить, установлен ли флаг"""
-        return name in self.flags and self.flags[name]
+        return bool(self.get(name))
+
+    def _clear(self, bit):
+        mask = ~(1 << bit)
+        self._present &= mask
+        self._true &= mask
 
     def remove(self, name):
         """Удалить флаг"""
-        if name in self.flags:
-            del self.flags[name]
+        bit = self._bit(name)
+        if bit is not None and self._present >> bit & 1:
+            self._clear(bit)
+        elif name in self._extra:
+            del self._writable_extra()[name]
+        else:
+            return
+        self._changed(name)
+
+    def in_family(self, family, key):
+        """Установлен ли флаг <префикс семейства><ключ> (без сборки имени)"""
+        return bool(self._true >> family.bit(key) & 1)
+
+    def set_in(self, family, key, value=True):
+        """Установить флаг семейства"""
+        self.set(family.name(key), value)
+
+    def members(self, family):
+        """Ключи установленных флагов семейства"""
+        return [key for key, bit in family._bits.items() if self._true >> bit & 1]
 
     def all(self):
         """Вернуть все флаги"""
-        return self.flags.copy()
+        result = dict(self._extra)
+        true = self._true
+        for name in _bit_names(self._present):
+            result[name] = bool(true >> _FLAG_BITS[name] & 1)
+        return result
+
+    def snapshot(self):
+        """Неизменяемый снимок флагов (O(1))"""
+        self._shared = True
+        return (self._present, self._true, self._extra)
+
+    def restore(self, snapshot):
+        """Вернуть флаги к снимку"""
+        self._present, self._true, self._extra = snapshot
+        self._shared = True
+        self._changed(None)
 
     def to_dict(self):
         """Для сохранения"""
-        return self.flags.copy()
+        return self.all()
 
     def from_dict(self, data):
         """Для загрузки"""
-        self.flags = data.copy()
+        self._present = self._true = 0
+        self._extra = {}
+        self._shared = False
+        on_change, self.on_change = self.on_change, None
+        try:
+            for name, value in data.items():
+                self.set(name, value)
+        finally:
+            self.on_change = on_change
+        self._changed(None)
+
+
+def diff_snapshots(old, new):
+    """
+    Изменения флагов между снимками.
+
+    Returns:
+        (изменённые {имя: новое значение}, удалённые {имена})
+    """
+    old_present, old_true, old_extra = old
+    new_present, new_true, new_extra = new
+
+    changed, removed = {}, set()
+    for name in _bit_names((old_present ^ new_present) | (old_true ^ new_true)):
+        bit = _FLAG_BITS[name]
+        if new_present >> bit & 1:
+            changed[name] = bool(new_true >> bit & 1)
+        else:
+            removed.add(name)
+
+    if old_extra is not new_extra:
+        for name, value in new_extra.items():
+            if old_extra.get(name, _MISSING) != value:
+                changed[name] = value
+        removed.update(name for name in old_extra if name not in new_extra)
+
+    # Флаг мог переехать между словарём и битами (схема пополнилась) — это не удаление
+    for name in removed & changed.keys():
+        removed.discard(name)
+        if old_extra.get(name, _MISSING) == changed[name]:
+            del changed[name]
+    return changed, removed
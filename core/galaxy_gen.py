@@ -0,0 +1,190 @@
+"""
+Процедурный генератор галактик.
+
+Создаёт связную карту в формате GALAXY_GRAPH ({планета: {сосед: расстояние}}),
+пригодную для set_galaxy_graph и бенчмарков маршрутизации.
+"""
+
+import math
+import random
+
+
+# Распределения степеней вершин
+DEGREE_UNIFORM = "uniform"      # Равномерно в [min_degree, max_degree]
+DEGREE_POWER_LAW = "power_law"  # Много «тупиков» и немного крупных хабов
+
+# Топология связей
+TOPOLOGY_SPATIAL = "spatial"    # Системы на плоскости, связи с ближайшими соседями
+TOPOLOGY_RANDOM = "random"      # Связи между случайными системами (граф-экспандер)
+
+
+def generate_galaxy(size, seed=None, min_degree=2, max_degree=5,
+                    min_dist=50, max_dist=700, degree_distribution=DEGREE_UNIFORM,
+                    hub_name="Station Alpha", topology=TOPOLOGY_SPATIAL):
+    """
+    Сгенерировать связную галактику.
+
+    TOPOLOGY_SPATIAL: системы разбрасываются по плоскости и связываются
+    с ближайшими соседями, длина ребра растёт с расстоянием на плоскости.
+    Так устроены «настоящие» карты, и на них хорошо работают иерархии сжатия.
+
+    TOPOLOGY_RANDOM: случайное остовное дерево (гарантия связности),
+    затем рёбра между случайными системами до целевой степени.
+
+    Все рёбра двусторонние с одинаковой длиной.
+
+    Args:
+        size: количество систем
+        seed: зерно генератора (одинаковое зерно — одинаковая карта)
+        min_degree, max_degree: диапазон целевой степени системы
+        min_dist, max_dist: диапазон длин рёбер
+        degree_distribution: DEGREE_UNIFORM или DEGREE_POWER_LAW
+        hub_name: имя первой системы (стартовая планета игрока)
+        topology: TOPOLOGY_SPATIAL или TOPOLOGY_RANDOM
+
+    Returns:
+        dict: граф в формате GALAXY_GRAPH
+    """
+    if size < 1:
+        raise ValueError("Галактика должна содержать хотя бы одну систему")
+    if min_degree < 1 or max_degree < min_degree:
+        raise ValueError("Некорректный диапазон степеней")
+
+    rng = random.Random(seed)
+    names = [hub_name] + [f"Система {i:0{len(str(size))}d}" for i in range(1, size)]
+    adjacency = [dict() for _ in range(size)]
+
+    # Целевая степень каждой системы
+    targets = [
+        _sample_degree(rng, min_degree, max_degree, degree_distribution)
+        for _ in range(size)
+    ]
+
+    if topology == TOPOLOGY_SPATIAL:
+        _connect_spatial(rng, adjacency, targets, max_degree, min_dist, max_dist)
+    elif topology == TOPOLOGY_RANDOM:
+        _connect_random(rng, adjacency, targets, max_degree, min_dist, max_dist)
+    else:
+        raise ValueError(f"Неизвестная топология: {topology}")
+
+    return {
+        names[u]: {names[v]: dist for v, dist in adjacency[u].items()}
+        for u in range(size)
+    }
+
+
+def _sample_degree(rng, min_degree, max_degree, distribution):
+    """Выбрать целевую степень системы"""
+    if distribution == DEGREE_UNIFORM:
+        return rng.randint(min_degree, max_degree)
+
+    if distribution == DEGREE_POWER_LAW:
+        # Дискретный Парето: P(k) ~ k^-2.5, обрезанный сверху
+        degree = int(min_degree * rng.paretovariate(1.5))
+        return min(degree, max_degree)
+
+    raise ValueError(f"Неизвестное распределение степеней: {distribution}")
+
+
+def _connect_random(rng, adjacency, targets, max_degree, min_dist, max_dist):
+    """Остовное дерево + рёбра между случайными системами"""
+    size = len(adjacency)
+
+    def connect(u, v):
+        dist = rng.randint(min_dist, max_dist)
+        adjacency[u][v] = dist
+        adjacency[v][u] = dist
+
+    # Остовное дерево: каждая новая система цепляется к одной из предыдущих
+    for v in range(1, size):
+        connect(v, rng.randrange(v))
+
+    if size < 2:
+        return
+
+    for u in range(size):
+        attempts = 0
+        while len(adjacency[u]) < targets[u] and attempts < max_degree * 4:
+            attempts += 1
+            v = rng.randrange(size)
+            if v == u or v in adjacency[u] or len(adjacency[v]) >= max_degree:
+                continue
+            connect(u, v)
+
+
+def _connect_spatial(rng, adjacency, targets, max_degree, min_dist, max_dist):
+    """Системы на плоскости (плотность 1 на единицу площади), связи с ближайшими"""
+    size = len(adjacency)
+    side = math.sqrt(size)
+    points = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(size)]
+
+    # Сетка ячеек 1x1 для поиска ближайших соседей
+    cells = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x), int(y)), []).append(i)
+
+    def nearest(u, count, accept):
+        """count ближайших к u систем, удовлетворяющих accept"""
+        x, y = points[u]
+        cx, cy = int(x), int(y)
+        found = []
+        radius = 0
+        max_radius = int(side) + 1
+        while radius <= max_radius:
+            for gx in range(cx - radius, cx + radius + 1):
+                for gy in range(cy - radius, cy + radius + 1):
+                    # Только кольцо текущего радиуса
+                    if max(abs(gx - cx), abs(gy - cy)) != radius:
+                        continue
+                    for v in cells.get((gx, gy), ()):
+                        if v != u and accept(v):
+                            found.append((math.dist(points[u], points[v]), v))
+            # Всё, что ближе radius, уже просмотрено
+            if len(found) >= count and sorted(found)[count - 1][0] <= radius:
+                break
+            radius += 1
+        found.sort()
+        return [v for _, v in found[:count]]
+
+    def connect(u, v):
+        # Длина ребра растёт с расстоянием на плоскости
+        scale = min(math.dist(points[u], points[v]) / 2, 1.0)
+        dist = int(min_dist + (max_dist - min_dist) * scale)
+        adjacency[u][v] = dist
+        adjacency[v][u] = dist
+
+    for u in range(size):
+        need = targets[u] - len(adjacency[u])
+        if need <= 0:
+            continue
+        for v in nearest(u, need, lambda v: v not in adjacency[u]
+                         and len(adjacency[v]) < max_degree):
+            connect(u, v)
+
+    # Связность: каждый компонент, кроме первого, соединяется ближайшим
+    # ребром с уже обработанными компонентами (они связаны с первым)
+    component = [-1] * size
+    for start in range(size):
+        if component[start] != -1:
+            continue
+        component[start] = start
+        stack = [start]
+        members = []
+        while stack:
+            u = stack.pop()
+            members.append(u)
+            for v in adjacency[u]:
+                if component[v] == -1:
+                    component[v] = start
+                    stack.append(v)
+        if start == 0:
+            continue
+
+        best = None
+        for u in members:
+            for v in nearest(u, 1, lambda v: component[v] not in (-1, start)):
+                d = math.dist(points[u], points[v])
+                if best is None or d < best[0]:
+                    best = (d, u, v)
+        if best:
+            connect(best[1], best[2])
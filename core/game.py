@@ -2,17 +2,45 @@
 Главный игровой цикл.
 """
 
+from core.bus import Travelled, get_bus
 from core.state import GameState
 from dialog.engine import run_dialog
-from dialog.loader import load_dialog
+from dialog.loader import get_dialog
 from news.feed import get_daily_news
 from orders.generator import generate_order
 from utils.io import print_slow, print_header, clear_screen
 from utils.save_load import save_game
-from core.map import GALAXY_GRAPH, get_path, get_max_reachable_path
+from core.map import (
+    GALAXY_GRAPH, get_path, get_paths_from, get_k_shortest_paths,
+    get_dead_zones, planet_id
+)
 from core.encounters import check_police_encounter
+from core.itinerary import plan_itinerary, MAX_PLAN_DAYS
+from core.costs import get_cost_model
+from core.risk import get_safest_path, route_expected_cost
+from core.delivery import plan_deliveries
+from core.neighborhoods import scan_report
+from core.layout import render_viewport
+from utils.i18n import tr
 import random
 
+# Сколько альтернативных маршрутов показывать в планировщике
+ROUTE_ALTERNATIVES = 3
+
+# Пункты меню дня: (id перевода, текст на исходном языке)
+DAY_MENU = [
+    ("menu.day.news", "Проверить новости"),
+    ("menu.day.take_order", "Взять заказ"),
+    ("menu.day.travel", "Лететь на планету"),
+    ("menu.day.ship", "Управление кораблём"),
+    ("menu.day.status", "Статус"),
+    ("menu.day.end_day", "Завершить день"),
+    ("menu.day.save", "Сохранить игру"),
+    ("menu.day.map", "Карта галактики"),
+    ("menu.day.route", "Проложить маршрут"),
+    ("menu.day.exit", "Выйти в меню"),
+]
+
 
 def start_game():
     """Начать новую игру"""
@@ -20,16 +48,16 @@ def start_game():
     state = GameState()
 
     # Запустить вступительный диалог
-    intro = load_dialog("intro")
+    intro = get_dialog("intro")
     if intro:
         run_dialog(intro, state)
 
     if not state.alive:
-        print_slow("\n[ИГРА ОКОНЧЕНА]")
+        print_slow("\n" + tr("game.over", "[ИГРА ОКОНЧЕНА]"))
         return
 
     # Показать приветствие на корабле
-    welcome = load_dialog("welcome")
+    welcome = get_dialog("welcome")
     if welcome:
         run_dialog(welcome, state)
 
@@ -39,21 +67,19 @@ def start_game():
 
 def game_loop(state):
     """Основной цикл игры"""
+    bus = get_bus()
     while state.alive:
-        print_header(f"День {state.day} | {state.current_planet} | Кредиты: {state.money}")
+        # Пачечные подписчики получают события прошлого хода
+        bus.flush()
+        print_header(tr(
+            "game.header", "День {day} | {planet} | Кредиты: {money}",
+            day=state.day, planet=state.current_planet, money=state.money
+        ))
 
         # Показать меню дня
-        print("\nЧто вы хотите сделать?")
-        print("1. Проверить новости")
-        print("2. Взять заказ")
-        print("3. Лететь на планету")
-        print("4. Управление кораблём")
-        print("5. Статус")
-        print("6. Завершить день")
-        print("7. Сохранить игру")
-        print("8. Карта галактики")
-        print("9. Проложить маршрут")
-        print("10. Выйти в меню")
+        print("\n" + tr("menu.day.prompt", "Что вы хотите сделать?"))
+        for number, (message_id, text) in enumerate(DAY_MENU, 1):
+            print(f"{number}. {tr(message_id, text)}")
 
         choice = input("> ").strip()
 
@@ -71,16 +97,19 @@ def game_loop(state):
             end_day(state)
         elif choice == "7":
             save_game(state)
-            print_slow("Игра сохранена.")
+            print_slow(tr("game.saved", "Игра сохранена."))
         elif choice == "8":
             show_map(state)
         elif choice == "9":
             plan_route(state)
         elif choice == "10":
-            print_slow("Возврат в меню...")
+            print_slow(tr("game.back_to_menu", "Возврат в меню..."))
             break
         else:
-            print("Неверный ввод.")
+            print(tr("menu.invalid_input", "Неверный ввод."))
+
+    # События последнего хода (смерть, выход в меню)
+    bus.flush()
 
 
 def show_news(state):
@@ -88,25 +117,28 @@ def show_news(state):
     news_list = get_daily_news(state)
 
     if not news_list:
-        print_slow("\nНовостей нет.")
+        print_slow("\n" + tr("game.no_news", "Новостей нет."))
         return
 
     for news in news_list:
         news.show(state)
 
-    input("\n[Нажмите Enter для продолжения]")
+    input("\n" + tr("menu.press_enter", "[Нажмите Enter для продолжения]"))
 
 
 def take_order(state):
     """Взять новый заказ"""
-    if state.current_order:
-        print_slow("\nУ вас уже есть активный заказ!")
-        print(f"Доставить груз на {state.current_order.destination}")
+    if state.free_capacity() <= 0:
+        print_slow("\n" + tr("game.order.hold_full", "Грузовой отсек заполнен!"))
+        print(tr(
+            "game.order.hold_summary", "Активных заказов: {count}, занято {load}/{capacity}",
+            count=len(state.orders), load=state.cargo_load(), capacity=state.ship.cargo.capacity
+        ))
         return
 
     # Сюжетный квест: Робот 001 (День 1-2)
     if state.day <= 2 and not state.flags.get("heard_about_robot_001") and not state.flags.get("warned_about_water"):
-        quest_dialog = load_dialog("client_water_001")
+        quest_dialog = get_dialog("client_water_001")
         if quest_dialog:
             run_dialog(quest_dialog, state)
             return
@@ -125,105 +157,138 @@ def take_order(state):
         else:
              template_id = random.choice(["client_type_standard", "client_type_rude"])
 
-        client_dialog = load_dialog(template_id)
+        client_dialog = get_dialog(template_id)
         if client_dialog:
              run_dialog(client_dialog, state)
     else:
-        print_slow("\nНет доступных заказов.")
+        print_slow("\n" + tr("game.order.none", "Нет доступных заказов."))
 
 
 def travel_to_planet(state):
     """Полёт на другую планету"""
     
-    print("\n=== НАВИГАЦИЯ ===")
-    print(f"Текущее положение: {state.current_planet}")
-    print(f"Топливо: {state.ship.fuel}/{state.ship.max_fuel}")
-    print(f"Очки действий (AP): {state.action_points}")
+    print("\n" + tr("game.travel.title", "=== НАВИГАЦИЯ ==="))
+    print(tr("game.travel.location", "Текущее положение: {planet}", planet=state.current_planet))
+    print(tr("game.travel.fuel", "Топливо: {fuel}/{max_fuel}", fuel=state.ship.fuel, max_fuel=state.ship.max_fuel))
+    print(tr("game.travel.ap", "Очки действий (AP): {ap}", ap=state.action_points))
 
     # Показать доступные планеты (все, кроме текущей)
     available = [p for p in GALAXY_GRAPH.keys() if p != state.current_planet]
+    # Одно дерево кратчайших путей на всё меню (в обход опасных зон)
+    dead_zones = get_dead_zones(state)
+    tree = get_paths_from(state.current_planet, dead_zones)
+    next_stop = show_next_stop(state)
     
-    for i, planet in enumerate(available, 1):
-        # Проверка пути и дистанции
-        path, dist = get_path(state.current_planet, planet)
-        if path:
-            print(f"{i}. {planet} (Дистанция: {dist})")
-        else:
-             print(f"{i}. {planet} [НЕДОСТУПНО]")
-
-    print(f"{len(available) + 1}. Отмена")
+    print_destinations(available, tree, dead_zones)
 
     try:
         choice = int(input("> ").strip())
         if choice == len(available) + 1:
             return
 
+        if choice == 0 and next_stop:
+            choice = available.index(next_stop) + 1
+
         if 1 <= choice <= len(available):
             destination = available[choice - 1]
             perform_travel(state, destination)
     
     except ValueError:
-        print("Неверный ввод.")
+        print(tr("menu.invalid_input", "Неверный ввод."))
 
 
-def perform_travel(state, destination):
-    """Выполнить перелёт к пункту назначения"""
+def print_destinations(available, tree, dead_zones):
+    """Пункты меню планет с дистанцией и пункт "Отмена" """
+    for i, planet in enumerate(available, 1):
+        # Проверка пути и дистанции
+        if tree and tree.is_reachable(planet):
+            print(f"{i}. " + tr(
+                "game.travel.destination", "{planet} (Дистанция: {distance}){mark}",
+                planet=planet, distance=tree.distance(planet), mark=dead_zone_mark(planet, dead_zones)
+            ))
+        else:
+            print(f"{i}. " + tr("game.travel.unreachable", "{planet} [НЕДОСТУПНО]", planet=planet))
+    print(f"{len(available) + 1}. {tr('menu.cancel', 'Отмена')}")
+
+
+def perform_travel(state, destination, path=None):
+    """
+    Выполнить перелёт к пункту назначения.
+    Если path не задан, летим кратчайшим маршрутом.
+    """
     # Рассчет маршрута
-    path, dist = get_path(state.current_planet, destination)
-    if not path:
-        print_slow("Нет доступного маршрута до этой планеты.")
-        return
+    route_chosen = path is not None
+    if path is None:
+        path, dist = get_path(
+            state.current_planet, destination, dead_zones=get_dead_zones(state)
+        )
+        if not path:
+            print_slow(tr("game.travel.no_route", "Нет доступного маршрута до этой планеты."))
+            return
 
     # Рассчет затрат
-    engine_level = state.ship.engine.level
-    fuel_cost = int(dist * 0.5 * (1 + (engine_level * 0.2)))
-    ap_cost = int(25 / engine_level)
+    costs = get_cost_model(state.ship.engine.level)
+    fuel_cost = costs.route_fuel(path)
+    ap_cost = costs.flight_ap
     
     # Проверка ресурсов
     if state.action_points < ap_cost:
-        print_slow(f"\nНедостаточно очков действий! Нужно {ap_cost}, у вас {state.action_points}.")
-        print_slow("Завершите день, чтобы восстановить силы.")
+        print_slow("\n" + tr(
+            "game.travel.no_ap", "Недостаточно очков действий! Нужно {need}, у вас {have}.",
+            need=ap_cost, have=state.action_points
+        ))
+        print_slow(tr("game.travel.end_day_hint", "Завершите день, чтобы восстановить силы."))
         return
 
     max_fuel = state.ship.fuel
     # Если топлива не хватает на полный путь
     if fuel_cost > max_fuel:
-         reachable_path, reachable_dist, reached = get_max_reachable_path(state.current_planet, destination, max_fuel / (0.5 * (1 + (engine_level * 0.2))))
-         print_slow(f"\n⚠️ ВНИМАНИЕ: Недостаточно топлива для полного маршрута!")
-         print(f"Требуется: {fuel_cost}, у вас: {state.ship.fuel}")
-         print("Вы остановитесь на полпути.")
-
-    print(f"\nМаршрут: {' -> '.join(path)}")
-    print(f"Затраты: {fuel_cost} топлива, {ap_cost} AP")
-    print("1. Начать полёт")
-    print("2. Отмена")
+         print_slow("\n" + tr("game.travel.low_fuel", "⚠️ ВНИМАНИЕ: Недостаточно топлива для полного маршрута!"))
+         print(tr("game.travel.fuel_needed", "Требуется: {need}, у вас: {have}", need=fuel_cost, have=state.ship.fuel))
+
+         # Поискать выполнимый план с ночёвками и лететь по его первому этапу
+         # (если игрок не выбрал маршрут сам)
+         itinerary = None if route_chosen else plan_itinerary(state, destination)
+         if itinerary and itinerary.legs and itinerary.legs[0].day == 0:
+             print("\n" + tr("game.travel.refuel_plan", "План с дозаправкой ({days} дн.):", days=itinerary.rest_days + 1))
+             print_itinerary(state, itinerary)
+             path = itinerary.legs[0].path
+             fuel_cost = itinerary.legs[0].fuel
+             print(tr("game.travel.first_leg", "Сегодня летим по первому этапу плана."))
+         else:
+             print(tr("game.travel.halfway", "Вы остановитесь на полпути."))
+
+    print("\n" + tr("game.travel.route", "Маршрут: {path}", path=" -> ".join(path)))
+    print(tr("game.travel.cost", "Затраты: {fuel} топлива, {ap} AP", fuel=fuel_cost, ap=ap_cost))
+    print(f"1. {tr('game.travel.start', 'Начать полёт')}")
+    print(f"2. {tr('menu.cancel', 'Отмена')}")
     
     if input("> ").strip() != "1":
         return
 
     # Начало полёта
     state.action_points -= ap_cost
-    current_node_index = 0
     
-    print_slow("\nСистемы корабля: НОРМА.")
-    print_slow("Двигатели: ЗАПУСК...")
+    print_slow("\n" + tr("game.travel.systems_ok", "Системы корабля: НОРМА."))
+    print_slow(tr("game.travel.engines", "Двигатели: ЗАПУСК..."))
     
     for i in range(len(path) - 1):
         start_node = path[i]
         next_node = path[i+1]
         
-        segment_dist = GALAXY_GRAPH[start_node][next_node]
-        segment_fuel = int(segment_dist * 0.5 * (1 + (engine_level * 0.2)))
+        segment_fuel = costs.segment_fuel(planet_id(start_node), planet_id(next_node))
 
         if not state.ship.use_fuel(segment_fuel):
-            print_slow("\n⚠️ ТОПЛИВО НА ИСХОДЕ!")
-            print_slow("Двигатели глохнут...")
+            print_slow("\n" + tr("game.travel.out_of_fuel", "⚠️ ТОПЛИВО НА ИСХОДЕ!"))
+            print_slow(tr("game.travel.engines_stall", "Двигатели глохнут..."))
             state.ship.fuel = 0
             state.current_planet = start_node # Остаемся на предыдущей точке
-            print_slow(f"Аварийная остановка в системе {state.current_planet}.")
+            print_slow(tr("game.travel.emergency_stop", "Аварийная остановка в системе {planet}.", planet=state.current_planet))
             return
 
-        print_slow(f"Перелёт: {start_node} -> {next_node}...", delay=0.5)
+        print_slow(tr(
+            "game.travel.jump", "Перелёт: {origin} -> {destination}...", origin=start_node, destination=next_node
+        ), delay=0.5)
         
         # Проверка полиции
         if not check_police_encounter(state):
@@ -231,27 +296,116 @@ def perform_travel(state, destination):
              return 
              
         state.current_planet = next_node
+        get_bus().emit(Travelled, start_node, next_node, state.day)
 
         # Проверка опасных зон (после прибытия)
         dead_zone_check(state, next_node)
         if not state.alive:
             return
 
-    print_slow(f"\nВы прибыли на {state.current_planet}.")
+    print_slow("\n" + tr("game.travel.arrived", "Вы прибыли на {planet}.", planet=state.current_planet))
     
+    handle_cargo(state)
+
+
+def handle_cargo(state):
+    """Выгрузить и погрузить заказы на текущей планете"""
     # Проверка доставки
-    if state.current_order and state.current_order.destination == state.current_planet:
-         # В диалоге будет кнопка "Завершить заказ"
-         template_id = random.choice([
-             "recipient_standard", 
-             "recipient_rude", 
-             "recipient_grateful", 
-             "recipient_foreigner"
-         ])
-         
-         recipient_dialog = load_dialog(template_id)
-         if recipient_dialog:
-              run_dialog(recipient_dialog, state)
+    for order in list(state.orders):
+        if order.picked_up and order.destination_id == state.planet_id:
+            # В диалоге будет кнопка "Завершить заказ"
+            state.focus_order(order)
+            template_id = random.choice([
+                "recipient_standard", 
+                "recipient_rude", 
+                "recipient_grateful", 
+                "recipient_foreigner"
+            ])
+
+            recipient_dialog = get_dialog(template_id)
+            if recipient_dialog:
+                run_dialog(recipient_dialog, state)
+
+    # Погрузка заказов, ожидающих на этой планете
+    for order in state.orders:
+        if not order.picked_up and order.origin_id == state.planet_id:
+            if order.size <= state.free_capacity():
+                order.picked_up = True
+                print_slow(tr(
+                    "game.cargo.loaded", "📦 Груз принят на борт: {cargo} (для {destination})",
+                    cargo=order.cargo_name, destination=order.destination
+                ))
+            else:
+                print_slow(tr(
+                    "game.cargo.no_room", "⚠️ Нет места для груза: {cargo} (нужно {size})",
+                    cargo=order.cargo_name, size=order.size
+                ))
+
+
+def show_next_stop(state):
+    """
+    Показать план доставки заказов и пункт меню "0" — следующую остановку.
+
+    Returns:
+        str или None: планета следующей остановки
+    """
+    if not state.orders:
+        return None
+    delivery_plan = plan_deliveries(state)
+    print_delivery_plan(state, delivery_plan)
+    next_stop = next(
+        (stop.planet for stop in delivery_plan.stops if stop.planet_id != state.planet_id),
+        None
+    )
+    if next_stop:
+        print("\n0. " + tr("game.plan.next_stop", "Следующая остановка по плану: {planet}", planet=next_stop))
+    return next_stop
+
+
+def print_delivery_plan(state, plan):
+    """Показать рекомендуемый порядок погрузок и выгрузок"""
+    if not plan.stops:
+        return
+    if plan.exact:
+        method = tr("game.plan.optimal", "оптимальный")
+    else:
+        method = tr("game.plan.approximate", "приближённый")
+    print("\n" + tr(
+        "game.plan.header", "Рекомендуемый порядок ({method}, топливо: {fuel}):", method=method, fuel=plan.fuel
+    ))
+    late_mark = tr("game.plan.late", " ⏰ опоздание")
+    for i, stop in enumerate(plan.stops, 1):
+        late = late_mark if not stop.is_pickup and stop.order in plan.late_orders else ""
+        print(f"  {i}. {stop.describe()}{late}")
+    for order in plan.skipped_orders:
+        print(tr("game.plan.skipped", "  ✖ {cargo}: не помещается или недостижим", cargo=order.cargo_name))
+
+
+def in_dead_zone(planet, dead_zones):
+    """Планета (по имени) входит в опасные зоны (множество id)"""
+    return planet_id(planet) in dead_zones
+
+
+def dead_zone_mark(planet, dead_zones):
+    """Пометка опасной зоны для меню"""
+    return tr("game.dead_zone.mark", " ☠️ ОПАСНАЯ ЗОНА") if in_dead_zone(planet, dead_zones) else ""
+
+
+def print_itinerary(state, itinerary):
+    """Показать многодневный план по этапам"""
+    dead_zones = get_dead_zones(state)
+    for leg in itinerary.legs:
+        if leg.day == 0:
+            day = tr("game.itinerary.today", "Сегодня")
+        else:
+            day = tr("game.itinerary.day", "День {day}", day=state.day + leg.day)
+        danger = ""
+        if any(in_dead_zone(p, dead_zones) for p in leg.path[1:]):
+            danger = tr("game.dead_zone.through", " ☠️ через опасную зону")
+        print(tr(
+            "game.itinerary.leg", "  {day}: {path} ({fuel} топлива){danger}",
+            day=day, path=" -> ".join(leg.path), fuel=leg.fuel, danger=danger
+        ))
 
 
 def dead_zone_check(state, planet):
@@ -259,140 +413,189 @@ def dead_zone_check(state, planet):
     if planet == "Меза" and state.flags.get("meza_invasion") and not state.flags.get("dead_zone_Меза_cleared"): # flag cleared checking assumption
          # Assuming death unless specific condition... user logic was simple previously
          if state.flags.get("dead_zone_Меза"):
-             print_slow("\nВнезапно ваш корабль окружают неизвестные объекты...")
-             state.die("Уничтожен пришельцами в системе Меза")
+             print_slow("\n" + tr("game.dead_zone.meza", "Внезапно ваш корабль окружают неизвестные объекты..."))
+             state.die(tr("game.dead_zone.meza_death", "Уничтожен пришельцами в системе Меза"))
 
     if planet == "Вода" and state.flags.get("voda_alert_1995"):
          if state.flags.get("dead_zone_Вода"):
-             print_slow("\nГигантский робот замечает ваш корабль...")
-             state.die("Уничтожен во время инцидента на планете Вода")
+             print_slow("\n" + tr("game.dead_zone.voda", "Гигантский робот замечает ваш корабль..."))
+             state.die(tr("game.dead_zone.voda_death", "Уничтожен во время инцидента на планете Вода"))
 
 
 def manage_ship(state):
     """Управление кораблём"""
-    print_slow("\n[Функция в разработке]")
+    print()
+    state.ship.show_status()
+
+    print("\n" + tr("game.scan.title", "=== СКАНЕР ==="))
+    print("\n".join(scan_report(state)))
     # TODO: Добавить управление модулями корабля
+    input("\n" + tr("menu.press_enter", "[Нажмите Enter для продолжения]"))
 
 
 def show_status(state):
     """Показать статус игрока"""
-    print("\n=== СТАТУС ===")
-    print(f"День: {state.day}")
-    print(f"Кредиты: {state.money}")
-    print(f"Планета: {state.current_planet}")
-    print("\nРепутация:")
+    print("\n" + tr("game.status.title", "=== СТАТУС ==="))
+    print(tr("game.status.day", "День: {day}", day=state.day))
+    print(tr("game.status.money", "Кредиты: {money}", money=state.money))
+    print(tr("game.status.planet", "Планета: {planet}", planet=state.current_planet))
+    print("\n" + tr("game.status.reputation", "Репутация:"))
     for faction, rep in state.reputation.items():
         print(f"  {faction}: {rep}")
 
     if state.cargo:
-        print("\nГруз:")
+        print("\n" + tr("game.status.cargo", "Груз:"))
         for item in state.cargo:
             print(f"  - {item}")
 
-    input("\n[Нажмите Enter для продолжения]")
+    if state.orders:
+        print("\n" + tr(
+            "game.status.orders", "Заказы (трюм: {load}/{capacity}):",
+            load=state.cargo_load(), capacity=state.ship.cargo.capacity
+        ))
+        for order in state.orders:
+            if order.picked_up:
+                where = tr("game.status.on_board", "на борту")
+            else:
+                where = tr("game.status.pickup_at", "забрать: {planet}", planet=order.origin)
+            deadline = ""
+            if order.deadline:
+                deadline = tr("game.status.deadline", ", до дня {day}", day=order.deadline)
+            print(f"  - {order.cargo_name} -> {order.destination} ({where}{deadline})")
+        print_delivery_plan(state, plan_deliveries(state))
+
+    input("\n" + tr("menu.press_enter", "[Нажмите Enter для продолжения]"))
 
 
 
 def show_map(state):
     """Показать карту галактики"""
-    print("\n=== КАРТА ГАЛАКТИКИ ===")
-    for planet, neighbors in GALAXY_GRAPH.items():
-        prefix = "📍 " if planet == state.current_planet else "   "
-        print(f"{prefix}{planet}")
-        for neighbor, dist in neighbors.items():
-             print(f"      -> {neighbor}: {dist}")
-    input("\n[Нажмите Enter для продолжения]")
+    print("\n" + tr("game.map.title", "=== КАРТА ГАЛАКТИКИ ==="))
+    print("\n".join(render_map(state)))
+    input("\n" + tr("menu.press_enter", "[Нажмите Enter для продолжения]"))
+
+
+def render_map(state):
+    """Строки карты галактики (без вывода на экран): окно вокруг игрока и соседи"""
+    lines = render_viewport(state)
+    lines.append(f"\n📍 {state.current_planet}")
+    for neighbor, dist in GALAXY_GRAPH[state.current_planet].items():
+        lines.append(f"      -> {neighbor}: {dist}")
+    return lines
 
 
 def plan_route(state):
     """Интерактивный планировщик маршрутов"""
-    print("\n=== ПРОЛОЖИТЬ МАРШРУТ ===")
-    print("Куда летим?")
+    print("\n" + tr("game.route.title", "=== ПРОЛОЖИТЬ МАРШРУТ ==="))
+    print(tr("game.route.where", "Куда летим?"))
     
     available = [p for p in GALAXY_GRAPH.keys() if p != state.current_planet]
-    for i, planet in enumerate(available, 1):
-        print(f"{i}. {planet}")
-    print(f"{len(available) + 1}. Отмена")
+    dead_zones = get_dead_zones(state)
+    tree = get_paths_from(state.current_planet, dead_zones)
+
+    next_stop = show_next_stop(state)
+
+    print_destinations(available, tree, dead_zones)
 
     try:
         choice = int(input("> ").strip())
         if choice == len(available) + 1:
             return
 
+        if choice == 0 and next_stop:
+            choice = available.index(next_stop) + 1
+
         if 1 <= choice <= len(available):
             destination = available[choice - 1]
-            path, dist = get_path(state.current_planet, destination)
+            path = tree.path_to(destination) if tree else None
             
             if not path:
-                print_slow("Нет доступного маршрута.")
+                print_slow(tr("game.route.no_route", "Нет доступного маршрута."))
                 return
 
-            # Расчет стоимости
-            engine_level = state.ship.engine.level
-            fuel_cost = int(dist * 0.5 * (1 + (engine_level * 0.2)))
-            ap_cost = int(len(path) - 1) * int(25 / engine_level) # Примерный расчет по сегментам?
-            # В travel_to_planet ap_cost считается за *перелет*. 
-            # Но подождите, в travel_to_planet ap_cost считается ОДИН раз за весь вызов travel_to_planet.
-            # А travel_to_planet летит по сегментам.
-            # Давайте посмотрим travel_to_planet.
-            # Там ap_cost = 25 / level. И это вычитается ОДИН раз.
-            # Значит и здесь должно быть так же.
-            ap_cost = int(25 / engine_level)
-
-            days = 1
-            if ap_cost > 100: 
-                # Если стоимость больше 100 за раз (невозможно при нынешнем балансе),
-                # но если бы была...
-                days = (ap_cost // 100) + 1
-            
-            # А если мы хотим показать, что при полете на дальние дистанции
-            # мы можем потратить несколько дней?
-            # Сейчас travel_to_planet делает все за один раз.
-            # Если топлива не хватает, мы останавливаемся.
-            # Пользователь просит показать "Время: 3 дня".
-            # Это подразумевает, что долгий путь занимает время.
-            # Пока у нас мгновенное перемещение, но давайте симулировать,
-            # что если AP > state.action_points, нам придется "ждать".
-            # Но фактически сейчас мы тратим 1 "тик" AP.
-            # Давайте пока оставим "Время: <1 дня" или просто "Время: Мгновенно" 
-            # пока не переделаем систему времени.
-            # А, пользователь просит "Время: 3 дня" для Outer Ring.
-            # Outer Ring далеко.
-            # Похоже пользователь хочет механику длительных путешествий?
-            # Или это просто "флейвор"?
-            # Давайте сделаем флейвор текст "Примерное время в пути".
-            estimated_days = max(1, int(dist / 300)) # Грубая прикидка
+            # Расчет стоимости (AP списываются один раз за вылет, как в perform_travel)
+            costs = get_cost_model(state.ship.engine.level)
+            fuel_cost = costs.route_fuel(path)
+            ap_cost = costs.flight_ap
+
+            # План с ночёвками: сколько дней реально займёт перелёт
+            # с учётом бака и AP текущего корабля
+            itinerary = plan_itinerary(state, destination)
             
-            print(f"\nОптимальный маршрут:")
+            print("\n" + tr("game.route.best", "Оптимальный маршрут:"))
             print(f"{' -> '.join(path)}")
-            print(f"Стоимость: {fuel_cost} топлива") # Уберем "1000", оставим топливо
-            print(f"Энергия: {ap_cost} AP")
-            print(f"Примерное время: {estimated_days} дн.")
+            print(tr("game.route.fuel", "Стоимость: {fuel} топлива", fuel=fuel_cost))
+            print(tr("game.route.ap", "Энергия: {ap} AP", ap=ap_cost))
+            print(tr(
+                "game.route.expected_cost", "Ожидаемая стоимость: {cost:.0f} кр.",
+                cost=route_expected_cost(state, path)
+            ))
+            if itinerary is None:
+                print(tr(
+                    "game.route.time_unreachable",
+                    "Время: недостижимо за {days} дн. (слишком длинные перелёты для бака)",
+                    days=MAX_PLAN_DAYS
+                ))
+            elif itinerary.rest_days == 0:
+                print(tr("game.route.time_today", "Время: сегодня"))
+            else:
+                print(tr(
+                    "game.route.time_days", "Время: {days} дн. (ночёвок: {rests})",
+                    days=itinerary.rest_days + 1, rests=itinerary.rest_days
+                ))
+                print_itinerary(state, itinerary)
+            
+            # Альтернативы: следующие по длине маршруты без повторов планет,
+            # обходы опасных зон — раньше маршрутов через них
+            alternatives = [
+                alt for alt in get_k_shortest_paths(
+                    state.current_planet, destination, ROUTE_ALTERNATIVES + 1, dead_zones
+                )
+                if alt[0] != path
+            ][:ROUTE_ALTERNATIVES]
+
+            # Самый безопасный маршрут (минимум ожидаемой стоимости), если он другой
+            safe_path, _ = get_safest_path(state, destination)
+            if safe_path and safe_path != path:
+                alternatives = [alt for alt in alternatives if alt[0] != safe_path]
+                safe_dist = sum(GALAXY_GRAPH[a][b] for a, b in zip(safe_path, safe_path[1:]))
+                alternatives.insert(0, (safe_path, safe_dist))
+
+            if alternatives:
+                print("\n" + tr("game.route.alternatives", "Альтернативные маршруты:"))
+                for i, (alt_path, alt_dist) in enumerate(alternatives, 2):
+                    alt_fuel = costs.route_fuel(alt_path)
+                    danger = ""
+                    if any(in_dead_zone(planet, dead_zones) for planet in alt_path[1:]):
+                        danger = tr("game.dead_zone.through", " ☠️ через опасную зону")
+                    safe = tr("game.route.safe", " 🛡️ безопасный") if alt_path == safe_path else ""
+                    print(f"{i}. {' -> '.join(alt_path)}{safe}{danger}")
+                    print(tr(
+                        "game.route.alternative_stats",
+                        "   Дистанция: {distance}, топливо: {fuel}, прыжков: {jumps}, ожидаемая стоимость: {cost:.0f} кр.",
+                        distance=alt_dist, fuel=alt_fuel, jumps=len(alt_path) - 1,
+                        cost=route_expected_cost(state, alt_path)
+                    ))
             
-            print("\n[1] Лететь")
-            print("[2] Отменить")
+            print(f"\n[1] {tr('game.route.fly', 'Лететь')}")
+            for i in range(2, len(alternatives) + 2):
+                print(f"[{i}] " + tr("game.route.fly_alternative", "Лететь альтернативным маршрутом {number}", number=i))
+            print(f"[{len(alternatives) + 2}] {tr('menu.cancel', 'Отмена')}")
             
-            if input("> ").strip() == "1":
-                # Запускаем существующую функцию путешествия
-                # Но нам нужно передать выбор... 
-                # travel_to_planet сама спрашивает ввод.
-                # Мы не можем просто вызвать её и заставить лететь туда.
-                # Нам придется дублировать логику или рефакторить travel_to_planet.
-                # Для простоты сейчас, мы можем просто сказать "Используйте меню полета".
-                # НО пользователь просил "[1] Лететь".
-                # Значит нам нужно уметь запускать полет с параметрами.
-                # Рефакторинг travel_to_planet чтобы принимать destination аргумент.
-                # Рефакторинг travel_to_planet чтобы принимать destination аргумент.
+            route_choice = input("> ").strip()
+            if route_choice == "1":
                 perform_travel(state, destination)
+            elif route_choice.isdigit() and 2 <= int(route_choice) <= len(alternatives) + 1:
+                perform_travel(state, destination, alternatives[int(route_choice) - 2][0])
 
     except ValueError:
-        print("Неверный ввод.")
+        print(tr("menu.invalid_input", "Неверный ввод."))
 
 
 def end_day(state):
     """Завершить день"""
     state.next_day()
-    print_slow(f"\nНаступил день {state.day}...")
+    print_slow("\n" + tr("game.day_started", "Наступил день {day}...", day=state.day))
 
     # Здесь можно добавить случайные события
     # check_random_events(state)
@@ -0,0 +1,211 @@
+"""
+Планирование многодневных маршрутов с учётом топлива и очков действий.
+
+Поиск с метками (label-setting) по состояниям (система, день, остаток топлива):
+- перелёт по ребру тратит топливо; первый перелёт дня стоит AP
+- ночёвка (GameState.next_day) заправляет корабль и восстанавливает AP
+Доминируемые метки отбрасываются, поэтому поиск быстр и на больших картах.
+"""
+
+import heapq
+
+from core import map as galaxy_map
+from core.costs import get_cost_model
+
+# Сколько дней вперёд планировать по умолчанию
+MAX_PLAN_DAYS = 7
+
+# Очки действий в начале нового дня (см. GameState.next_day)
+DAILY_ACTION_POINTS = 100
+
+
+class Leg:
+    """Один день пути: вылет и посадка"""
+
+    def __init__(self, day, path, distance, fuel):
+        self.day = day  # Смещение от текущего дня (0 — сегодня)
+        self.path = path
+        self.distance = distance
+        self.fuel = fuel
+
+
+class Itinerary:
+    """Многодневный план перелёта"""
+
+    def __init__(self, legs, rest_days):
+        self.legs = legs
+        self.rest_days = rest_days  # Сколько раз придётся завершить день
+
+    @property
+    def fuel(self):
+        return sum(leg.fuel for leg in self.legs)
+
+    @property
+    def distance(self):
+        return sum(leg.distance for leg in self.legs)
+
+    @property
+    def path(self):
+        """Полный маршрут без повторов на стыках дней"""
+        full = list(self.legs[0].path) if self.legs else []
+        for leg in self.legs[1:]:
+            full.extend(leg.path[1:])
+        return full
+
+
+class _Label:
+    """Метка поиска: как и когда мы оказались в системе"""
+
+    __slots__ = ("node", "day", "fuel_used", "fuel_left", "flying", "can_fly", "parent")
+
+    def __init__(self, node, day, fuel_used, fuel_left, flying, can_fly, parent):
+        self.node = node
+        self.day = day
+        self.fuel_used = fuel_used
+        self.fuel_left = fuel_left
+        self.flying = flying    # Сегодняшний вылет уже оплачен AP
+        self.can_fly = can_fly  # Можно лететь дальше сегодня
+        self.parent = parent
+
+    def dominated_by(self, other):
+        """other не хуже ни по одному критерию и ресурсу"""
+        return (
+            other.day <= self.day
+            and other.fuel_used <= self.fuel_used
+            and other.fuel_left >= self.fuel_left
+            and other.can_fly >= self.can_fly
+        )
+
+
+def find_itinerary(start, end, fuel, max_fuel, action_points, engine_level,
+                   max_days=MAX_PLAN_DAYS, avoid=()):
+    """
+    Найти самый дешёвый выполнимый план: сначала минимум дней, затем топлива.
+
+    Args:
+        start, end: планеты
+        fuel: топливо в баке сейчас
+        max_fuel: объём бака (после ночёвки)
+        action_points: AP, оставшиеся на сегодня
+        engine_level: уровень двигателя
+        max_days: горизонт планирования (число ночёвок)
+        avoid: id планет, через которые нельзя пролетать (сама цель допустима)
+
+    Returns:
+        Itinerary или None, если долететь нельзя
+    """
+    graph = galaxy_map.get_compiled_graph()
+    source = graph.node_id(start)
+    target = graph.node_id(end)
+    if source is None or target is None:
+        return None
+    if source == target:
+        return Itinerary([], 0)
+
+    costs = get_cost_model(engine_level)
+    ap_cost = costs.flight_ap
+    offsets = graph.offsets
+    targets = graph.targets
+    edge_fuel = costs.edge_fuel.tolist()
+    avoided = set(avoid) - {target}
+
+    start_label = _Label(source, 0, 0, fuel, False, action_points >= ap_cost, None)
+    # Парето-множества неподчинённых меток по системам
+    settled = {}
+    counter = 0
+    heap = [(0, 0, counter, start_label)]
+
+    while heap:
+        _, _, _, label = heapq.heappop(heap)
+        node = label.node
+
+        pareto = settled.setdefault(node, [])
+        if any(label.dominated_by(other) for other in pareto):
+            continue
+        pareto.append(label)
+
+        if node == target:
+            return _build_itinerary(graph, label)
+
+        # Продолжить полёт по соседним системам
+        if label.can_fly:
+            for k in range(offsets[node], offsets[node + 1]):
+                cost = edge_fuel[k]
+                if cost > label.fuel_left or targets[k] in avoided:
+                    continue
+                nxt = _Label(
+                    targets[k], label.day, label.fuel_used + cost,
+                    label.fuel_left - cost, True, True, label
+                )
+                counter += 1
+                heapq.heappush(heap, (nxt.day, nxt.fuel_used, counter, nxt))
+
+        # Заночевать: заправка и новые AP
+        if label.day < max_days and (label.flying or label.parent is None):
+            rested = _Label(
+                node, label.day + 1, label.fuel_used, max_fuel,
+                False, DAILY_ACTION_POINTS >= ap_cost, label
+            )
+            counter += 1
+            heapq.heappush(heap, (rested.day, rested.fuel_used, counter, rested))
+
+    return None
+
+
+def _build_itinerary(graph, label):
+    """Восстановить план по цепочке меток"""
+    chain = []
+    while label is not None:
+        chain.append(label)
+        label = label.parent
+    chain.reverse()
+
+    legs = []
+    current = None
+    for prev, label in zip(chain, chain[1:]):
+        if label.day != prev.day:
+            # Ночёвка: текущий этап закончен
+            if current:
+                legs.append(current)
+            current = None
+            continue
+
+        if current is None:
+            current = Leg(label.day, [graph.names[prev.node]], 0, 0)
+        current.path.append(graph.names[label.node])
+        current.distance += graph.edge_weight(prev.node, label.node)
+        current.fuel += label.fuel_used - prev.fuel_used
+
+    if current:
+        legs.append(current)
+
+    return Itinerary(legs, chain[-1].day)
+
+
+def plan_itinerary(state, destination, max_days=MAX_PLAN_DAYS):
+    """
+    Спланировать перелёт для текущего корабля и состояния игрока.
+    Опасные зоны обходятся; в режиме штрафа через них летим,
+    только если иначе не добраться.
+    """
+    ship = state.ship
+    dead_zones = galaxy_map.get_dead_zones(state)
+
+    def search(avoid):
+        return find_itinerary(
+            state.current_planet, destination,
+            fuel=ship.fuel,
+            max_fuel=ship.max_fuel,
+            action_points=state.action_points,
+            engine_level=ship.engine.level,
+            max_days=max_days,
+            avoid=avoid
+        )
+
+    if galaxy_map.DEAD_ZONE_MODE == galaxy_map.DEAD_ZONE_BLOCK and galaxy_map.planet_id(destination) in dead_zones:
+        return None
+
+    itinerary = search(dead_zones)
+    if itinerary is None and dead_zones and galaxy_map.DEAD_ZONE_MODE == galaxy_map.DEAD_ZONE_PENALTY:
+        itinerary = search(())
+    return itinerary
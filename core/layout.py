@@ -0,0 +1,411 @@
+"""
+Раскладка карты Галактики на плоскости и графическая отрисовка.
+
+Позиции систем считаются силовым алгоритмом (Фрюхтерман — Рейнгольд):
+соседние системы притягиваются, все остальные отталкиваются.
+С NumPy итерация считается целиком над массивами, без него — в чистом Python.
+
+Раскладка сохраняется в data/cache/layout_<отпечаток карты>.json,
+поэтому для одной карты считается один раз; повторное открытие карты
+берёт позиции из памяти или с диска.
+
+Отрисовка — окно (viewport) вокруг корабля игрока: системы, рёбра
+псевдографикой и пометки опасных зон и точек заказов.
+"""
+
+import json
+import math
+import os
+import random
+
+from core import map as galaxy_map
+from utils.i18n import tr
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен
+    np = None
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cache")
+
+LAYOUT_FORMAT_VERSION = 1
+
+# Число итераций силового алгоритма (на больших картах — меньше, см. ниже)
+LAYOUT_ITERATIONS = 150
+LAYOUT_MIN_ITERATIONS = 10
+
+# До этого размера отталкивание считается между всеми парами систем,
+# на больших картах — от случайной выборки систем на каждой итерации
+LAYOUT_PAIRWISE_MAX_SYSTEMS = {"numpy": 1000, "python": 300}
+LAYOUT_REPULSION_SAMPLE = {"numpy": 64, "python": 32}
+
+# Бюджет попарных взаимодействий на всю раскладку: итерации урезаются,
+# чтобы раскладка огромной карты считалась секунды, а не часы
+LAYOUT_WORK_BUDGET = {"numpy": 3e8, "python": 5e6}
+
+# Сколько попарных разностей держать в памяти за раз (NumPy)
+LAYOUT_CHUNK_PAIRS = 2_000_000
+
+# Размер окна карты в символах
+VIEWPORT_WIDTH = 64
+VIEWPORT_HEIGHT = 20
+
+# Сколько клеток холста приходится на sqrt(числа систем) по каждой оси
+# (символы терминала примерно вдвое выше, чем шире)
+CELLS_PER_SYSTEM_X = 14
+CELLS_PER_SYSTEM_Y = 6
+
+# Символы карты
+PLAYER_MARK = "@"
+PLANET_MARK = "o"
+DEAD_ZONE_MARK = "X"
+ORDER_MARK = "*"
+
+# Раскладка текущей карты в памяти: (версия графа, Layout)
+_layout_cache = None
+
+
+class Layout:
+    """Позиции систем в квадрате [0, 1] x [0, 1] (индекс — id планеты)"""
+
+    def __init__(self, fingerprint, positions):
+        self.fingerprint = fingerprint
+        self.positions = positions
+        self._grids = {}
+
+    def to_dict(self):
+        return {
+            "format": LAYOUT_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "positions": [[round(x, 5), round(y, 5)] for x, y in self.positions],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["fingerprint"], [tuple(p) for p in data["positions"]])
+
+    def grid(self, width, height):
+        """
+        Клетки холста width x height для каждой системы и корзины по блокам
+        окна — чтобы отрисовка перебирала только системы рядом с окном.
+        """
+        key = (width, height)
+        if key not in self._grids:
+            cells = [
+                (int(x * (width - 1)), int(y * (height - 1)))
+                for x, y in self.positions
+            ]
+            buckets = {}
+            for node, (cx, cy) in enumerate(cells):
+                block = (cx // VIEWPORT_WIDTH, cy // VIEWPORT_HEIGHT)
+                buckets.setdefault(block, []).append(node)
+            self._grids[key] = (cells, buckets)
+        return self._grids[key]
+
+
+def compute_layout(graph, iterations=None, seed=0):
+    """
+    Силовая раскладка графа.
+
+    Args:
+        graph: CompiledGraph
+        iterations: число итераций (по умолчанию — по бюджету работы)
+        seed: зерно начальных позиций
+
+    Returns:
+        list[(x, y)]: позиции систем, нормированные в [0, 1]
+    """
+    n = len(graph)
+    if n == 0:
+        return []
+    if n == 1:
+        return [(0.5, 0.5)]
+
+    backend = "numpy" if np is not None else "python"
+    sample = n if n <= LAYOUT_PAIRWISE_MAX_SYSTEMS[backend] else LAYOUT_REPULSION_SAMPLE[backend]
+    if iterations is None:
+        iterations = int(LAYOUT_WORK_BUDGET[backend] / (n * sample))
+        iterations = max(LAYOUT_MIN_ITERATIONS, min(LAYOUT_ITERATIONS, iterations))
+
+    if np is not None:
+        positions = _layout_numpy(graph, iterations, sample, seed)
+    else:
+        positions = _layout_python(graph, iterations, sample, seed)
+    return _normalize(positions)
+
+
+def _layout_numpy(graph, iterations, sample, seed):
+    """Итерации силового алгоритма над массивами NumPy"""
+    n = len(graph)
+    rng = np.random.default_rng(seed)
+    pos = rng.random((n, 2))
+    k = 1.0 / math.sqrt(n)
+    chunk = max(1, LAYOUT_CHUNK_PAIRS // sample)
+
+    offsets = np.frombuffer(graph.offsets, dtype=graph.offsets.typecode)
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    targets = np.frombuffer(graph.targets, dtype=graph.targets.typecode).astype(np.int64)
+
+    temperature = 0.1
+    cooling = temperature / max(1, iterations)
+    for _ in range(iterations):
+        # Отталкивание k^2 / d от всех систем (или от выборки), по частям
+        if sample >= n:
+            others = pos
+        else:
+            others = pos[rng.choice(n, sample, replace=False)]
+        scale = n / len(others)
+        disp = np.empty_like(pos)
+        for start in range(0, n, chunk):
+            delta = pos[start:start + chunk, None, :] - others[None, :, :]
+            dist2 = (delta ** 2).sum(axis=-1) + 1e-9
+            disp[start:start + chunk] = (delta * (k * k / dist2)[..., None]).sum(axis=1) * scale
+
+        # Притяжение d^2 / k вдоль рёбер (каждое ребро хранится в обе стороны)
+        edge = pos[sources] - pos[targets]
+        length = np.sqrt((edge ** 2).sum(axis=-1))[:, None]
+        np.add.at(disp, sources, -edge * length / k)
+
+        # Сдвиг не больше текущей «температуры»
+        norm = np.sqrt((disp ** 2).sum(axis=-1))[:, None] + 1e-9
+        pos += disp / norm * np.minimum(norm, temperature)
+        temperature -= cooling
+
+    return [tuple(p) for p in pos.tolist()]
+
+
+def _layout_python(graph, iterations, sample, seed):
+    """Тот же алгоритм без NumPy"""
+    n = len(graph)
+    rng = random.Random(seed)
+    pos = [[rng.random(), rng.random()] for _ in range(n)]
+    k = 1.0 / math.sqrt(n)
+    offsets = graph.offsets
+    targets = graph.targets
+
+    temperature = 0.1
+    cooling = temperature / max(1, iterations)
+    for _ in range(iterations):
+        others = range(n) if sample >= n else rng.sample(range(n), sample)
+        scale = n / len(others)
+
+        disp = [[0.0, 0.0] for _ in range(n)]
+        for u in range(n):
+            ux, uy = pos[u]
+            fx = fy = 0.0
+            for v in others:
+                dx = ux - pos[v][0]
+                dy = uy - pos[v][1]
+                force = k * k / (dx * dx + dy * dy + 1e-9)
+                fx += dx * force
+                fy += dy * force
+            fx *= scale
+            fy *= scale
+
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                dx = ux - pos[v][0]
+                dy = uy - pos[v][1]
+                length = math.sqrt(dx * dx + dy * dy)
+                fx -= dx * length / k
+                fy -= dy * length / k
+            disp[u][0] = fx
+            disp[u][1] = fy
+
+        for u in range(n):
+            fx, fy = disp[u]
+            norm = math.sqrt(fx * fx + fy * fy) + 1e-9
+            step = min(norm, temperature) / norm
+            pos[u][0] += fx * step
+            pos[u][1] += fy * step
+        temperature -= cooling
+
+    return [tuple(p) for p in pos]
+
+
+def _normalize(positions):
+    """Вписать позиции в квадрат [0, 1] с сохранением пропорций"""
+    xs = [x for x, _ in positions]
+    ys = [y for _, y in positions]
+    min_x, min_y = min(xs), min(ys)
+    span = max(max(xs) - min_x, max(ys) - min_y) or 1.0
+    return [((x - min_x) / span, (y - min_y) / span) for x, y in positions]
+
+
+def layout_path(fingerprint):
+    """Путь к файлу раскладки для карты с данным отпечатком"""
+    return os.path.join(CACHE_DIR, f"layout_{fingerprint}.json")
+
+
+def save_layout(layout, path=None):
+    """Сохранить раскладку на диск"""
+    path = path or layout_path(layout.fingerprint)
+    dir_path = os.path.dirname(path)
+    if dir_path and not os.path.exists(dir_path):
+        os.makedirs(dir_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(layout.to_dict(), f, separators=(",", ":"))
+    return path
+
+
+def load_layout(fingerprint, size, path=None):
+    """Загрузить раскладку с диска или None, если её нет или она устарела"""
+    path = path or layout_path(fingerprint)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if data.get("format") != LAYOUT_FORMAT_VERSION or data.get("fingerprint") != fingerprint:
+        return None
+    if len(data.get("positions", ())) != size:
+        return None
+    return Layout.from_dict(data)
+
+
+def get_layout():
+    """Раскладка текущей карты: из памяти, с диска или посчитать и сохранить"""
+    global _layout_cache
+    version = galaxy_map.graph_version()
+    if _layout_cache is not None and _layout_cache[0] == version:
+        return _layout_cache[1]
+
+    graph = galaxy_map.get_compiled_graph()
+    fingerprint = galaxy_map.graph_fingerprint()
+    layout = load_layout(fingerprint, len(graph))
+    if layout is None:
+        layout = Layout(fingerprint, compute_layout(graph))
+        try:
+            save_layout(layout)
+        except OSError as e:
+            print(f"[ОШИБКА] Не удалось сохранить раскладку карты: {e}")
+
+    _layout_cache = (version, layout)
+    return layout
+
+
+def _canvas_size(n):
+    """Размер холста всей карты в символах"""
+    side = math.sqrt(n)
+    return (
+        max(VIEWPORT_WIDTH, int(side * CELLS_PER_SYSTEM_X)),
+        max(VIEWPORT_HEIGHT, int(side * CELLS_PER_SYSTEM_Y)),
+    )
+
+
+def _edge_char(dx, dy):
+    """Символ псевдографики для направления отрезка"""
+    if dy == 0 or abs(dx) > 2 * abs(dy):
+        return "─"
+    if dx == 0 or abs(dy) > 2 * abs(dx):
+        return "│"
+    return "╲" if (dx > 0) == (dy > 0) else "╱"
+
+
+def _draw_line(canvas, x0, y0, x1, y1, left, top, width, height):
+    """Отрезок по Брезенхэму с отсечением по окну"""
+    char = _edge_char(x1 - x0, y1 - y0)
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    x, y = x0, y0
+    while True:
+        col, row = x - left, y - top
+        if 0 <= col < width and 0 <= row < height and canvas[row][col] == " ":
+            canvas[row][col] = char
+        if x == x1 and y == y1:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x += sx
+        if e2 <= dx:
+            err += dx
+            y += sy
+
+
+def render_viewport(state, width=VIEWPORT_WIDTH, height=VIEWPORT_HEIGHT):
+    """
+    Окно карты вокруг корабля игрока.
+
+    Returns:
+        list[str]: строки окна (рамка, карта и легенда)
+    """
+    graph = galaxy_map.get_compiled_graph()
+    layout = get_layout()
+    canvas_w, canvas_h = _canvas_size(len(graph))
+    cells, buckets = layout.grid(canvas_w, canvas_h)
+
+    # Окно с центром на игроке, прижатое к краям холста
+    px, py = cells[state.planet_id]
+    left = min(max(0, px - width // 2), max(0, canvas_w - width))
+    top = min(max(0, py - height // 2), max(0, canvas_h - height))
+
+    # Системы в окне и в соседних блоках (для рёбер, уходящих за край)
+    first_bx, first_by = left // VIEWPORT_WIDTH - 1, top // VIEWPORT_HEIGHT - 1
+    nearby = []
+    for bx in range(first_bx, first_bx + 4):
+        for by in range(first_by, first_by + 4):
+            nearby.extend(buckets.get((bx, by), ()))
+
+    canvas = [[" "] * width for _ in range(height)]
+    offsets = graph.offsets
+    targets = graph.targets
+    for u in nearby:
+        ux, uy = cells[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            vx, vy = cells[v]
+            _draw_line(canvas, ux, uy, vx, vy, left, top, width, height)
+
+    order_stops = set()
+    for order in state.orders:
+        if not order.picked_up:
+            order_stops.add(order.origin_id)
+        order_stops.add(order.destination_id)
+
+    visible = []
+    for u in nearby:
+        col, row = cells[u][0] - left, cells[u][1] - top
+        if not (0 <= col < width and 0 <= row < height):
+            continue
+        if u == state.planet_id:
+            mark = PLAYER_MARK
+        elif u in state.dead_zones:
+            mark = DEAD_ZONE_MARK
+        elif u in order_stops:
+            mark = ORDER_MARK
+        else:
+            mark = PLANET_MARK
+        canvas[row][col] = mark
+        visible.append((u, col, row))
+
+    # Подписи справа от систем, если есть место
+    for u, col, row in sorted(visible, key=lambda item: item[0] != state.planet_id):
+        label = graph.names[u]
+        start = col + 2
+        end = min(width, start + len(label))
+        if start >= width:
+            continue
+        if all(canvas[row][c] in " ─│╱╲" for c in range(start - 1, end)):
+            for i, c in enumerate(range(start, end)):
+                canvas[row][c] = label[i]
+
+    border = "─" * width
+    lines = [f"┌{border}┐"]
+    lines.extend(f"│{''.join(row)}│" for row in canvas)
+    lines.append(f"└{border}┘")
+    lines.append(tr(
+        "game.map.legend",
+        "{player} вы  {planet} система  {dead_zone} опасная зона  "
+        "{order} точка заказа   (систем в окне: {visible} из {total})",
+        player=PLAYER_MARK, planet=PLANET_MARK, dead_zone=DEAD_ZONE_MARK,
+        order=ORDER_MARK, visible=len(visible), total=len(graph)
+    ))
+    return lines
@@ -2,6 +2,16 @@
 Карта Галактики и навигация.
 """
 
+import hashlib
+import json
+
+from core.flags import register_flag_family
+from core.planets import PlanetRegistry
+from core.routing import (
+    CompiledGraph, RouteTable, ShortestPathTree, DynamicShortestPathTree,
+    INF, dijkstra, extract_path, k_shortest_paths
+)
+
 # Граф Галактики
 # Ключ: планета
 # Значение: словарь {сосед: расстояние}
@@ -57,60 +67,319 @@ GALAXY_GRAPH = {
 }
 
 
-def get_path(start, end, max_dist=None):
+# Таблица всех пар строится только для карт не больше этого размера,
+# на больших картах путь ищется Дейкстрой по запросу
+ROUTE_TABLE_MAX_SYSTEMS = 500
+
+# Сколько таблиц (по разным наборам опасных зон) держать одновременно
+ROUTE_TABLE_CACHE_SIZE = 4
+
+# Как маршрутизация обходится с опасными зонами (флаги dead_zone_<планета>):
+# DEAD_ZONE_BLOCK — через них не летаем вовсе (и не летаем в них),
+# DEAD_ZONE_PENALTY — летаем только если обойти нельзя
+DEAD_ZONE_BLOCK = "block"
+DEAD_ZONE_PENALTY = "penalty"
+DEAD_ZONE_MODE = DEAD_ZONE_PENALTY
+
+# Штраф за вход в опасную зону в режиме DEAD_ZONE_PENALTY (единицы дистанции)
+DEAD_ZONE_PENALTY_DISTANCE = 100000
+
+# Сколько деревьев кратчайших путей (по источникам) держать для починки
+DYNAMIC_TREE_CACHE_SIZE = 32
+
+# Префикс сюжетных флагов опасных зон: dead_zone_<планета>
+DEAD_ZONE_FLAG_PREFIX = "dead_zone_"
+
+# Семейство флагов опасных зон (ключ — имя планеты текущей карты)
+DEAD_ZONE_FLAGS = register_flag_family(
+    DEAD_ZONE_FLAG_PREFIX, is_member=lambda name: name in get_planet_registry()
+)
+
+# Реестр планет текущей карты (id планеты = индекс вершины графа)
+_planet_registry = None
+
+# Скомпилированная версия GALAXY_GRAPH (строится лениво)
+_compiled_graph = None
+_graph_version = 0
+
+# Таблицы маршрутов текущей версии графа: {frozenset(blocked ids): RouteTable}
+_route_tables = {}
+
+# Деревья с учётом опасных зон: {источник: (DynamicShortestPathTree, опасные зоны)}
+_dynamic_trees = {}
+
+# Графы со штрафами опасных зон для поиска альтернатив: {(опасные зоны, штраф): CompiledGraph}
+_penalized_graphs = {}
+
+# Опциональная иерархия сжатия для больших карт
+_use_contraction_hierarchy = False
+_hierarchy = None
+_fingerprint = None
+
+
+def get_planet_registry():
+    """Реестр планет текущей карты (строится лениво)"""
+    global _planet_registry
+    if _planet_registry is None:
+        _planet_registry = PlanetRegistry(GALAXY_GRAPH.keys())
+    return _planet_registry
+
+
+def planet_id(name):
+    """id планеты по имени или None"""
+    return get_planet_registry().id(name)
+
+
+def planet_name(planet_id):
+    """Имя планеты по id"""
+    return get_planet_registry().name(planet_id)
+
+
+def get_compiled_graph():
+    """Получить CSR-представление текущего графа Галактики"""
+    global _compiled_graph
+    if _compiled_graph is None:
+        _compiled_graph = CompiledGraph(GALAXY_GRAPH, get_planet_registry())
+    return _compiled_graph
+
+
+def graph_version():
+    """Номер версии графа — меняется при каждой замене карты"""
+    return _graph_version
+
+
+def set_galaxy_graph(graph):
+    """
+    Заменить карту Галактики.
+    Словарь GALAXY_GRAPH обновляется на месте, чтобы импортированные
+    ссылки на него оставались актуальными.
+    """
+    GALAXY_GRAPH.clear()
+    GALAXY_GRAPH.update(graph)
+    invalidate_graph()
+
+
+def invalidate_graph():
+    """Сбросить кэши маршрутизации после изменения GALAXY_GRAPH"""
+    global _planet_registry, _compiled_graph, _graph_version, _hierarchy, _fingerprint
+    _planet_registry = None
+    _compiled_graph = None
+    _graph_version += 1
+    _route_tables.clear()
+    _dynamic_trees.clear()
+    _penalized_graphs.clear()
+    _hierarchy = None
+    _fingerprint = None
+
+
+def graph_fingerprint():
+    """Отпечаток содержимого карты — ключ для индексов, сохранённых на диск"""
+    global _fingerprint
+    if _fingerprint is None:
+        raw = json.dumps(GALAXY_GRAPH, ensure_ascii=False).encode("utf-8")
+        _fingerprint = hashlib.sha1(raw).hexdigest()[:16]
+    return _fingerprint
+
+
+def enable_contraction_hierarchy(enabled=True):
+    """
+    Включить иерархию сжатия для карт больше ROUTE_TABLE_MAX_SYSTEMS.
+    Индекс загружается с диска (или строится и сохраняется) при первом запросе.
+    """
+    global _use_contraction_hierarchy
+    _use_contraction_hierarchy = enabled
+
+
+def get_hierarchy():
+    """Иерархия сжатия для текущей карты (загружается или строится лениво)"""
+    global _hierarchy
+    if _hierarchy is None:
+        from core.contraction import load_or_build_hierarchy
+        _hierarchy = load_or_build_hierarchy(get_compiled_graph(), graph_fingerprint())
+    return _hierarchy
+
+
+def get_dead_zones(state):
+    """Опасные зоны игрока: frozenset id планет"""
+    return state.dead_zones
+
+
+def get_route_table(blocked=()):
+    """
+    Получить таблицу всех пар для текущей карты.
+    Таблица строится один раз для версии графа и набора блокированных планет;
+    при смене карты или опасных зон используется (или строится) другая.
+
+    Args:
+        blocked: планеты, через которые нельзя прокладывать маршрут
+    """
+    graph = get_compiled_graph()
+    key = frozenset(graph.index[name] for name in blocked if name in graph.index)
+
+    table = _route_tables.get(key)
+    if table is None:
+        if len(_route_tables) >= ROUTE_TABLE_CACHE_SIZE:
+            _route_tables.pop(next(iter(_route_tables)))
+        table = RouteTable(graph, key)
+        _route_tables[key] = table
+    return table
+
+
+def set_dead_zone_mode(mode):
+    """Выбрать режим обхода опасных зон (DEAD_ZONE_BLOCK или DEAD_ZONE_PENALTY)"""
+    global DEAD_ZONE_MODE
+    if mode not in (DEAD_ZONE_BLOCK, DEAD_ZONE_PENALTY):
+        raise ValueError(f"Неизвестный режим опасных зон: {mode}")
+    DEAD_ZONE_MODE = mode
+    _dynamic_trees.clear()
+
+
+def _dead_zone_penalty():
+    return INF if DEAD_ZONE_MODE == DEAD_ZONE_BLOCK else DEAD_ZONE_PENALTY_DISTANCE
+
+
+def get_path(start, end, max_dist=None, dead_zones=None):
     """
     Найти кратчайший путь от start до end.
-    Использует алгоритм Дейкстры.
+    Использует алгоритм Дейкстры на бинарной куче поверх CSR-графа.
     
     Args:
         start: Начальная планета
         end: Конечная планета
         max_dist: (не используется в базовом поиске, но может быть полезен)
+        dead_zones: id опасных зон (см. get_dead_zones) — обходятся
+                    согласно DEAD_ZONE_MODE
         
     Returns:
         (path, distance): Список планет и общая дистанция. 
                           Если пути нет, возвращает (None, infinity).
     """
-    if start not in GALAXY_GRAPH or end not in GALAXY_GRAPH:
-        return None, float('inf')
-
-    # Инициализация
-    distances = {node: float('inf') for node in GALAXY_GRAPH}
-    distances[start] = 0
-    previous_nodes = {node: None for node in GALAXY_GRAPH}
-    unvisited = list(GALAXY_GRAPH.keys())
-
-    while unvisited:
-        # Выбрать узел с наименьшим расстоянием
-        current_node = min(unvisited, key=lambda node: distances[node])
-        
-        if distances[current_node] == float('inf'):
-            break # Остальные узлы недостижимы
-            
-        if current_node == end:
-            break
-            
-        unvisited.remove(current_node)
-        
-        # Обновить расстояния до соседей
-        for neighbor, weight in GALAXY_GRAPH[current_node].items():
-            possible_new_dist = distances[current_node] + weight
-            if possible_new_dist < distances[neighbor]:
-                distances[neighbor] = possible_new_dist
-                previous_nodes[neighbor] = current_node
-
-    # Восстановление пути
-    path = []
-    current = end
-    if previous_nodes[current] is None and current != start:
-        return None, float('inf') # Путь не найден
-        
-    while current is not None:
-        path.append(current)
-        current = previous_nodes[current]
-        
-    path = path[::-1] # Развернуть
-    return path, distances[end]
+    if dead_zones:
+        tree = get_paths_from(start, dead_zones)
+        path = tree.path_to(end) if tree else None
+        if path is None:
+            return None, INF
+        return path, tree.distance(end)
+
+    graph = get_compiled_graph()
+    path, dist = _find_path(graph, start, end)
+    if path is None:
+        return None, INF # Путь не найден
+
+    return [graph.names[node] for node in path], dist
+
+
+def get_paths_from(source, dead_zones=None):
+    """
+    Построить дерево кратчайших путей от source до всех планет.
+    Один проход Дейкстры вместо отдельного get_path на каждую цель.
+
+    Если передан dead_zones (даже пустой), дерево учитывает опасные зоны
+    и кэшируется: когда набор зон меняется, дерево чинится инкрементально
+    по каждой переключившейся планете, а не строится заново.
+
+    Returns:
+        ShortestPathTree или None, если source нет на карте
+    """
+    graph = get_compiled_graph()
+    node = graph.node_id(source)
+    if node is None:
+        return None
+
+    if dead_zones is None:
+        dist, pred = dijkstra(graph, node)
+        return ShortestPathTree(graph, node, dist, pred)
+
+    dead_zones = frozenset(dead_zones)
+    penalty = _dead_zone_penalty()
+
+    cached = _dynamic_trees.pop(node, None)
+    if cached is None:
+        penalties = [0] * len(graph)
+        for zone in dead_zones:
+            penalties[zone] = penalty
+        tree = DynamicShortestPathTree(graph, node, penalties)
+    else:
+        tree, known_zones = cached
+        for zone in known_zones ^ dead_zones:
+            tree.set_penalty(zone, penalty if zone in dead_zones else 0)
+
+    # Самые свежие деревья — в конце словаря
+    _dynamic_trees[node] = (tree, dead_zones)
+    if len(_dynamic_trees) > DYNAMIC_TREE_CACHE_SIZE:
+        _dynamic_trees.pop(next(iter(_dynamic_trees)))
+    return tree
+
+
+def get_k_shortest_paths(start, end, k=3, dead_zones=None):
+    """
+    Найти до k кратчайших маршрутов без повторения планет.
+
+    Args:
+        dead_zones: id опасных зон (см. get_dead_zones) — маршруты через них
+                    идут после всех обходных (DEAD_ZONE_PENALTY)
+                    или не предлагаются вовсе (DEAD_ZONE_BLOCK)
+
+    Returns:
+        list[(path, distance)]: маршруты по возрастанию стоимости
+                                (пустой список, если пути нет);
+                                distance — реальная длина, без штрафов
+    """
+    graph = get_compiled_graph()
+    source = graph.node_id(start)
+    target = graph.node_id(end)
+    if source is None or target is None:
+        return []
+
+    search = _penalized_graph(graph, dead_zones) if dead_zones else graph
+    routes = []
+    for path, _ in k_shortest_paths(search, source, target, k):
+        dist = sum(graph.edge_weight(a, b) for a, b in zip(path, path[1:]))
+        routes.append(([graph.names[node] for node in path], dist))
+    return routes
+
+
+def _penalized_graph(graph, dead_zones):
+    """Граф, в котором вход в опасную зону стоит длина ребра + штраф"""
+    penalty = _dead_zone_penalty()
+    key = (frozenset(dead_zones), penalty)
+    search = _penalized_graphs.pop(key, None)
+    if search is None:
+        targets = graph.targets
+        search = graph.with_weights([
+            w + penalty if targets[k] in key[0] else w
+            for k, w in enumerate(graph.weights)
+        ])
+
+    # Самые свежие графы — в конце словаря
+    _penalized_graphs[key] = search
+    if len(_penalized_graphs) > ROUTE_TABLE_CACHE_SIZE:
+        _penalized_graphs.pop(next(iter(_penalized_graphs)))
+    return search
+
+
+def _find_path(graph, start, end):
+    """Кратчайший путь в индексах вершин: (path, distance) или (None, inf)"""
+    source = graph.node_id(start)
+    target = graph.node_id(end)
+    if source is None or target is None:
+        return None, INF
+
+    if len(graph) <= ROUTE_TABLE_MAX_SYSTEMS:
+        table = get_route_table()
+        path = table.path(source, target)
+        if path is None:
+            return None, INF
+        return path, table.distance(source, target)
+
+    if _use_contraction_hierarchy:
+        return get_hierarchy().query(source, target)
+
+    dist, pred = dijkstra(graph, source, target)
+    path = extract_path(pred, source, target)
+    if path is None:
+        return None, INF
+    return path, dist[target]
 
 
 def get_max_reachable_path(start, end, max_fuel):
@@ -130,25 +399,25 @@ def get_max_reachable_path(start, end, max_fuel):
         - distance: затраченное расстояние
         - reached_target: bool (достигли ли цели)
     """
-    full_path, full_dist = get_path(start, end)
+    graph = get_compiled_graph()
+    full_path, full_dist = _find_path(graph, start, end)
     
     if not full_path:
         return None, 0, False
-        
+
+    names = graph.names
     if full_dist <= max_fuel:
-        return full_path, full_dist, True
+        return [names[node] for node in full_path], full_dist, True
         
     # Если не хватает топлива на полный путь, идем сколько сможем
     current_fuel = 0
     reachable_path = [start]
     
     for i in range(len(full_path) - 1):
-        u = full_path[i]
-        v = full_path[i+1]
-        dist = GALAXY_GRAPH[u][v]
+        dist = graph.edge_weight(full_path[i], full_path[i+1])
         
         if current_fuel + dist <= max_fuel:
-            reachable_path.append(v)
+            reachable_path.append(names[full_path[i+1]])
             current_fuel += dist
         else:
             break
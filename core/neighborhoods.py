@@ -0,0 +1,205 @@
+"""
+Окрестности систем для сканера корабля.
+
+Сканер уровня N видит системы не дальше N прыжков или
+N * SCAN_DISTANCE_PER_LEVEL единиц дистанции от корабля.
+Окрестности всех систем для уровня сканера считаются один раз
+на версию карты, после чего «что видно отсюда» — просто поиск в таблице.
+"""
+
+import heapq
+from collections import deque
+
+from core import map as galaxy_map
+from core.encounters import POLICE_ENCOUNTER_CHANCE, onboard_contraband
+from core.routing import INF
+from utils.i18n import tr
+
+
+# Дальность сканирования по дистанции на один уровень сканера
+SCAN_DISTANCE_PER_LEVEL = 150
+
+# На картах больше этого размера окрестности считаются по запросу
+# (и запоминаются), а не сразу для всех систем
+NEIGHBORHOOD_PRECOMPUTE_MAX_SYSTEMS = 500
+
+# Индексы окрестностей: {(версия графа, уровень сканера): NeighborhoodIndex}
+_indexes = {}
+
+
+class Neighborhood:
+    """Системы в зоне видимости одной системы"""
+
+    def __init__(self, center, entries):
+        self.center = center
+        # (id планеты, прыжков или None, дистанция или None), ближние — первыми
+        self.entries = entries
+        self._ids = frozenset(planet for planet, _, _ in entries)
+
+    @property
+    def planet_ids(self):
+        return [planet for planet, _, _ in self.entries]
+
+    def __contains__(self, planet_id):
+        return planet_id in self._ids
+
+
+class NeighborhoodIndex:
+    """Окрестности всех систем карты для одного уровня сканера"""
+
+    def __init__(self, graph, hops, radius):
+        self.graph = graph
+        self.hops = hops
+        self.radius = radius
+        self._balls = [None] * len(graph)
+
+    def precompute(self):
+        """Посчитать окрестности всех систем заранее"""
+        for node in range(len(self.graph)):
+            self.ball(node)
+
+    def ball(self, node):
+        """Окрестность системы по индексу (считается один раз)"""
+        if self._balls[node] is None:
+            self._balls[node] = self._build(node)
+        return self._balls[node]
+
+    def _build(self, node):
+        graph = self.graph
+        hop_ball = _hop_ball(graph, node, self.hops)
+        distance_ball = _distance_ball(graph, node, self.radius)
+
+        entries = []
+        for other in hop_ball.keys() | distance_ball.keys():
+            if other == node:
+                continue
+            entries.append((
+                other,
+                hop_ball.get(other),
+                distance_ball.get(other)
+            ))
+        entries.sort(key=lambda e: (e[1] if e[1] is not None else INF, e[2] if e[2] is not None else INF))
+        return Neighborhood(node, entries)
+
+
+def _hop_ball(graph, source, hops):
+    """BFS не дальше hops прыжков: {вершина: число прыжков}"""
+    seen = {source: 0}
+    queue = deque([source])
+    offsets = graph.offsets
+    targets = graph.targets
+    while queue:
+        u = queue.popleft()
+        if seen[u] == hops:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if v not in seen:
+                seen[v] = seen[u] + 1
+                queue.append(v)
+    return seen
+
+
+def _distance_ball(graph, source, radius):
+    """Дейкстра с отсечкой по радиусу: {вершина: дистанция}"""
+    dist = {source: 0}
+    done = set()
+    heap = [(0, source)]
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + weights[k]
+            if nd <= radius and nd < dist.get(v, INF):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def get_neighborhood_index(scanner_level):
+    """Индекс окрестностей для уровня сканера (кэш по версии карты)"""
+    key = (galaxy_map.graph_version(), scanner_level)
+    index = _indexes.get(key)
+    if index is None:
+        # Индексы старых версий карты больше не нужны
+        for old in [k for k in _indexes if k[0] != key[0]]:
+            del _indexes[old]
+
+        graph = galaxy_map.get_compiled_graph()
+        index = NeighborhoodIndex(
+            graph, scanner_level, scanner_level * SCAN_DISTANCE_PER_LEVEL
+        )
+        if len(graph) <= NEIGHBORHOOD_PRECOMPUTE_MAX_SYSTEMS:
+            index.precompute()
+        _indexes[key] = index
+    return index
+
+
+def get_visible_systems(planet_id, scanner_level):
+    """
+    Что видно из системы сканером заданного уровня.
+
+    Returns:
+        Neighborhood
+    """
+    return get_neighborhood_index(scanner_level).ball(planet_id)
+
+
+def scan_report(state):
+    """
+    Отчёт сканера: опасные зоны, точки заказов и риск полиции рядом с кораблём.
+
+    Returns:
+        list[str]: строки отчёта
+    """
+    scanner = state.ship.scanner
+    if scanner.is_broken:
+        return [tr("game.scan.broken", "Сканер сломан — ничего не видно.")]
+
+    neighborhood = get_visible_systems(state.planet_id, scanner.range)
+    dead_zones = galaxy_map.get_dead_zones(state)
+    lines = [
+        tr(
+            "game.scan.range", "Дальность: {hops} прыж. / {distance} ед.",
+            hops=scanner.range, distance=scanner.range * SCAN_DISTANCE_PER_LEVEL
+        ),
+        tr("game.scan.visible", "Систем в зоне видимости: {count}", count=len(neighborhood.entries))
+    ]
+
+    for planet, hops, dist in neighborhood.entries:
+        notes = []
+        if planet in dead_zones:
+            notes.append(tr("game.scan.dead_zone", "☠️ опасная зона"))
+        for order in state.orders:
+            if not order.picked_up and order.origin_id == planet:
+                notes.append(tr("game.scan.pickup", "📦 погрузка: {cargo}", cargo=order.cargo_name))
+            if order.destination_id == planet:
+                notes.append(tr("game.scan.dropoff", "🎯 выгрузка: {cargo}", cargo=order.cargo_name))
+
+        where = []
+        if hops is not None:
+            where.append(tr("game.scan.hops", "{hops} прыж.", hops=hops))
+        if dist is not None:
+            where.append(tr("game.scan.distance", "{distance} ед.", distance=dist))
+        line = f"  {galaxy_map.planet_name(planet)} ({', '.join(where)})"
+        if notes:
+            line += " — " + "; ".join(notes)
+        lines.append(line)
+
+    contraband = onboard_contraband(state)
+    chance = int(POLICE_ENCOUNTER_CHANCE * 100)
+    if contraband:
+        lines.append(tr(
+            "game.scan.patrols_contraband",
+            "🚔 Патрули: {chance}% на каждом перелёте, на борту нелегальный груз ({cargo})",
+            chance=chance, cargo=contraband.cargo_name
+        ))
+    else:
+        lines.append(tr("game.scan.patrols", "🚔 Патрули: {chance}% на каждом перелёте", chance=chance))
+    return lines
@@ -0,0 +1,51 @@
+"""
+Реестр планет — единое пространство целых идентификаторов.
+
+Все внутренние структуры (граф, заказы, состояние, опасные зоны) хранят
+плотные id планет 0..N-1; имена нужны только для вывода и сохранений.
+"""
+
+
+class PlanetRegistry:
+    """Соответствие имя <-> плотный целый id (неизменяемое после создания)"""
+
+    def __init__(self, names):
+        self.names = []
+        self.index = {}
+        for name in names:
+            if name not in self.index:
+                self.index[name] = len(self.names)
+                self.names.append(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __iter__(self):
+        """Итератор по id планет"""
+        return iter(range(len(self.names)))
+
+    def id(self, name):
+        """id планеты по имени или None, если такой планеты нет"""
+        return self.index.get(name)
+
+    def name(self, planet_id):
+        """Имя планеты по id (для вывода и сохранений)"""
+        return self.names[planet_id]
+
+    def require(self, name):
+        """id планеты по имени; ValueError, если такой планеты нет"""
+        planet_id = self.index.get(name)
+        if planet_id is None:
+            raise ValueError(f"Неизвестная планета: {name}")
+        return planet_id
+
+    def resolve(self, planet):
+        """id планеты по имени или уже готовому id; ValueError, если нет"""
+        if isinstance(planet, int):
+            if not 0 <= planet < len(self.names):
+                raise ValueError(f"Неизвестный id планеты: {planet}")
+            return planet
+        return self.require(planet)
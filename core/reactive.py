@@ -0,0 +1,138 @@
+"""
+Реактивный индекс доступности контента.
+
+Скомпилированное условие (core/events.compile_condition) знает, какие
+ключи состояния игры оно читает — атрибут reads:
+    flag:<имя>, money, day, reputation:<фракция>
+Условия, которые читают что-то ещё (груз, текущий заказ) или
+зарегистрированы без описания зависимостей, читают ANY_STATE —
+такие проверяются при каждом запросе.
+
+GameState сообщает подписчикам, какой ключ изменился (Flags.set,
+деньги, next_day, репутация; None — изменилось всё, например при
+загрузке). Индекс помечает устаревшими только элементы, читающие этот
+ключ, и пересчитывает их при следующем запросе — стоимость запроса
+зависит от числа изменений, а не от объёма контента.
+
+Индексы хранятся в GameState.indexes по имени (get_index):
+    "news"    — новости (news/feed.py)
+    "choices" — выборы диалогов (dialog/engine.py)
+"""
+
+# Условие читает неотслеживаемую часть состояния — проверять всегда
+ANY_STATE = "*"
+
+MONEY = "money"
+DAY = "day"
+
+
+def flag_key(name):
+    return f"flag:{name}"
+
+
+def reputation_key(faction):
+    return f"reputation:{faction}"
+
+
+def reads_of(check):
+    """Ключи состояния, которые читает проверка (без описания — ANY_STATE)"""
+    reads = getattr(check, "reads", None)
+    return frozenset((ANY_STATE,)) if reads is None else reads
+
+
+class EligibilityIndex:
+    """
+    Множество элементов, доступных сейчас по их условиям.
+
+    Элемент — любой хешируемый ключ (имя новости, (диалог, узел, № выбора))
+    с проверкой check(state) -> bool.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self._checks = {}      # элемент -> проверка
+        self._by_key = {}      # ключ состояния -> {элементы}
+        self._always = set()   # элементы, читающие ANY_STATE
+        self._dirty = set()    # элементы, которые нужно пересчитать
+        self._eligible = set()
+
+        self.evaluations = 0   # Сколько проверок выполнено (для профилирования)
+        state.watch(self.invalidate)
+
+    def __contains__(self, item):
+        return item in self._checks
+
+    def __len__(self):
+        return len(self._checks)
+
+    def add(self, item, check):
+        """Добавить элемент (или заменить его проверку, если она другая)"""
+        if self._checks.get(item) is check:
+            return
+        if item in self._checks:
+            self.remove(item)
+        self._checks[item] = check
+        reads = reads_of(check)
+        if ANY_STATE in reads:
+            self._always.add(item)
+        else:
+            for key in reads:
+                self._by_key.setdefault(key, set()).add(item)
+        self._dirty.add(item)
+
+    def remove(self, item):
+        check = self._checks.pop(item, None)
+        if check is None:
+            return
+        for key in reads_of(check):
+            items = self._by_key.get(key)
+            if items is not None:
+                items.discard(item)
+        self._always.discard(item)
+        self._dirty.discard(item)
+        self._eligible.discard(item)
+
+    def invalidate(self, key):
+        """Ключ состояния изменился (None — изменилось всё)"""
+        if key is None:
+            self._dirty.update(self._checks)
+        else:
+            items = self._by_key.get(key)
+            if items:
+                self._dirty |= items
+
+    def _refresh(self, item):
+        self.evaluations += 1
+        if self._checks[item](self.state):
+            self._eligible.add(item)
+        else:
+            self._eligible.discard(item)
+
+    def is_eligible(self, item, check=None):
+        """
+        Доступен ли элемент; пересчитывается, только если его ключи менялись.
+        С check элемент добавляется (или обновляется) на месте.
+        """
+        if check is not None:
+            self.add(item, check)
+        if item in self._dirty or item in self._always:
+            self._dirty.discard(item)
+            self._refresh(item)
+        return item in self._eligible
+
+    def eligible(self):
+        """Все доступные сейчас элементы (пересчёт изменившихся)"""
+        for item in self._dirty:
+            self._refresh(item)
+        self._dirty.clear()
+        for item in self._always:
+            self._refresh(item)
+        return set(self._eligible)
+
+
+def get_index(state, name):
+    """Индекс доступности name для состояния игры (создаётся при первом обращении)"""
+    index = state.indexes.get(name)
+    if index is None:
+        index = state.indexes[name] = EligibilityIndex(state)
+    return index
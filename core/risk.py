@@ -0,0 +1,101 @@
+"""
+Маршруты с учётом риска: ожидаемая стоимость перелёта вместо дистанции.
+
+Вес ребра u -> v (в кредитах):
+    топливо * FUEL_CREDIT_VALUE
+    + POLICE_ENCOUNTER_CHANCE * ожидаемые потери при проверке
+    + риск гибели в опасной зоне v
+
+Веса зависят только от дня, двигателя, груза на борту и опасных зон,
+поэтому считаются один раз и переиспользуются всеми запросами за день.
+"""
+
+from core import map as galaxy_map
+from core.encounters import POLICE_ENCOUNTER_CHANCE, expected_police_loss, onboard_contraband
+from core.costs import get_cost_model
+from core.routing import INF, dijkstra, extract_path
+
+
+# Условная цена единицы топлива в кредитах
+FUEL_CREDIT_VALUE = 1.0
+
+# Цена гибели корабля (в кредитах) и шанс погибнуть, войдя в опасную зону
+DEAD_ZONE_LOSS = 100000
+DEAD_ZONE_DEATH_CHANCE = 1.0
+
+# Последний посчитанный граф рисков: (ключ, граф)
+_risk_cache = None
+
+
+def _risk_key(state, dead_zones):
+    """Всё, от чего зависят веса рёбер"""
+    return (
+        galaxy_map.graph_version(),
+        state.day,
+        state.ship.engine.level,
+        expected_police_loss(onboard_contraband(state)),
+        dead_zones,
+    )
+
+
+def get_risk_graph(state):
+    """
+    Граф с ожидаемой стоимостью перелёта по каждому ребру.
+    Пересчитывается, только когда меняется день, двигатель, груз или зоны.
+    """
+    global _risk_cache
+
+    dead_zones = galaxy_map.get_dead_zones(state)
+    key = _risk_key(state, dead_zones)
+    if _risk_cache is not None and _risk_cache[0] == key:
+        return _risk_cache[1]
+
+    graph = galaxy_map.get_compiled_graph()
+    edge_fuel = get_cost_model(state.ship.engine.level).edge_fuel
+    police_risk = POLICE_ENCOUNTER_CHANCE * expected_police_loss(onboard_contraband(state))
+    zone_risk = DEAD_ZONE_DEATH_CHANCE * DEAD_ZONE_LOSS
+
+    weights = []
+    targets = graph.targets
+    for k, fuel in enumerate(edge_fuel):
+        cost = fuel * FUEL_CREDIT_VALUE + police_risk
+        if targets[k] in dead_zones:
+            cost += zone_risk
+        weights.append(cost)
+
+    risk_graph = graph.with_weights(weights)
+    _risk_cache = (key, risk_graph)
+    return risk_graph
+
+
+def get_safest_path(state, destination):
+    """
+    Маршрут с минимальной ожидаемой стоимостью.
+
+    Returns:
+        (path, expected_cost) или (None, inf), если пути нет
+    """
+    graph = get_risk_graph(state)
+    source = state.planet_id
+    target = graph.node_id(destination)
+    if source is None or target is None:
+        return None, INF
+
+    dist, pred = dijkstra(graph, source, target)
+    if dist[target] == INF:
+        return None, INF
+
+    path = extract_path(pred, source, target)
+    return [graph.names[i] for i in path], dist[target]
+
+
+def route_expected_cost(state, path):
+    """Ожидаемая стоимость заданного маршрута (для сравнения вариантов)"""
+    graph = get_risk_graph(state)
+    total = 0
+    for a, b in zip(path, path[1:]):
+        k = graph.edge_index(graph.node_id(a), graph.node_id(b))
+        if k == -1:
+            return INF
+        total += graph.weights[k]
+    return total
@@ -0,0 +1,619 @@
+"""
+Ядро маршрутизации — компактный граф с целочисленными индексами и поиск путей.
+
+Граф Галактики (словарь словарей) компилируется в CSR-представление:
+- offsets[i] .. offsets[i + 1] — диапазон рёбер вершины i
+- targets[k] — индекс соседа для ребра k
+- weights[k] — длина ребра k
+"""
+
+import heapq
+import time
+from array import array
+
+INF = float('inf')
+
+
+class CompiledGraph:
+    """Граф Галактики в виде плоских массивов (CSR)"""
+
+    def __init__(self, graph, registry=None):
+        # С реестром планет индексы вершин совпадают с id планет
+        if registry is not None:
+            self.names = registry.names
+            self.index = registry.index
+        else:
+            self.names = list(graph.keys())
+            self.index = {name: i for i, name in enumerate(self.names)}
+
+        # Целые веса храним как целые, чтобы дистанции оставались int
+        integral = all(
+            isinstance(dist, int)
+            for neighbors in graph.values()
+            for dist in neighbors.values()
+        )
+
+        self.offsets = array('l', [0])
+        self.targets = array('l')
+        self.weights = array('q' if integral else 'd')
+
+        for name in self.names:
+            for neighbor, dist in graph[name].items():
+                self.targets.append(self.index[neighbor])
+                self.weights.append(dist)
+            self.offsets.append(len(self.targets))
+
+        self._reverse = None
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def node_id(self, name):
+        """Индекс планеты или None, если её нет на карте"""
+        return self.index.get(name)
+
+    def neighbors(self, node):
+        """Итератор по (сосед, длина ребра) для вершины node"""
+        targets = self.targets
+        weights = self.weights
+        for k in range(self.offsets[node], self.offsets[node + 1]):
+            yield targets[k], weights[k]
+
+    def edge_weight(self, u, v):
+        """Длина ребра u -> v или None, если ребра нет"""
+        targets = self.targets
+        for k in range(self.offsets[u], self.offsets[u + 1]):
+            if targets[k] == v:
+                return self.weights[k]
+        return None
+
+    def edge_index(self, u, v):
+        """Номер ребра u -> v в плоских массивах или -1"""
+        targets = self.targets
+        for k in range(self.offsets[u], self.offsets[u + 1]):
+            if targets[k] == v:
+                return k
+        return -1
+
+    def reverse(self):
+        """Граф с развёрнутыми рёбрами (строится один раз)"""
+        if self._reverse is None:
+            n = len(self.names)
+            incoming = [[] for _ in range(n)]
+            for u in range(n):
+                for k in range(self.offsets[u], self.offsets[u + 1]):
+                    incoming[self.targets[k]].append((u, self.weights[k]))
+
+            reverse = CompiledGraph.__new__(CompiledGraph)
+            reverse.names = self.names
+            reverse.index = self.index
+            reverse.offsets = array('l', [0])
+            reverse.targets = array('l')
+            reverse.weights = array(self.weights.typecode)
+            for v in range(n):
+                for u, w in incoming[v]:
+                    reverse.targets.append(u)
+                    reverse.weights.append(w)
+                reverse.offsets.append(len(reverse.targets))
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def with_weights(self, weights):
+        """
+        Тот же граф с другими весами рёбер (например, ожидаемой стоимостью).
+        Имена, индекс и связи общие с исходным графом.
+        """
+        if len(weights) != self.edge_count:
+            raise ValueError("Число весов не совпадает с числом рёбер")
+
+        graph = CompiledGraph.__new__(CompiledGraph)
+        graph.names = self.names
+        graph.index = self.index
+        graph.offsets = self.offsets
+        graph.targets = self.targets
+        graph.weights = array('d', weights)
+        graph._reverse = None
+        return graph
+
+    def memory_bytes(self):
+        """Объём памяти, занимаемый массивами графа"""
+        return sum(
+            arr.itemsize * len(arr)
+            for arr in (self.offsets, self.targets, self.weights)
+        )
+
+
+def dijkstra(graph, source, target=None, penalties=None):
+    """
+    Алгоритм Дейкстры на бинарной куче.
+
+    Args:
+        graph: CompiledGraph
+        source: индекс начальной вершины
+        target: индекс цели — поиск останавливается, как только она извлечена
+                из кучи (None — посчитать расстояния до всех вершин)
+        penalties: штраф за вход в каждую вершину (опционально);
+                   inf — в вершину входить нельзя
+
+    Returns:
+        (dist, pred): списки расстояний и предшественников (-1 — нет)
+    """
+    n = len(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+
+    dist = [INF] * n
+    pred = [-1] * n
+    done = bytearray(n)
+    dist[source] = 0
+
+    heap = [(0, source)]
+    pop = heapq.heappop
+    push = heapq.heappush
+
+    while heap:
+        d, u = pop(heap)
+        if done[u]:
+            continue
+        done[u] = 1
+
+        if u == target:
+            break
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + weights[k]
+            if penalties is not None:
+                nd += penalties[v]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                push(heap, (nd, v))
+
+    return dist, pred
+
+
+def extract_path(pred, source, target):
+    """
+    Восстановить путь source -> target по массиву предшественников.
+
+    Returns:
+        list[int] индексов вершин или None, если путь не найден
+    """
+    if target != source and pred[target] == -1:
+        return None
+
+    path = []
+    node = target
+    while node != -1:
+        path.append(node)
+        if node == source:
+            break
+        node = pred[node]
+
+    path.reverse()
+    return path
+
+
+class RouteTable:
+    """
+    Таблица всех пар: расстояния и матрица следующего прыжка.
+    Строится один раз для версии графа, путь восстанавливается за O(длины пути).
+    """
+
+    def __init__(self, graph, blocked=frozenset()):
+        start_time = time.perf_counter()
+
+        n = len(graph)
+        self.graph = graph
+        self.size = n
+        self.blocked = frozenset(blocked)
+        self._integral = graph.weights.typecode == 'q'
+
+        self.dist = array('d', [INF]) * (n * n)
+        self.next_hop = array('l', [-1]) * (n * n)
+
+        penalties = None
+        if self.blocked:
+            penalties = [0] * n
+            for node in self.blocked:
+                penalties[node] = INF
+
+        for source in range(n):
+            dist, pred = dijkstra(graph, source, penalties=penalties)
+            row = source * n
+            # Следующий прыжок наследуется от предшественника,
+            # поэтому вершины обходим в порядке удаления от источника
+            reached = sorted(
+                (v for v in range(n) if dist[v] != INF),
+                key=dist.__getitem__
+            )
+            for v in reached:
+                self.dist[row + v] = dist[v]
+                p = pred[v]
+                if p == -1:
+                    continue
+                self.next_hop[row + v] = v if p == source else self.next_hop[row + p]
+
+        self.build_seconds = time.perf_counter() - start_time
+
+    def distance(self, source, target):
+        """Кратчайшее расстояние source -> target (inf, если пути нет)"""
+        d = self.dist[source * self.size + target]
+        if d != INF and self._integral:
+            return int(d)
+        return d
+
+    def path(self, source, target):
+        """Кратчайший путь в индексах вершин или None"""
+        if source == target:
+            return [source]
+
+        n = self.size
+        next_hop = self.next_hop
+        if next_hop[source * n + target] == -1:
+            return None
+
+        path = [source]
+        node = source
+        while node != target:
+            node = next_hop[node * n + target]
+            path.append(node)
+        return path
+
+    def memory_bytes(self):
+        """Объём памяти, занимаемый матрицами таблицы"""
+        return (
+            self.dist.itemsize * len(self.dist)
+            + self.next_hop.itemsize * len(self.next_hop)
+        )
+
+    def stats(self):
+        """Сводка для выбора между таблицей и поиском по запросу"""
+        return {
+            "systems": self.size,
+            "blocked": len(self.blocked),
+            "build_seconds": self.build_seconds,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+class ShortestPathTree:
+    """
+    Дерево кратчайших путей от одного источника.
+    Расстояния считаются один раз, пути извлекаются лениво по запросу.
+    """
+
+    def __init__(self, graph, source, dist, pred):
+        self.graph = graph
+        self.source = source
+        self.dist = dist
+        self.pred = pred
+
+    @property
+    def source_name(self):
+        return self.graph.names[self.source]
+
+    def distance(self, planet):
+        """Расстояние до планеты (inf, если недостижима или неизвестна)"""
+        node = self.graph.node_id(planet)
+        if node is None:
+            return INF
+        return self.dist[node]
+
+    def is_reachable(self, planet):
+        """Можно ли долететь до планеты"""
+        return self.distance(planet) != INF
+
+    def path_to(self, planet):
+        """Кратчайший путь до планеты (список имён) или None"""
+        node = self.graph.node_id(planet)
+        if node is None:
+            return None
+        path = extract_path(self.pred, self.source, node)
+        if path is None:
+            return None
+        return [self.graph.names[v] for v in path]
+
+
+class DynamicShortestPathTree(ShortestPathTree):
+    """
+    Дерево кратчайших путей со штрафами за вход в вершины,
+    которое чинится инкрементально при изменении штрафа одной вершины
+    (вместо полного пересчёта).
+
+    Стоимость ребра u -> v = длина + penalty[v]; penalty = inf блокирует v.
+    dist хранит стоимость с учётом штрафов, distance() — реальную длину пути.
+    """
+
+    def __init__(self, graph, source, penalties=None):
+        self.penalty = list(penalties) if penalties is not None else [0] * len(graph)
+        dist, pred = dijkstra(graph, source, penalties=self.penalty)
+        super().__init__(graph, source, dist, pred)
+
+        # Сколько вершин пересчитано при починках (для статистики)
+        self.repaired_nodes = 0
+
+    def cost(self, planet):
+        """Стоимость маршрута с учётом штрафов"""
+        return super().distance(planet)
+
+    def distance(self, planet):
+        """Реальная длина выбранного маршрута (без штрафов)"""
+        node = self.graph.node_id(planet)
+        if node is None or self.dist[node] == INF:
+            return INF
+
+        length = 0
+        while node != self.source:
+            parent = self.pred[node]
+            length += self.graph.edge_weight(parent, node)
+            node = parent
+        return length
+
+    def set_penalty(self, node, penalty):
+        """Изменить штраф вершины и починить дерево"""
+        old = self.penalty[node]
+        if penalty == old:
+            return
+        self.penalty[node] = penalty
+        if node == self.source:
+            return  # Вход в источник не оплачивается
+
+        if penalty < old:
+            self._repair_decrease(node)
+        else:
+            self._repair_increase(node)
+
+    def _repair_decrease(self, node):
+        """Штраф уменьшился: улучшения распространяются от node наружу"""
+        dist = self.dist
+        pred = self.pred
+        penalty = self.penalty
+
+        best = dist[node]
+        best_pred = pred[node]
+        for u, w in self.graph.reverse().neighbors(node):
+            if dist[u] == INF:
+                continue
+            cand = dist[u] + w + penalty[node]
+            if cand < best:
+                best = cand
+                best_pred = u
+
+        if best >= dist[node]:
+            return
+        dist[node] = best
+        pred[node] = best_pred
+        self._propagate([(best, node)], None)
+
+    def _repair_increase(self, node):
+        """
+        Штраф вырос: пересчитать только поддерево node.
+        Остальные вершины не могут улучшиться, их расстояния верны.
+        """
+        if self.dist[node] == INF:
+            return
+
+        graph = self.graph
+        dist = self.dist
+        pred = self.pred
+        penalty = self.penalty
+
+        # Поддерево node в текущем дереве кратчайших путей
+        affected = {node}
+        stack = [node]
+        while stack:
+            u = stack.pop()
+            for v, _ in graph.neighbors(u):
+                if pred[v] == u and v not in affected:
+                    affected.add(v)
+                    stack.append(v)
+
+        for v in affected:
+            dist[v] = INF
+            pred[v] = -1
+
+        # Лучший вход в поддерево из нетронутой части графа
+        reverse = graph.reverse()
+        heap = []
+        for v in affected:
+            for u, w in reverse.neighbors(v):
+                if u in affected or dist[u] == INF:
+                    continue
+                cand = dist[u] + w + penalty[v]
+                if cand < dist[v]:
+                    dist[v] = cand
+                    pred[v] = u
+            if dist[v] != INF:
+                heap.append((dist[v], v))
+        heapq.heapify(heap)
+
+        self._propagate(heap, affected)
+
+    def _propagate(self, heap, region):
+        """Дейкстра от вершин из heap; region — ограничение области (None — весь граф)"""
+        dist = self.dist
+        pred = self.pred
+        penalty = self.penalty
+        offsets = self.graph.offsets
+        targets = self.graph.targets
+        weights = self.graph.weights
+
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            self.repaired_nodes += 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if region is not None and v not in region:
+                    continue
+                nd = d + weights[k] + penalty[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    pred[v] = u
+                    heapq.heappush(heap, (nd, v))
+
+
+def k_shortest_paths(graph, source, target, k, reuse_trees=True):
+    """
+    K кратчайших простых путей (алгоритм Йена).
+
+    Дерево кратчайших путей до цели (Дейкстра по развёрнутому графу)
+    строится один раз и переиспользуется во всех ответвлениях:
+    - если путь по дереву от точки ответвления не задевает удалённые
+      рёбра и корень маршрута — он и есть ответ, поиск не нужен;
+    - иначе расстояния из дерева служат точной эвристикой A*.
+
+    Args:
+        graph: CompiledGraph
+        source, target: индексы вершин
+        k: сколько путей нужно
+        reuse_trees: False — честный Йен с полной Дейкстрой на каждое
+                     ответвление (для сравнения в бенчмарке)
+
+    Returns:
+        list[(path, distance)] по возрастанию дистанции
+    """
+    if k <= 0:
+        return []
+
+    to_target, toward = dijkstra(graph.reverse(), target)
+    if to_target[source] == INF:
+        return []
+
+    if source == target:
+        return [([source], 0)]
+
+    first = _tree_path(toward, source, target)
+    found = [(first, to_target[source])]
+    found_set = {tuple(first)}
+    candidates = []
+    candidate_set = set()
+    counter = 0
+    n = len(graph)
+
+    while len(found) < k:
+        prev_path, _ = found[-1]
+
+        # Префиксные суммы длины предыдущего пути
+        prefix = [0]
+        for a, b in zip(prev_path, prev_path[1:]):
+            prefix.append(prefix[-1] + graph.edge_weight(a, b))
+
+        blocked = bytearray(n)
+        for j in range(len(prev_path) - 1):
+            spur = prev_path[j]
+            root = prev_path[:j + 1]
+            if j > 0:
+                blocked[prev_path[j - 1]] = 1
+
+            # Рёбра из spur, которыми уже начинались найденные пути с тем же корнем
+            removed = set()
+            for path, _ in found:
+                if len(path) > j + 1 and path[:j + 1] == root:
+                    removed.add(graph.edge_index(spur, path[j + 1]))
+
+            spur_result = None
+            if reuse_trees:
+                spur_result = _tree_spur(graph, toward, to_target, spur, target, blocked, removed)
+            if spur_result is None:
+                spur_result = _spur_search(
+                    graph, spur, target, blocked, removed,
+                    to_target if reuse_trees else None
+                )
+            if spur_result is None:
+                continue
+
+            spur_path, spur_dist = spur_result
+            candidate = root[:-1] + spur_path
+            key = tuple(candidate)
+            if key in candidate_set or key in found_set:
+                continue
+            candidate_set.add(key)
+            counter += 1
+            heapq.heappush(candidates, (prefix[j] + spur_dist, counter, candidate))
+
+        if not candidates:
+            break
+
+        dist, _, path = heapq.heappop(candidates)
+        key = tuple(path)
+        candidate_set.discard(key)
+        found_set.add(key)
+        found.append((path, dist))
+
+    return found
+
+
+def _tree_path(toward, node, target):
+    """Путь по дереву кратчайших путей до цели"""
+    path = [node]
+    while node != target:
+        node = toward[node]
+        path.append(node)
+    return path
+
+
+def _tree_spur(graph, toward, to_target, spur, target, blocked, removed):
+    """Путь от spur по дереву, если он не задевает запреты; иначе None"""
+    if to_target[spur] == INF:
+        return None
+    nxt = toward[spur]
+    if graph.edge_index(spur, nxt) in removed:
+        return None
+
+    path = _tree_path(toward, spur, target)
+    for node in path[1:]:
+        if blocked[node]:
+            return None
+    return path, to_target[spur]
+
+
+def _spur_search(graph, source, target, blocked, removed, heuristic=None):
+    """A* (или Дейкстра без эвристики) в обход блокированных вершин и удалённых рёбер"""
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+
+    dist = {source: 0}
+    pred = {source: -1}
+    done = set()
+    h0 = heuristic[source] if heuristic else 0
+    heap = [(h0, 0, source)]
+
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+
+        if u == target:
+            path = [u]
+            while pred[u] != -1:
+                u = pred[u]
+                path.append(u)
+            path.reverse()
+            return path, d
+
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if blocked[v] or e in removed:
+                continue
+            nd = d + weights[e]
+            if nd < dist.get(v, INF):
+                h = heuristic[v] if heuristic else 0
+                if h == INF:
+                    continue
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd + h, nd, v))
+
+    return None
@@ -2,16 +2,24 @@
 Состояние игры — хранит все данные о прогрессе игрока.
 """
 
+from core import map as galaxy_map
+from core.bus import PlayerDied, ReputationChanged, get_bus
 from core.flags import Flags
+from core.reactive import DAY, MONEY, reputation_key
+from orders.order import Order
 from ship.ship import Ship
 
 
 class GameState:
     def __init__(self):
+        # Подписчики на изменения (core/reactive.py) и индексы доступности
+        self._listeners = []
+        self.indexes = {}
+
         self.day = 1
         self.money = 1000
         self.alive = True
-        self.current_planet = "Station Alpha"
+        self.planet_id = galaxy_map.get_planet_registry().require("Station Alpha")
         self.action_points = 100 # Очки действий на день
 
         # Репутация у разных фракций
@@ -23,9 +31,14 @@ class GameState:
 
         # Сюжетные флаги
         self.flags = Flags()
+        self.flags.on_change = self._changed
+
+        # Опасные зоны: id планет (дублируются флагами dead_zone_<планета>)
+        self.dead_zones = frozenset()
 
-        # Текущий заказ (если есть)
-        self.current_order = None
+        # Активные заказы (груз может быть ещё не забран)
+        self.orders = []
+        self._focused_order = None # Заказ, о котором сейчас идёт речь
         self.pending_order = None # Временное хранение заказа до принятия
 
         # История выполненных заказов
@@ -37,6 +50,96 @@ class GameState:
         # Корабль игрока
         self.ship = Ship()
 
+    def watch(self, listener):
+        """Подписаться на изменения: listener(ключ) или listener(None) — изменилось всё"""
+        self._listeners.append(listener)
+
+    def _changed(self, key):
+        for listener in self._listeners:
+            listener(key)
+
+    @property
+    def money(self):
+        return self._money
+
+    @money.setter
+    def money(self, value):
+        self._money = value
+        self._changed(MONEY)
+
+    @property
+    def day(self):
+        return self._day
+
+    @day.setter
+    def day(self, value):
+        self._day = value
+        self._changed(DAY)
+
+    @property
+    def current_planet(self):
+        """Имя текущей планеты (для вывода и диалогов)"""
+        return galaxy_map.planet_name(self.planet_id)
+
+    @current_planet.setter
+    def current_planet(self, name):
+        self.planet_id = galaxy_map.get_planet_registry().require(name)
+
+    def set_dead_zone(self, planet_id, active=True):
+        """Отметить планету опасной зоной (или снять отметку) вместе с флагом"""
+        if active:
+            self.dead_zones = self.dead_zones | {planet_id}
+        else:
+            self.dead_zones = self.dead_zones - {planet_id}
+        self.flags.set_in(galaxy_map.DEAD_ZONE_FLAGS, galaxy_map.planet_name(planet_id), active)
+
+    def _dead_zones_from_flags(self):
+        """Восстановить опасные зоны по сюжетным флагам (при загрузке)"""
+        registry = galaxy_map.get_planet_registry()
+        return frozenset(
+            registry.id(name)
+            for name in self.flags.members(galaxy_map.DEAD_ZONE_FLAGS)
+            if name in registry
+        )
+
+    def restore_flags(self, snapshot):
+        """Вернуть флаги к снимку Flags.snapshot() (откат симуляции)"""
+        self.flags.restore(snapshot)
+        self.dead_zones = self._dead_zones_from_flags()
+
+    @property
+    def current_order(self):
+        """Заказ, с которым сейчас работают диалоги (доставка, полиция)"""
+        if self._focused_order in self.orders:
+            return self._focused_order
+        return self.orders[0] if self.orders else None
+
+    def focus_order(self, order):
+        """Сделать заказ текущим для диалогов и эффектов"""
+        self._focused_order = order
+
+    def add_order(self, order):
+        """Принять заказ; груз сразу грузится, если мы на месте и есть место"""
+        self.orders.append(order)
+        self.focus_order(order)
+        if order.origin_id == self.planet_id and order.size <= self.free_capacity():
+            order.picked_up = True
+
+    def remove_order(self, order):
+        """Убрать заказ из активных (выполнен или провален)"""
+        if order in self.orders:
+            self.orders.remove(order)
+        if self._focused_order is order:
+            self._focused_order = None
+
+    def cargo_load(self):
+        """Сколько места занято грузом заказов"""
+        return sum(order.size for order in self.orders if order.picked_up)
+
+    def free_capacity(self):
+        """Свободное место в грузовом отсеке"""
+        return self.ship.cargo.capacity - self.cargo_load()
+
     def next_day(self):
         """Перейти к следующему дню"""
         self.day += 1
@@ -58,6 +161,8 @@ class GameState:
         """Изменить репутацию у фракции"""
         if faction in self.reputation:
             self.reputation[faction] += amount
+            self._changed(reputation_key(faction))
+            get_bus().emit(ReputationChanged, faction, amount, self.reputation[faction])
 
     def get_reputation(self, faction):
         """Получить репутацию у фракции"""
@@ -67,6 +172,7 @@ class GameState:
         """Игрок погиб"""
         self.alive = False
         self.death_reason = reason
+        get_bus().emit(PlayerDied, reason, self.current_planet, self.day)
 
     def to_dict(self):
         """Для сохранения игры"""
@@ -80,6 +186,7 @@ class GameState:
             "completed_orders": self.completed_orders.copy(),
             "completed_orders": self.completed_orders.copy(),
             "cargo": self.cargo.copy(),
+            "orders": [order.to_dict() for order in self.orders],
             "ship": self.ship.to_dict()
         }
 
@@ -95,9 +202,13 @@ class GameState:
             "Syndicate": 0
         })
         self.flags.from_dict(data.get("flags", {}))
+        self.dead_zones = self._dead_zones_from_flags()
         self.completed_orders = data.get("completed_orders", [])
         self.cargo = data.get("cargo", [])
         if "ship" in data:
             self.ship = Ship.from_dict(data["ship"])
         else:
             self.ship = Ship()
+        self.orders = [Order.from_dict(order) for order in data.get("orders", [])]
+        self._focused_order = None
+        self._changed(None)
@@ -0,0 +1,168 @@
+"""
+Компиляция JSON-диалогов в неизменяемые графы узлов.
+
+Сырые данные диалога (dict из JSON) один раз превращаются в объекты
+Node и Choice: переходы — прямые ссылки на узлы, условия и эффекты —
+заранее привязанные функции, тексты — разобранные шаблоны.
+Ссылки next на несуществующие узлы обнаруживаются при компиляции,
+а не посреди разговора.
+"""
+
+from core.events import (
+    ConditionError, EffectError, compile_conditions, compile_effects, run_effects
+)
+from dialog.templates import parse_template
+
+
+class DialogCompileError(Exception):
+    """Ошибка в структуре диалога (неизвестный узел, эффект или условие)"""
+
+
+class _Frozen:
+    """Базовый класс неизменяемых объектов диалога"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} нельзя изменять")
+
+    def _set(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+
+class Choice(_Frozen):
+    """Вариант ответа: текст, условия показа, эффекты и следующий узел"""
+
+    __slots__ = (
+        "text", "template", "message_id", "conditions", "effects", "next", "is_available", "apply"
+    )
+
+    def __init__(self, text, conditions, effects, next_node, message_id=None):
+        self._set(
+            text=text,
+            template=parse_template(text),
+            message_id=message_id,  # id перевода в каталогах (utils/i18n.py)
+            conditions=conditions,  # Исходные условия (кортеж dict)
+            effects=effects,        # Исходные эффекты (кортеж dict)
+            next=next_node,         # Node или None — конец диалога
+            is_available=_bind_conditions(conditions),
+            apply=_bind_effects(effects)
+        )
+
+
+class Node(_Frozen):
+    """Узел диалога; choices заполняются после создания всех узлов"""
+
+    __slots__ = ("id", "text", "template", "message_id", "speaker", "speaker_id", "choices")
+
+    def __init__(self, node_id, text, speaker, message_id=None, speaker_id=None):
+        self._set(
+            id=node_id,
+            text=text,
+            template=parse_template(text),
+            message_id=message_id,  # id перевода текста
+            speaker=speaker,
+            speaker_id=speaker_id,  # id перевода имени говорящего
+            choices=()
+        )
+
+
+class CompiledDialog(_Frozen):
+    """Скомпилированный диалог: все узлы по id и стартовый узел"""
+
+    __slots__ = ("name", "nodes", "start")
+
+    def __init__(self, name, nodes, start):
+        self._set(name=name, nodes=nodes, start=start)
+
+
+def _nothing(state):
+    return None
+
+
+def _bind_conditions(conditions):
+    """Функция state -> bool для списка условий (AND, с all/any/not)"""
+    return compile_conditions(conditions)
+
+
+def _bind_effects(effects):
+    """Функция state -> None, применяющая список эффектов (компилируется сразу)"""
+    compiled = compile_effects(effects)
+    if not compiled:
+        return _nothing
+    return lambda state: run_effects(compiled, state)
+
+
+def compile_dialog(data, name=None):
+    """
+    Скомпилировать диалог из JSON-данных.
+
+    Поддерживаются оба формата: новый (meta + start + nodes)
+    и старый (плоский словарь узлов, старт — узел "start").
+
+    Args:
+        data: dict с данными диалога
+        name: имя диалога (по умолчанию meta.id) — для сообщений об ошибках
+              и id переводов
+
+    Returns:
+        CompiledDialog
+
+    Raises:
+        DialogCompileError: next или start ссылается на несуществующий узел,
+            неизвестный тип эффекта или условия, нет обязательного поля
+    """
+    if "nodes" in data:
+        raw_nodes = data["nodes"]
+        start_id = data.get("start", "start")
+    else:
+        raw_nodes = data
+        start_id = "start"
+
+    meta = data.get("meta", {})
+    default_speaker = meta.get("character", "")
+    name = name or meta.get("id")
+    where = f"{name}: " if name else ""
+
+    def message_id(*parts):
+        return None if name is None else ".".join(("dialog", name) + parts)
+
+    nodes = {}
+    for node_id, raw in raw_nodes.items():
+        own_speaker = "speaker" in raw
+        nodes[node_id] = Node(
+            node_id,
+            raw.get("text", ""),
+            raw.get("speaker", default_speaker),
+            message_id(node_id),
+            message_id(node_id, "speaker") if own_speaker else message_id("speaker")
+        )
+
+    for node_id, raw in raw_nodes.items():
+        choices = []
+        for i, raw_choice in enumerate(raw.get("choices") or ()):
+            next_id = raw_choice.get("next")
+            next_node = None
+            if next_id is not None:
+                next_node = nodes.get(next_id)
+                if next_node is None:
+                    raise DialogCompileError(
+                        f"{where}узел '{node_id}' ссылается на несуществующий узел '{next_id}'"
+                    )
+            try:
+                choices.append(Choice(
+                    raw_choice.get("text", ""),
+                    tuple(raw_choice.get("conditions", ())),
+                    tuple(raw_choice.get("effects", ())),
+                    next_node,
+                    message_id(node_id, str(i))
+                ))
+            except (EffectError, ConditionError) as e:
+                raise DialogCompileError(f"{where}узел '{node_id}', выбор {i + 1}: {e}")
+        nodes[node_id]._set(choices=tuple(choices))
+
+    if start_id not in nodes:
+        raise DialogCompileError(f"{where}стартовый узел '{start_id}' не найден")
+
+    return CompiledDialog(name, nodes, nodes[start_id])
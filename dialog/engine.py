@@ -3,82 +3,66 @@
 """
 
 from utils.io import print_slow
-from core.events import apply_effects, check_conditions
+from dialog.compiler import CompiledDialog, compile_dialog
+from dialog.templates import TemplateContext, localized_template
+from core.reactive import get_index
+from utils.i18n import tr, translate
 
 
-def run_dialog(dialog_data, state, start_node="start"):
+def run_dialog(dialog, state, start_node="start"):
     """
     Запустить диалог.
     
     Args:
-        dialog_data: dict с узлами диалога
+        dialog: CompiledDialog (см. dialog.loader.get_dialog)
+                или dict с узлами диалога — тогда компилируется на месте
         state: GameState
-        start_node: начальный узел (по умолчанию "start")
+        start_node: начальный узел (по умолчанию — стартовый узел диалога)
     """
-    if not dialog_data:
+    if not dialog:
         return
 
-    node_id = start_node
-    
-    # Поддержка новой структуры (meta + nodes)
-    if "nodes" in dialog_data:
-        nodes = dialog_data["nodes"]
-        # Если start_node не передан явно (по умолчанию "start"),
-        # пробуем взять стартовый узел из поля "start" в JSON
-        if start_node == "start" and "start" in dialog_data:
-            node_id = dialog_data["start"]
+    if not isinstance(dialog, CompiledDialog):
+        dialog = compile_dialog(dialog)
+
+    if start_node == "start":
+        node = dialog.start
     else:
-        # Старый формат (плоский словарь)
-        nodes = dialog_data
+        node = dialog.nodes.get(start_node)
+        if node is None:
+            print(f"[ОШИБКА] Узел не найден: {start_node}")
 
-    node = nodes.get(node_id)
-    
-    # Получить имя говорящего из метаданных, если есть
-    default_speaker = dialog_data.get("meta", {}).get("character", "")
+    # Доступность выборов запоминается между показами узлов и диалогов
+    # и пересчитывается, только если менялось то, что читают условия
+    choices = get_index(state, "choices")
 
     while node:
-        # Показать текст узла
-        text = node.get("text", "")
-        
-        # Подстановка переменных из pending_order
-        if state.pending_order:
-            order = state.pending_order
-            replacements = {
-                "{cargo}": str(order.cargo),
-                "{destination}": str(order.destination),
-                "{reward}": str(order.reward),
-                "{faction}": str(order.faction) if order.faction else "Частное лицо"
-            }
-            for key, val in replacements.items():
-                text = text.replace(key, val)
-
-        # Если у узла нет speaker, используем из метаданных
-        speaker = node.get("speaker", default_speaker)
+        # Показать текст узла (подстановки — из текущего состояния игры,
+        # эффекты прошлого выбора могли сменить заказ разговора)
+        context = TemplateContext(state)
+        text = localized_template(node.message_id, node.template).render(context)
+        speaker = translate(node.speaker_id) or node.speaker
 
         if speaker:
             print_slow(f"\n[{speaker}]: {text}")
         else:
             print_slow(f"\n{text}")
 
-        # Если нет выборов — конец диалога
-        if "choices" not in node or not node["choices"]:
-            break
-
         # Фильтровать выборы по условиям
-        available_choices = []
-        for choice in node["choices"]:
-            conditions = choice.get("conditions", [])
-            if check_conditions(conditions, state):
-                available_choices.append(choice)
+        available_choices = [
+            choice for i, choice in enumerate(node.choices)
+            if choices.is_eligible((dialog.name, node.id, i), choice.is_available)
+        ]
 
         if not available_choices:
-            # Нет доступных выборов — конец
+            # Нет выборов или ни один недоступен — конец диалога
             break
 
         # Показать доступные выборы
         print()
         for i, choice in enumerate(available_choices, 1):
-            print_slow(f"{i}. {choice['text']}", delay=0.015)
+            label = localized_template(choice.message_id, choice.template).render(context)
+            print_slow(f"{i}. {label}", delay=0.015)
 
         # Получить выбор игрока
         while True:
@@ -87,25 +71,17 @@ def run_dialog(dialog_data, state, start_node="start"):
                 idx = int(user_input) - 1
                 if 0 <= idx < len(available_choices):
                     break
-                print("Неверный выбор.")
+                print(tr("menu.invalid_choice", "Неверный выбор."))
             except ValueError:
-                print("Введите номер.")
+                print(tr("menu.enter_number", "Введите номер."))
 
         selected = available_choices[idx]
 
         # Применить эффекты выбора
-        effects = selected.get("effects", [])
-        apply_effects(effects, state)
-
-        # Перейти к следующему узлу
-        next_node = selected.get("next")
-        if next_node is None:
-            break
+        selected.apply(state)
 
-        node = nodes.get(next_node)
-        if node is None:
-            print(f"[ОШИБКА] Узел не найден: {next_node}")
-            break
+        # Перейти к следующему узлу (None — конец диалога)
+        node = selected.next
 
 
 def run_simple_dialog(lines, speaker=None):
@@ -122,4 +98,4 @@ def run_simple_dialog(lines, speaker=None):
         else:
             print_slow(f"\n{line}")
     
-    input("\n[Нажмите Enter для продолжения]")
+    input("\n" + tr("menu.press_enter", "[Нажмите Enter для продолжения]"))
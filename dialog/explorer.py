@@ -0,0 +1,345 @@
+"""
+Исследование пространства состояний диалогов (проверка контента).
+
+Обходит граф каждого диалога символически: значения флагов, которых
+диалог ещё не задал, перебираются (не задан / задан), условия на деньги,
+репутацию, день и груз считаются свободными (могут быть и истинными,
+и ложными). Эффекты флагов применяются к символическому состоянию.
+
+Состояния запоминаются по (узел, значения флагов, которые ещё читаются
+условиями достижимых из узла выборов) — остальные флаги на дальнейший
+ход диалога не влияют, поэтому перебор не растёт экспоненциально.
+
+Отчёт по диалогу:
+- недостижимые узлы
+- тупики: узлы с выборами, где при каком-то состоянии нет ни одного
+  доступного выбора (или все доступные зависят от свободных условий)
+- выборы, которые никогда не доступны, и наборы флагов, открывающие выборы
+- наборы эффектов по путям от старта до конца диалога
+
+Запуск из корня репозитория:
+    python -m dialog.explorer [имена диалогов]
+"""
+
+import argparse
+import json
+import sys
+
+from core.flags import EVENT_UNLOCKED
+from dialog.loader import DIALOGS_DIR, get_dialog
+from utils.content import get_repository
+
+
+# Сколько разных наборов эффектов хранить на одно состояние
+MAX_EFFECT_SETS = 256
+
+# Эффекты со случайным результатом: какие флаги они задают
+RANDOM_FLAG_EFFECTS = {
+    "police_bribe_attempt": ("police_bribe_success", "police_bribe_no_money"),
+    "pay_police_fine": ("police_fine_paid",),
+}
+
+# Значение флага, который не задавался (Flags.get по умолчанию)
+UNSET = False
+
+
+class DialogReport:
+    """Результат исследования одного диалога"""
+
+    def __init__(self, name, node_ids):
+        self.name = name
+        self.node_ids = node_ids
+        self.reached = set()
+        self.dead_ends = {}      # id узла -> "certain" / "possible"
+        self.unlocks = {}        # (id узла, № выбора) -> {наборы флагов}
+        self.effect_sets = set() # frozenset эффектов (JSON-строки)
+        self.states = 0
+        self.truncated = False   # Наборы эффектов обрезаны по MAX_EFFECT_SETS
+
+    @property
+    def unreachable(self):
+        return [node_id for node_id in self.node_ids if node_id not in self.reached]
+
+    def never_available(self, dialog):
+        """Выборы достижимых узлов, которые не открываются ни при каких флагах"""
+        result = []
+        for node_id in self.node_ids:
+            if node_id not in self.reached:
+                continue
+            for i, choice in enumerate(dialog.nodes[node_id].choices):
+                if (node_id, i) not in self.unlocks:
+                    result.append((node_id, i, choice.text))
+        return result
+
+
+def _leaves(condition):
+    """Листовые условия выражения (списка, all/any/not или листа)"""
+    if isinstance(condition, list):
+        for c in condition:
+            yield from _leaves(c)
+    elif "all" in condition:
+        yield from _leaves(condition["all"])
+    elif "any" in condition:
+        yield from _leaves(condition["any"])
+    elif "not" in condition:
+        yield from _leaves(condition["not"])
+    else:
+        yield condition
+
+
+def _read_flags(choice):
+    """Флаги, которые читают условия выбора"""
+    return {
+        c["name"] for c in _leaves(list(choice.conditions))
+        if c.get("type") in ("flag", "flag_not")
+    }
+
+
+def _flag_domains(dialog):
+    """Возможные значения каждого читаемого флага"""
+    domains = {}
+    for node in dialog.nodes.values():
+        for choice in node.choices:
+            for c in _leaves(list(choice.conditions)):
+                if c.get("type") in ("flag", "flag_not"):
+                    values = domains.setdefault(c["name"], [UNSET, True])
+                    expected = c.get("value", True) if c["type"] == "flag" else None
+                    if c["type"] == "flag" and expected not in values:
+                        values.append(expected)
+    return domains
+
+
+def _live_flags(dialog):
+    """Для каждого узла — флаги, читаемые в нём и в достижимых из него узлах"""
+    live = {
+        node_id: set().union(*(_read_flags(c) for c in node.choices))
+        for node_id, node in dialog.nodes.items()
+    }
+    changed = True
+    while changed:
+        changed = False
+        for node_id, node in dialog.nodes.items():
+            for choice in node.choices:
+                if choice.next is not None and not live[choice.next.id] <= live[node_id]:
+                    live[node_id] |= live[choice.next.id]
+                    changed = True
+    return {node_id: frozenset(flags) for node_id, flags in live.items()}
+
+
+def _evaluate(condition, flags):
+    """
+    Трёхзначное значение условия при известных флагах:
+    True / False или None — зависит от свободных условий.
+    """
+    if isinstance(condition, list) or "all" in condition or "any" in condition:
+        if isinstance(condition, list):
+            parts, is_any = condition, False
+        else:
+            is_any = "any" in condition
+            parts = condition["any"] if is_any else condition["all"]
+        values = [_evaluate(c, flags) for c in parts]
+        decisive = is_any  # any решает первое True, all — первое False
+        if decisive in values:
+            return decisive
+        if None in values:
+            return None
+        return not decisive
+    if "not" in condition:
+        value = _evaluate(condition["not"], flags)
+        return None if value is None else not value
+
+    cond_type = condition.get("type")
+    if cond_type == "flag":
+        return flags.get(condition["name"], UNSET) == condition.get("value", True)
+    if cond_type == "flag_not":
+        return not flags.get(condition["name"], UNSET)
+    return None
+
+
+def _check(conditions, flags):
+    """
+    Символическая проверка условий выбора при известных флагах.
+
+    Returns:
+        (может ли выбор быть доступен, зависит ли это от свободных условий)
+    """
+    value = _evaluate(list(conditions), flags)
+    return value is not False, value is None
+
+
+def _apply(effects, flags):
+    """Символическое применение эффектов: список состояний флагов после них"""
+    states = [dict(flags)]
+    for effect in effects:
+        effect_type = effect.get("type")
+        if effect_type == "flag":
+            for state in states:
+                state[effect["name"]] = effect.get("value", True)
+        elif effect_type == "unlock_event":
+            for state in states:
+                state[EVENT_UNLOCKED.name(effect["id"])] = True
+        elif effect_type in RANDOM_FLAG_EFFECTS:
+            for name in RANDOM_FLAG_EFFECTS[effect_type]:
+                states = [
+                    {**state, name: value}
+                    for state in states
+                    for value in (True, False)
+                ]
+    return states
+
+
+def _effect_key(effect):
+    return json.dumps(effect, ensure_ascii=False, sort_keys=True)
+
+
+def explore_dialog(dialog, name=None, initial_flags=None):
+    """
+    Символически обойти скомпилированный диалог.
+
+    Args:
+        dialog: CompiledDialog
+        name: имя диалога для отчёта (по умолчанию dialog.name)
+        initial_flags: известные значения флагов на старте (остальные перебираются)
+
+    Returns:
+        DialogReport
+    """
+    report = DialogReport(name or dialog.name, list(dialog.nodes))
+    domains = _flag_domains(dialog)
+    live = _live_flags(dialog)
+    known_at_start = dict(initial_flags or {})
+
+    memo = {}
+    active = set()
+
+    def visit(node, flags):
+        key = (node.id, tuple(sorted(
+            (name, flags[name]) for name in live[node.id] if name in flags
+        )))
+        if key in memo:
+            return memo[key]
+        if key in active:
+            # Цикл: дальше этого состояния путь ничего нового не даст
+            return {frozenset()}
+        active.add(key)
+        report.reached.add(node.id)
+        report.states += 1
+
+        results = set()
+        if not node.choices:
+            results.add(frozenset())
+
+        # Флаги узла, значение которых ещё не известно, — перебираем
+        unknown = sorted(
+            {name for c in node.choices for name in _read_flags(c)} - flags.keys()
+        )
+        for values in _product([domains[name] for name in unknown]):
+            assumed = dict(flags)
+            assumed.update(zip(unknown, values))
+
+            passing = []
+            all_free = bool(node.choices)
+            for i, choice in enumerate(node.choices):
+                ok, free = _check(choice.conditions, assumed)
+                if ok:
+                    passing.append(choice)
+                    all_free = all_free and free
+                    read = _read_flags(choice)
+                    report.unlocks.setdefault((node.id, i), set()).add(
+                        frozenset((name, assumed[name]) for name in read)
+                    )
+
+            if node.choices and not passing:
+                report.dead_ends[node.id] = "certain"
+            elif passing and all_free and node.id not in report.dead_ends:
+                report.dead_ends[node.id] = "possible"
+
+            for choice in passing:
+                effects = frozenset(_effect_key(e) for e in choice.effects)
+                for after in _apply(choice.effects, assumed):
+                    if choice.next is None:
+                        tails = {frozenset()}
+                    else:
+                        tails = visit(choice.next, after)
+                    for tail in tails:
+                        if len(results) >= MAX_EFFECT_SETS:
+                            report.truncated = True
+                            break
+                        results.add(effects | tail)
+
+        active.discard(key)
+        memo[key] = results
+        return results
+
+    report.effect_sets = visit(dialog.start, known_at_start)
+    return report
+
+
+def _product(domains):
+    """Декартово произведение списков значений"""
+    combos = [()]
+    for domain in domains:
+        combos = [combo + (value,) for combo in combos for value in domain]
+    return combos
+
+
+def explore_all(names=None):
+    """
+    Исследовать диалоги (по умолчанию — все из data/dialogs).
+
+    Returns:
+        list[(DialogReport, CompiledDialog)]; диалоги с ошибками компиляции пропускаются
+    """
+    if names is None:
+        names = get_repository().list(DIALOGS_DIR)
+    results = []
+    for name in names:
+        dialog = get_dialog(name)
+        if dialog is not None:
+            results.append((explore_dialog(dialog, name), dialog))
+    return results
+
+
+def format_report(report, dialog):
+    """Отчёт в виде строк для вывода"""
+    lines = [
+        f"== {report.name}: узлов {len(report.node_ids)}, "
+        f"состояний {report.states}, путей по эффектам {len(report.effect_sets)}"
+        + (" (обрезано)" if report.truncated else "")
+    ]
+    for node_id in report.unreachable:
+        lines.append(f"  недостижимый узел: {node_id}")
+    for node_id, kind in sorted(report.dead_ends.items()):
+        what = "тупик" if kind == "certain" else "возможный тупик (выборы зависят от денег/репутации/дня/груза)"
+        lines.append(f"  {what}: {node_id}")
+    for node_id, i, text in report.never_available(dialog):
+        lines.append(f"  выбор никогда не доступен: {node_id}[{i + 1}] «{text}»")
+    for (node_id, i), combos in sorted(report.unlocks.items()):
+        if any(combo for combo in combos):
+            shown = " | ".join(
+                ", ".join(f"{name}={value}" for name, value in sorted(combo)) or "—"
+                for combo in sorted(combos, key=sorted)
+            )
+            lines.append(f"  выбор {node_id}[{i + 1}] открыт при: {shown}")
+    for effects in sorted(report.effect_sets, key=lambda e: (len(e), sorted(e))):
+        types = sorted(json.loads(e)["type"] for e in effects)
+        lines.append(f"  эффекты пути: {', '.join(types) or '—'}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Проверка достижимости узлов диалогов")
+    parser.add_argument("names", nargs="*", help="имена диалогов (по умолчанию все)")
+    args = parser.parse_args(argv)
+
+    problems = 0
+    for report, dialog in explore_all(args.names or None):
+        for line in format_report(report, dialog):
+            print(line)
+        problems += len(report.unreachable) + len(report.never_available(dialog))
+        problems += sum(1 for kind in report.dead_ends.values() if kind == "certain")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
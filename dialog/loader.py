@@ -1,12 +1,22 @@
 """
 Загрузка JSON-диалогов из файлов.
+
+Файлы читаются через хранилище контента (utils/content.py):
+каждый диалог разбирается и компилируется один раз и перечитывается,
+только если файл изменился.
 """
 
-import json
 import os
 
-# Базовый путь к данным
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+from dialog.compiler import compile_dialog, DialogCompileError
+from utils.content import get_repository
+
+# Папка диалогов относительно корня контента
+DIALOGS_DIR = os.path.join("data", "dialogs")
+
+
+def _dialog_path(name):
+    return os.path.join(DIALOGS_DIR, f"{name}.json")
 
 
 def load_dialog(name):
@@ -19,31 +29,32 @@ def load_dialog(name):
     Returns:
         dict: данные диалога или None если не найден
     """
-    path = os.path.join(DATA_DIR, "dialogs", f"{name}.json")
+    data = get_repository().get(_dialog_path(name))
+    if data is None:
+        print(f"[ОШИБКА] Диалог не найден: {name}")
+    return data
 
-    if not os.path.exists(path):
-        print(f"[ОШИБКА] Диалог не найден: {path}")
-        return None
 
+def get_dialog(name):
+    """
+    Скомпилированный диалог по имени (компилируется один раз на версию файла).
+
+    Returns:
+        CompiledDialog или None, если диалог не найден или содержит ошибки
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
-        print(f"[ОШИБКА] Ошибка парсинга JSON: {e}")
+        dialog = get_repository().get(_dialog_path(name), build=compile_dialog)
+    except DialogCompileError as e:
+        print(f"[ОШИБКА] Диалог {name}: {e}")
         return None
+    if dialog is None:
+        print(f"[ОШИБКА] Диалог не найден: {name}")
+    return dialog
 
 
 def load_all_dialogs():
     """Загрузить все диалоги из папки"""
-    dialogs = {}
-    dialogs_dir = os.path.join(DATA_DIR, "dialogs")
-
-    if not os.path.exists(dialogs_dir):
-        return dialogs
-
-    for filename in os.listdir(dialogs_dir):
-        if filename.endswith(".json"):
-            name = filename[:-5]  # Убрать .json
-            dialogs[name] = load_dialog(name)
-
-    return dialogs
+    return {
+        name: load_dialog(name)
+        for name in get_repository().list(DIALOGS_DIR)
+    }
@@ -0,0 +1,157 @@
+"""
+Шаблоны текста диалогов: подстановки вида {cargo}, {ship.fuel},
+{reputation.Syndicate}.
+
+Текст разбирается один раз на сегменты (литералы и поля); у каждого поля
+заранее построена функция, достающая значение из контекста. Отрисовка —
+один проход по сегментам. Разобранные шаблоны кэшируются по тексту
+и хранятся в скомпилированных диалогах.
+
+Поля:
+- cargo, destination, origin, reward, faction, deadline, size —
+  заказ, о котором идёт речь: ожидающий принятия или текущий
+  (cargo — название груза на активном языке, хотя в заказе хранится id)
+- order.<поле>, pending_order.<поле>, current_order.<поле>
+- ship.<поле>, reputation.<фракция>, day, money, planet
+
+Неизвестное поле (или поле без значения) остаётся в тексте как есть.
+"""
+
+import re
+
+from utils.i18n import translate
+
+
+# {имя} или {имя.путь}; путь может содержать пробелы (названия фракций)
+FIELD_PATTERN = re.compile(r"\{([A-Za-z_]\w*)(?:\.([^{}]+))?\}")
+
+# Поля заказа, доступные без префикса order.
+ORDER_FIELDS = ("cargo", "destination", "origin", "reward", "faction", "deadline", "size")
+
+# Что подставлять вместо пустого значения поля
+FIELD_DEFAULTS = {"faction": "Частное лицо"}
+
+# Поля заказа, которые выводятся через другой атрибут (id груза -> название)
+ORDER_DISPLAY_ATTRS = {"cargo": "cargo_name"}
+
+# Разобранные шаблоны: {текст: Template}
+_templates = {}
+
+
+class TemplateContext:
+    """Значения для подстановки в текст: состояние игры и заказ разговора"""
+
+    __slots__ = ("state", "order")
+
+    def __init__(self, state):
+        self.state = state
+        self.order = state.pending_order or state.current_order
+
+
+# Корни полей: имя -> функция контекст -> объект
+_ROOTS = {
+    "order": lambda ctx: ctx.order,
+    "pending_order": lambda ctx: ctx.state.pending_order,
+    "current_order": lambda ctx: ctx.state.current_order,
+    "ship": lambda ctx: ctx.state.ship,
+    "reputation": lambda ctx: ctx.state.reputation,
+    "day": lambda ctx: ctx.state.day,
+    "money": lambda ctx: ctx.state.money,
+    "planet": lambda ctx: ctx.state.current_planet,
+}
+
+
+def _lookup(value, path):
+    """Значение по пути: ключ словаря целиком или цепочка атрибутов"""
+    if isinstance(value, dict):
+        return value.get(path)
+    for name in path.split("."):
+        if value is None:
+            return None
+        value = getattr(value, name, None)
+    return value
+
+
+def _field_resolver(root, path, default):
+    """Функция контекст -> строка или None (поле не подставляется)"""
+    get_root = _ROOTS[root]
+
+    def resolve(ctx):
+        base = get_root(ctx)
+        if base is None:
+            return None
+        value = base if path is None else _lookup(base, path)
+        if value is None:
+            return default
+        return str(value)
+
+    return resolve
+
+
+class Template:
+    """Разобранный текст: литералы и поля"""
+
+    __slots__ = ("text", "segments", "is_static")
+
+    def __init__(self, text):
+        self.text = text
+        # (литерал, None) или (исходный текст поля, функция-резолвер)
+        segments = []
+        position = 0
+        for match in FIELD_PATTERN.finditer(text):
+            resolver = _compile_field(match.group(1), match.group(2))
+            if resolver is None:
+                continue
+            if match.start() > position:
+                segments.append((text[position:match.start()], None))
+            segments.append((match.group(0), resolver))
+            position = match.end()
+        if position < len(text):
+            segments.append((text[position:], None))
+        self.segments = tuple(segments)
+        # Нет ни одного поля — текст выводится как есть
+        self.is_static = all(resolver is None for _, resolver in self.segments)
+
+    def render(self, context):
+        """Текст с подставленными значениями (context — TemplateContext)"""
+        if self.is_static:
+            return self.text
+        parts = []
+        for literal, resolver in self.segments:
+            if resolver is None:
+                parts.append(literal)
+            else:
+                value = resolver(context)
+                parts.append(literal if value is None else value)
+        return "".join(parts)
+
+
+def _compile_field(name, path):
+    """Резолвер поля или None, если поле неизвестно"""
+    if name in ORDER_FIELDS and path is None:
+        return _field_resolver("order", ORDER_DISPLAY_ATTRS.get(name, name), FIELD_DEFAULTS.get(name))
+    if name in _ROOTS:
+        if name.endswith("order"):
+            return _field_resolver(name, ORDER_DISPLAY_ATTRS.get(path, path), FIELD_DEFAULTS.get(path))
+        return _field_resolver(name, path, None)
+    return None
+
+
+def parse_template(text):
+    """Разобранный шаблон для текста (кэш по тексту)"""
+    template = _templates.get(text)
+    if template is None:
+        template = Template(text)
+        _templates[text] = template
+    return template
+
+
+def localized_template(message_id, template):
+    """Шаблон перевода сообщения на активный язык (или исходный шаблон)"""
+    text = translate(message_id)
+    return template if text is None else parse_template(text)
+
+
+def render_text(text, state):
+    """Подставить значения из состояния игры в текст"""
+    return parse_template(text).render(TemplateContext(state))
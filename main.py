@@ -1,12 +1,13 @@
 from core.game import start_game
+from utils.i18n import tr
 from utils.save_load import load_game
 
 def main_menu():
     while True:
         print("\n=== Black Hole Co. ===")
-        print("1. Новая игра")
-        print("2. Загрузить игру")
-        print("3. Выход")
+        print("1. " + tr("menu.start.new_game", "Новая игра"))
+        print("2. " + tr("menu.start.load_game", "Загрузить игру"))
+        print("3. " + tr("menu.start.exit", "Выход"))
 
         choice = input("> ")
 
@@ -15,10 +16,10 @@ def main_menu():
         elif choice == "2":
             load_game()
         elif choice == "3":
-            print("Выход из игры.")
+            print(tr("menu.start.goodbye", "Выход из игры."))
             break
         else:
-            print("Неверный ввод.")
+            print(tr("menu.invalid_input", "Неверный ввод."))
 
 if __name__ == "__main__":
     main_menu()
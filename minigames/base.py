@@ -3,6 +3,7 @@
 """
 
 import random
+from utils.i18n import tr
 from utils.io import print_slow
 
 
@@ -28,29 +29,32 @@ class RepairMiniGame(MiniGame):
     """
 
     def __init__(self):
-        super().__init__("Починка системы")
+        super().__init__(tr("game.minigame.repair.name", "Починка системы"))
 
     def play(self, state):
         # Генерируем случайный код
         code = "".join([str(random.randint(1, 9)) for _ in range(3)])
 
-        print("\n=== ПОЧИНКА СИСТЕМЫ ===")
-        print("Модуль повреждён! Введите код для перезагрузки.")
-        print(f"[Подсказка: код состоит из цифр {code[0]}, ? и {code[2]}]")
+        print("\n" + tr("game.minigame.repair.title", "=== ПОЧИНКА СИСТЕМЫ ==="))
+        print(tr("game.minigame.repair.intro", "Модуль повреждён! Введите код для перезагрузки."))
+        print(tr(
+            "game.minigame.repair.hint", "[Подсказка: код состоит из цифр {first}, ? и {last}]",
+            first=code[0], last=code[2]
+        ))
 
         attempts = 3
         while attempts > 0:
-            user_input = input(f"Код ({attempts} попыток): ").strip()
+            user_input = input(tr("game.minigame.repair.prompt", "Код ({attempts} попыток): ", attempts=attempts)).strip()
 
             if user_input == code:
-                print_slow("✓ Система восстановлена!")
+                print_slow(tr("game.minigame.repair.success", "✓ Система восстановлена!"))
                 return True
             else:
                 attempts -= 1
                 if attempts > 0:
-                    print(f"✗ Неверный код.")
+                    print(tr("game.minigame.repair.wrong", "✗ Неверный код."))
 
-        print_slow("✗ Ошибка. Модуль повреждён ещё больше.")
+        print_slow(tr("game.minigame.repair.failure", "✗ Ошибка. Модуль повреждён ещё больше."))
         return False
 
 
@@ -61,11 +65,11 @@ class MeteorFieldMiniGame(MiniGame):
     """
 
     def __init__(self):
-        super().__init__("Метеоритное поле")
+        super().__init__(tr("game.minigame.meteor.name", "Метеоритное поле"))
 
     def play(self, state):
-        print("\n=== МЕТЕОРИТНОЕ ПОЛЕ ===")
-        print_slow("Вы вошли в опасную зону. Множество метеоритов!")
+        print("\n" + tr("game.minigame.meteor.title", "=== МЕТЕОРИТНОЕ ПОЛЕ ==="))
+        print_slow(tr("game.minigame.meteor.intro", "Вы вошли в опасную зону. Множество метеоритов!"))
 
         damage = 0
         stages = 3
@@ -74,35 +78,35 @@ class MeteorFieldMiniGame(MiniGame):
             situation = random.choice(["big", "swarm", "sneak"])
 
             if situation == "big":
-                print(f"\n[Этап {i+1}] Огромный метеорит прямо по курсу!")
+                print("\n" + tr("game.minigame.meteor.big", "[Этап {stage}] Огромный метеорит прямо по курсу!", stage=i + 1))
                 correct = "2"  # Манёвр
             elif situation == "swarm":
-                print(f"\n[Этап {i+1}] Рой мелких метеоритов!")
+                print("\n" + tr("game.minigame.meteor.swarm", "[Этап {stage}] Рой мелких метеоритов!", stage=i + 1))
                 correct = "1"  # Лететь напролом
             else:
-                print(f"\n[Этап {i+1}] Метеорит подкрадывается сбоку!")
+                print("\n" + tr("game.minigame.meteor.sneak", "[Этап {stage}] Метеорит подкрадывается сбоку!", stage=i + 1))
                 correct = "3"  # Стрелять
 
-            print("1. Лететь напролом")
-            print("2. Манёвр уклонения")
-            print("3. Стрелять")
+            print(f"1. {tr('game.minigame.meteor.ram', 'Лететь напролом')}")
+            print(f"2. {tr('game.minigame.meteor.dodge', 'Манёвр уклонения')}")
+            print(f"3. {tr('game.minigame.meteor.shoot', 'Стрелять')}")
 
             choice = input("> ").strip()
 
             if choice == correct:
-                print_slow("✓ Отличный выбор!")
+                print_slow(tr("game.minigame.meteor.good", "✓ Отличный выбор!"))
             else:
                 damage += 20
-                print_slow(f"✗ Неудачно! Получено {20} урона.")
+                print_slow(tr("game.minigame.meteor.hit", "✗ Неудачно! Получено {damage} урона.", damage=20))
 
         if damage == 0:
-            print_slow("\n★ Вы прошли поле без единой царапины!")
+            print_slow("\n" + tr("game.minigame.meteor.flawless", "★ Вы прошли поле без единой царапины!"))
             return True
         elif damage < 60:
-            print_slow(f"\n✓ Вы прошли поле. Общий урон: {damage}")
+            print_slow("\n" + tr("game.minigame.meteor.passed", "✓ Вы прошли поле. Общий урон: {damage}", damage=damage))
             return True
         else:
-            print_slow(f"\n✗ Критические повреждения! Урон: {damage}")
+            print_slow("\n" + tr("game.minigame.meteor.failure", "✗ Критические повреждения! Урон: {damage}", damage=damage))
             return False
 
 
@@ -113,52 +117,52 @@ class ContrabandMiniGame(MiniGame):
     """
 
     def __init__(self):
-        super().__init__("Досмотр")
+        super().__init__(tr("game.minigame.inspection.name", "Досмотр"))
 
     def play(self, state):
-        print("\n=== ДОСМОТР ===")
-        print_slow("Патруль Black Hole Co. требует досмотра вашего груза.")
+        print("\n" + tr("game.minigame.inspection.title", "=== ДОСМОТР ==="))
+        print_slow(tr("game.minigame.inspection.intro", "Патруль Black Hole Co. требует досмотра вашего груза."))
 
         has_contraband = state.flags.get("carrying_contraband")
 
-        print("\nЧто делать?")
-        print("1. Разрешить досмотр")
-        print("2. Предложить взятку (500 кредитов)")
-        print("3. Попытаться сбежать")
+        print("\n" + tr("game.minigame.inspection.prompt", "Что делать?"))
+        print(f"1. {tr('game.minigame.inspection.allow', 'Разрешить досмотр')}")
+        print(f"2. {tr('game.minigame.inspection.bribe', 'Предложить взятку ({amount} кредитов)', amount=500)}")
+        print(f"3. {tr('game.minigame.inspection.flee', 'Попытаться сбежать')}")
 
         choice = input("> ").strip()
 
         if choice == "1":
             if has_contraband:
-                print_slow("✗ Контрабанда обнаружена! Вы арестованы.")
+                print_slow(tr("game.minigame.inspection.caught", "✗ Контрабанда обнаружена! Вы арестованы."))
                 state.change_reputation("BlackHoleCo", -20)
                 state.spend_money(1000)  # Штраф
                 return False
             else:
-                print_slow("✓ Досмотр пройден. Всё чисто.")
+                print_slow(tr("game.minigame.inspection.clean", "✓ Досмотр пройден. Всё чисто."))
                 state.change_reputation("BlackHoleCo", 2)
                 return True
 
         elif choice == "2":
             if state.spend_money(500):
                 if random.random() < 0.8:  # 80% успех
-                    print_slow("✓ Патруль принял взятку. Вы свободны.")
+                    print_slow(tr("game.minigame.inspection.bribe_taken", "✓ Патруль принял взятку. Вы свободны."))
                     return True
                 else:
-                    print_slow("✗ Они отказались и вызвали подкрепление!")
+                    print_slow(tr("game.minigame.inspection.bribe_refused", "✗ Они отказались и вызвали подкрепление!"))
                     state.change_reputation("BlackHoleCo", -15)
                     return False
             else:
-                print_slow("✗ Недостаточно денег!")
+                print_slow(tr("game.minigame.inspection.no_money", "✗ Недостаточно денег!"))
                 return self.play(state)  # Повторить выбор
 
         elif choice == "3":
             if random.random() < 0.4:  # 40% успех
-                print_slow("✓ Вам удалось скрыться!")
+                print_slow(tr("game.minigame.inspection.escaped", "✓ Вам удалось скрыться!"))
                 state.flags.set("wanted_by_bhc")
                 return True
             else:
-                print_slow("✗ Вас догнали. Арест неизбежен.")
+                print_slow(tr("game.minigame.inspection.captured", "✗ Вас догнали. Арест неизбежен."))
                 state.change_reputation("BlackHoleCo", -25)
                 return False
 
@@ -172,28 +176,28 @@ class HackingMiniGame(MiniGame):
     """
 
     def __init__(self):
-        super().__init__("Взлом")
+        super().__init__(tr("game.minigame.hacking.name", "Взлом"))
 
     def play(self, state):
-        print("\n=== ВЗЛОМ СИСТЕМЫ ===")
+        print("\n" + tr("game.minigame.hacking.title", "=== ВЗЛОМ СИСТЕМЫ ==="))
 
         target = [random.choice("ABCD") for _ in range(4)]
         attempts = 6
 
-        print("Угадайте 4-символьный код (A, B, C, D)")
-        print("После каждой попытки вы узнаете:")
-        print("  ● = правильный символ на правильном месте")
-        print("  ○ = правильный символ на неправильном месте")
+        print(tr("game.minigame.hacking.intro", "Угадайте 4-символьный код (A, B, C, D)"))
+        print(tr("game.minigame.hacking.rules", "После каждой попытки вы узнаете:"))
+        print(tr("game.minigame.hacking.exact", "  ● = правильный символ на правильном месте"))
+        print(tr("game.minigame.hacking.misplaced", "  ○ = правильный символ на неправильном месте"))
 
         while attempts > 0:
-            guess = input(f"\nПопытка ({attempts}): ").upper().strip()
+            guess = input("\n" + tr("game.minigame.hacking.prompt", "Попытка ({attempts}): ", attempts=attempts)).upper().strip()
 
             if len(guess) != 4 or not all(c in "ABCD" for c in guess):
-                print("Введите 4 символа (A, B, C, D)")
+                print(tr("game.minigame.hacking.invalid", "Введите 4 символа (A, B, C, D)"))
                 continue
 
             if list(guess) == target:
-                print_slow("✓ ВЗЛОМ УСПЕШЕН!")
+                print_slow(tr("game.minigame.hacking.success", "✓ ВЗЛОМ УСПЕШЕН!"))
                 return True
 
             # Подсчёт подсказок
@@ -209,5 +213,5 @@ class HackingMiniGame(MiniGame):
             print(f"{'●' * exact}{'○' * wrong_place}")
             attempts -= 1
 
-        print_slow(f"✗ Взлом провален. Код был: {''.join(target)}")
+        print_slow(tr("game.minigame.hacking.failure", "✗ Взлом провален. Код был: {code}", code="".join(target)))
         return False
@@ -2,44 +2,33 @@
 Лента новостей — генерация и загрузка новостей.
 """
 
-import json
 import os
 import random
 from news.news import News
-from core.events import check_conditions
+from core.events import ConditionError, EffectError
+from core.reactive import get_index
+from utils.content import get_repository
 
-# Путь к данным
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+# Папка новостей относительно корня контента
+NEWS_DIR = os.path.join("data", "news")
 
 
 def load_news_from_file(filename):
-    """Загрузить новость из JSON-файла"""
-    path = os.path.join(DATA_DIR, "news", filename)
-
-    if not os.path.exists(path):
-        return None
-
+    """Загрузить новость из JSON-файла (из памяти, если файл не менялся)"""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return News(data)
-    except json.JSONDecodeError:
+        return get_repository().get(os.path.join(NEWS_DIR, filename), build=News)
+    except (EffectError, ConditionError) as e:
+        print(f"[ОШИБКА] Новость {filename}: {e}")
         return None
 
 
 def load_all_news():
     """Загрузить все новости из папки"""
     news_list = []
-    news_dir = os.path.join(DATA_DIR, "news")
-
-    if not os.path.exists(news_dir):
-        return news_list
-
-    for filename in os.listdir(news_dir):
-        if filename.endswith(".json"):
-            news = load_news_from_file(filename)
-            if news:
-                news_list.append(news)
+    for name in get_repository().list(NEWS_DIR):
+        news = load_news_from_file(f"{name}.json")
+        if news:
+            news_list.append(news)
 
     return news_list
 
@@ -54,19 +43,20 @@ def get_daily_news(state):
     Returns:
         list[News]: список новостей для показа
     """
-    all_news = load_all_news()
-    daily_news = []
-
-    for news in all_news:
-        # Проверить день
-        if news.day is not None and news.day != state.day:
-            continue
-
-        # Проверить условия
-        if not check_conditions(news.conditions, state):
-            continue
-
-        daily_news.append(news)
+    # Индекс пересчитывает только новости, чьи флаги/деньги/день менялись
+    index = get_index(state, "news")
+    names = get_repository().list(NEWS_DIR)
+    loaded = {}
+    for name in names:
+        news = load_news_from_file(f"{name}.json")
+        if news:
+            loaded[name] = news
+            index.add(name, news.is_due)  # Новая версия файла — новая проверка
+        else:
+            index.remove(name)
+
+    eligible = index.eligible()
+    daily_news = [loaded[name] for name in names if name in eligible]
 
     # Добавить случайную новость (если нет запланированных)
     if not daily_news and random.random() < 0.3:
@@ -81,26 +71,31 @@ def generate_random_news(state):
     """Сгенерировать случайную новость"""
     templates = [
         {
+            "id": "random_fuel_prices",
             "title": "Рост цен на топливо",
             "text": "Стоимость топлива выросла на 15% из-за конфликта в секторе Омега.",
             "effects": []
         },
         {
+            "id": "random_trade_route",
             "title": "Новый торговый маршрут",
             "text": "Открыт безопасный маршрут через астероидный пояс.",
             "effects": []
         },
         {
+            "id": "random_pirates",
             "title": "Пиратская активность",
             "text": "В секторе Outer Ring замечена повышенная активность пиратов.",
             "effects": [{"type": "flag", "name": "pirates_active"}]
         },
         {
+            "id": "random_hyperdrive",
             "title": "Технологический прорыв",
             "text": "Учёные с Kepler Station сообщают о прорыве в технологии гиперпривода.",
             "effects": []
         },
         {
+            "id": "random_dock_strike",
             "title": "Забастовка докеров",
             "text": "На Титане началась забастовка. Загрузка грузов может занять больше времени.",
             "effects": [{"type": "flag", "name": "titan_strike"}]
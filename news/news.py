@@ -2,7 +2,8 @@
 Новость — событие, влияющее на мир игры.
 """
 
-from core.events import apply_effects
+from core.events import compile_conditions, compile_effects, run_effects
+from utils.i18n import tr
 from utils.io import print_slow
 
 
@@ -10,26 +11,40 @@ class News:
     """Класс новости"""
 
     def __init__(self, data):
+        self.id = data.get("id")  # Для переводов (news.<id>.title / .text)
         self.title = data.get("title", "Без заголовка")
         self.text = data.get("text", "")
         self.effects = data.get("effects", [])
+        # Эффекты и условия компилируются при загрузке
+        # (EffectError / ConditionError, если тип неизвестен)
+        self._effects = compile_effects(self.effects)
         self.day = data.get("day")  # На какой день показывать
         self.conditions = data.get("conditions", [])  # Условия показа
+        self.is_available = compile_conditions(self.conditions)
+        # Показывать сегодня: день совпадает (если задан) и условия выполнены
+        scheduled = [] if self.day is None else [{"type": "day_eq", "value": self.day}]
+        self.is_due = compile_conditions(scheduled + list(self.conditions))
 
     def show(self, state):
         """Показать новость и применить эффекты"""
+        title, text = self.title, self.text
+        if self.id:
+            title = tr(f"news.{self.id}.title", title)
+            text = tr(f"news.{self.id}.text", text)
+
         print(f"\n╔{'═' * 40}╗")
-        print(f"║ 📰 НОВОСТИ")
+        print(f"║ 📰 {tr('game.news_header', 'НОВОСТИ')}")
         print(f"╠{'═' * 40}╣")
-        print(f"║ {self.title}")
+        print(f"║ {title}")
         print(f"╚{'═' * 40}╝")
-        print_slow(self.text)
+        print_slow(text)
 
         # Применить эффекты
-        apply_effects(self.effects, state)
+        run_effects(self._effects, state)
 
     def to_dict(self):
         return {
+            "id": self.id,
             "title": self.title,
             "text": self.text,
             "effects": self.effects,
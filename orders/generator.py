@@ -3,38 +3,35 @@
 """
 
 import random
+from core import map as galaxy_map
+from core.routing import INF
 from orders.order import Order
 
 
 # Базовые данные для генерации
 CARGO_TYPES = [
-    "Медикаменты",
-    "Электроника",
-    "Продовольствие",
-    "Топливо",
-    "Запчасти",
-    "Оружие",
-    "Редкие металлы",
-    "Научное оборудование",
-    "Колонисты",
-    "VIP-пассажир"
-]
-
-PLANETS = [
-    "Station Alpha",
-    "Марс-3",
-    "Титан",
-    "Europa Prime",
-    "Вода",
-    "Меза",
-    "Новая Земля",
-    "Kepler Station",
-    "Outer Ring"
+    "medicine",
+    "electronics",
+    "food",
+    "fuel",
+    "spare_parts",
+    "weapons",
+    "rare_metals",
+    "science_equipment",
+    "colonists",
+    "vip_passenger"
 ]
 
 FACTIONS = ["BlackHoleCo", "Union", "Syndicate", None]
 
-CONTRABAND_ITEMS = ["Оружие", "Контрабанда", "Редкие металлы", "Наркотики"]
+CONTRABAND_ITEMS = ["weapons", "contraband", "rare_metals", "drugs"]
+
+# Объём груза в единицах грузового отсека
+MIN_ORDER_SIZE = 1
+MAX_ORDER_SIZE = 4
+
+# Шанс, что груз нужно сначала забрать на другой планете
+REMOTE_PICKUP_CHANCE = 0.25
 
 
 def generate_order(state):
@@ -54,12 +51,14 @@ def generate_order(state):
     # Выбрать груз
     cargo = random.choice(CARGO_TYPES)
 
-    # Выбрать пункт назначения (не текущая планета)
-    available_planets = [p for p in PLANETS if p != state.current_planet]
+    # Выбрать пункт назначения (не текущая планета) среди планет карты
+    registry = galaxy_map.get_planet_registry()
+    here = state.planet_id
+    available_planets = [p for p in registry if p != here]
 
     # Исключить опасные зоны если игрок осторожен
     for planet in available_planets[:]:
-        if state.flags.get(f"dead_zone_{planet}"):
+        if planet in state.dead_zones:
             if random.random() < 0.7:  # 70% шанс не предлагать опасный маршрут
                 available_planets.remove(planet)
 
@@ -68,6 +67,12 @@ def generate_order(state):
 
     destination = random.choice(available_planets)
 
+    # Пункт погрузки: обычно здесь, иногда на другой планете
+    origin = here
+    if len(registry) > 2 and random.random() < REMOTE_PICKUP_CHANCE:
+        pickup_planets = [p for p in registry if p not in (here, destination)]
+        origin = random.choice(pickup_planets)
+
     # Рассчитать награду (зависит от дня и репутации)
     base_reward = random.randint(100, 500)
     day_multiplier = 1 + (state.day * 0.05)  # +5% за каждый день
@@ -86,15 +91,23 @@ def generate_order(state):
     
     return Order(
         cargo=cargo,
-        origin=state.current_planet,
+        origin=origin,
         destination=destination,
         reward=reward,
         deadline=deadline,
         faction=faction,
-        is_contraband=is_contraband
+        is_contraband=is_contraband,
+        size=random.randint(MIN_ORDER_SIZE, MAX_ORDER_SIZE)
     )
 
 
+def _most_remote_planet(state):
+    """Самая далёкая достижимая планета — туда отправляют спасателей"""
+    tree = galaxy_map.get_paths_from(state.current_planet)
+    reachable = [p for p in galaxy_map.get_planet_registry() if tree.dist[p] != INF]
+    return max(reachable, key=lambda p: tree.dist[p])
+
+
 def generate_special_order(state, order_type):
     """
     Сгенерировать специальный сюжетный заказ.
@@ -105,8 +118,8 @@ def generate_special_order(state, order_type):
     """
     if order_type == "contraband":
         return Order(
-            cargo="Контрабанда",
-            origin=state.current_planet,
+            cargo="contraband",
+            origin=state.planet_id,
             destination="Outer Ring",
             reward=2000,
             faction="Syndicate",
@@ -115,9 +128,9 @@ def generate_special_order(state, order_type):
 
     elif order_type == "rescue":
         return Order(
-            cargo="Спасательная миссия",
-            origin=state.current_planet,
-            destination="X-17",
+            cargo="rescue_mission",
+            origin=state.planet_id,
+            destination=_most_remote_planet(state),
             reward=1500,
             deadline=state.day + 2,
             faction="Union"
@@ -125,8 +138,8 @@ def generate_special_order(state, order_type):
 
     elif order_type == "secret":
         return Order(
-            cargo="Секретный груз",
-            origin=state.current_planet,
+            cargo="secret_cargo",
+            origin=state.planet_id,
             destination="Kepler Station",
             reward=3000,
             faction="BlackHoleCo"
@@ -2,37 +2,92 @@
 Заказ — задание на доставку груза.
 """
 
+from core import map as galaxy_map
+from core.bus import OrderCompleted, OrderFailed, get_bus
+from utils.i18n import tr
+
+# Названия грузов на исходном языке по стабильным id
+# (переводы — cargo.<id> в data/locales)
+CARGO_NAMES = {
+    "medicine": "Медикаменты",
+    "electronics": "Электроника",
+    "food": "Продовольствие",
+    "fuel": "Топливо",
+    "spare_parts": "Запчасти",
+    "weapons": "Оружие",
+    "rare_metals": "Редкие металлы",
+    "science_equipment": "Научное оборудование",
+    "colonists": "Колонисты",
+    "vip_passenger": "VIP-пассажир",
+    "contraband": "Контрабанда",
+    "drugs": "Наркотики",
+    "rescue_mission": "Спасательная миссия",
+    "secret_cargo": "Секретный груз",
+    "robot_equipment": "Оборудование для робота",
+}
+
+# Старые сохранения хранили название груза вместо id
+_CARGO_IDS = {name: cargo_id for cargo_id, name in CARGO_NAMES.items()}
+
+
+def cargo_name(cargo_id):
+    """Название груза на активном языке (неизвестный id выводится как есть)"""
+    default = CARGO_NAMES.get(cargo_id)
+    if default is None:
+        return cargo_id
+    return tr(f"cargo.{cargo_id}", default)
+
 
 class Order:
     """Класс заказа на доставку"""
 
-    def __init__(self, cargo, origin, destination, reward, deadline=None, faction=None, is_contraband=False):
-        self.cargo = cargo  # Название груза
-        self.origin = origin  # Откуда
-        self.destination = destination  # Куда
+    def __init__(self, cargo, origin, destination, reward, deadline=None, faction=None, is_contraband=False,
+                 size=1):
+        registry = galaxy_map.get_planet_registry()
+        self.cargo = cargo  # id груза (CARGO_NAMES); название — cargo_name
+        self.origin_id = registry.resolve(origin)  # Откуда (id или имя планеты)
+        self.destination_id = registry.resolve(destination)  # Куда (id или имя планеты)
         self.reward = reward  # Награда в кредитах
         self.deadline = deadline  # Дедлайн (день) или None
         self.faction = faction  # От какой фракции заказ
         self.is_contraband = is_contraband # Является ли груз контрабандой
+        self.size = size  # Сколько места занимает в грузовом отсеке
 
+        self.picked_up = False  # Груз уже на борту
         self.is_completed = False
         self.is_failed = False
 
+    @property
+    def cargo_name(self):
+        """Название груза на активном языке"""
+        return cargo_name(self.cargo)
+
+    @property
+    def origin(self):
+        """Имя планеты отправления"""
+        return galaxy_map.planet_name(self.origin_id)
+
+    @property
+    def destination(self):
+        """Имя планеты назначения"""
+        return galaxy_map.planet_name(self.destination_id)
+
     def show(self):
         """Показать информацию о заказе"""
-        print("\n=== ЗАКАЗ ===")
-        print(f"Груз: {self.cargo}")
+        print("\n" + tr("game.order.title", "=== ЗАКАЗ ==="))
+        print(tr("game.order.cargo", "Груз: {cargo}", cargo=self.cargo_name))
         if self.is_contraband:
-             print("⚠️ [НЕЛЕГАЛЬНЫЙ ГРУЗ]")
-        print(f"Откуда: {self.origin}")
-        print(f"Куда: {self.destination}")
-        print(f"Награда: {self.reward} кредитов")
+             print(tr("game.order.illegal", "⚠️ [НЕЛЕГАЛЬНЫЙ ГРУЗ]"))
+        print(tr("game.order.origin", "Откуда: {planet}", planet=self.origin))
+        print(tr("game.order.destination", "Куда: {planet}", planet=self.destination))
+        print(tr("game.order.reward", "Награда: {reward} кредитов", reward=self.reward))
+        print(tr("game.order.size", "Объём: {size}", size=self.size))
 
         if self.deadline:
-            print(f"Дедлайн: День {self.deadline}")
+            print(tr("game.order.deadline", "Дедлайн: День {day}", day=self.deadline))
 
         if self.faction:
-            print(f"Заказчик: {self.faction}")
+            print(tr("game.order.client", "Заказчик: {faction}", faction=self.faction))
 
     def check_deadline(self, current_day):
         """Проверить, просрочен ли заказ"""
@@ -54,7 +109,8 @@ class Order:
             "destination": self.destination,
             "reward": self.reward
         })
-        state.current_order = None
+        state.remove_order(self)
+        get_bus().emit(OrderCompleted, self, self.reward, state.day)
 
     def fail(self, state):
         """Провалить заказ"""
@@ -63,7 +119,8 @@ class Order:
         if self.faction:
             state.change_reputation(self.faction, -10)
 
-        state.current_order = None
+        state.remove_order(self)
+        get_bus().emit(OrderFailed, self, state.day)
 
     def to_dict(self):
         return {
@@ -73,17 +130,22 @@ class Order:
             "reward": self.reward,
             "deadline": self.deadline,
             "faction": self.faction,
-            "is_contraband": self.is_contraband
+            "is_contraband": self.is_contraband,
+            "size": self.size,
+            "picked_up": self.picked_up
         }
 
     @classmethod
     def from_dict(cls, data):
-        return cls(
-            cargo=data["cargo"],
+        order = cls(
+            cargo=_CARGO_IDS.get(data["cargo"], data["cargo"]),
             origin=data["origin"],
             destination=data["destination"],
             reward=data["reward"],
             deadline=data.get("deadline"),
             faction=data.get("faction"),
-            is_contraband=data.get("is_contraband", False)
+            is_contraband=data.get("is_contraband", False),
+            size=data.get("size", 1)
         )
+        order.picked_up = data.get("picked_up", False)
+        return order
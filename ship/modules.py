@@ -2,10 +2,14 @@
 Модули корабля — компоненты, которые можно улучшать и ремонтировать.
 """
 
+from utils.i18n import tr
+
 
 class Module:
     """Базовый модуль корабля"""
 
+    message_id = None  # id перевода названия (у стандартных модулей)
+
     def __init__(self, name, level=1, max_health=100):
         self.name = name
         self.level = level
@@ -35,8 +39,15 @@ class Module:
 
     def get_status(self):
         """Получить статус модуля"""
-        status = "СЛОМАН" if self.is_broken else f"{self.health}/{self.max_health}"
-        return f"{self.name} (Ур.{self.level}): {status}"
+        if self.is_broken:
+            status = tr("game.ship.broken", "СЛОМАН")
+        else:
+            status = f"{self.health}/{self.max_health}"
+        name = tr(self.message_id, self.name) if self.message_id else self.name
+        return tr(
+            "game.ship.module_status", "{name} (Ур.{level}): {status}",
+            name=name, level=self.level, status=status
+        )
 
     def to_dict(self):
         return {
@@ -49,7 +60,12 @@ class Module:
 
     @classmethod
     def from_dict(cls, data):
-        module = cls(data["name"], data["level"], data["max_health"])
+        if cls is Module:
+            module = cls(data["name"], data["level"], data["max_health"])
+        else:
+            # Подклассы сами задают имя и характеристики по уровню
+            module = cls(data["level"])
+            module.max_health = data["max_health"]
         module.health = data["health"]
         module.is_broken = data["is_broken"]
         return module
@@ -58,6 +74,8 @@ class Module:
 class EngineModule(Module):
     """Двигатель — влияет на скорость перемещения"""
 
+    message_id = "ship.module.engine"
+
     def __init__(self, level=1):
         super().__init__("Двигатель", level)
         self.speed = 1.0 + (level * 0.2)
@@ -70,6 +88,8 @@ class EngineModule(Module):
 class ShieldModule(Module):
     """Щит — защита от урона"""
 
+    message_id = "ship.module.shield"
+
     def __init__(self, level=1):
         super().__init__("Щит", level)
         self.protection = 0.1 * level  # 10% защиты за уровень
@@ -82,6 +102,8 @@ class ShieldModule(Module):
 class CargoModule(Module):
     """Грузовой отсек — влияет на максимальный груз"""
 
+    message_id = "ship.module.cargo"
+
     def __init__(self, level=1):
         super().__init__("Грузовой отсек", level)
         self.capacity = 5 + (level * 5)  # Базовая вместимость 10
@@ -94,6 +116,8 @@ class CargoModule(Module):
 class ScannerModule(Module):
     """Сканер — обнаружение опасностей и ресурсов"""
 
+    message_id = "ship.module.scanner"
+
     def __init__(self, level=1):
         super().__init__("Сканер", level)
         self.range = level  # Дальность сканирования
@@ -3,12 +3,16 @@
 """
 
 from ship.modules import EngineModule, ShieldModule, CargoModule, ScannerModule
+from utils.i18n import tr
+
+# Название корабля по умолчанию (переводится при выводе, в сохранении — как есть)
+DEFAULT_SHIP_NAME = "Стандартный грузовик"
 
 
 class Ship:
     """Космический корабль игрока"""
 
-    def __init__(self, name="Стандартный грузовик"):
+    def __init__(self, name=DEFAULT_SHIP_NAME):
         self.name = name
 
         # Модули корабля
@@ -71,11 +75,12 @@ class Ship:
 
     def get_status(self):
         """Получить полный статус корабля"""
+        name = tr("ship.default_name", self.name) if self.name == DEFAULT_SHIP_NAME else self.name
         lines = [
-            f"=== {self.name} ===",
-            f"Топливо: {self.fuel}/{self.max_fuel}",
+            f"=== {name} ===",
+            tr("game.ship.fuel", "Топливо: {fuel}/{max_fuel}", fuel=self.fuel, max_fuel=self.max_fuel),
             "",
-            "Модули:"
+            tr("game.ship.modules", "Модули:")
         ]
         for module in self.get_all_modules():
             lines.append(f"  {module.get_status()}")
@@ -100,12 +105,11 @@ class Ship:
     @classmethod
     def from_dict(cls, data):
         """Для загрузки"""
-        from ship.modules import Module
         ship = cls(data["name"])
         ship.fuel = data["fuel"]
         ship.max_fuel = data["max_fuel"]
-        ship.engine = Module.from_dict(data["engine"])
-        ship.shield = Module.from_dict(data["shield"])
-        ship.cargo = Module.from_dict(data["cargo"])
-        ship.scanner = Module.from_dict(data["scanner"])
+        ship.engine = EngineModule.from_dict(data["engine"])
+        ship.shield = ShieldModule.from_dict(data["shield"])
+        ship.cargo = CargoModule.from_dict(data["cargo"])
+        ship.scanner = ScannerModule.from_dict(data["scanner"])
         return ship
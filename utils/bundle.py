@@ -0,0 +1,172 @@
+"""
+Упакованный бандл контента: все JSON-файлы диалогов, новостей и персонажей
+в одном файле с индексом смещений.
+
+Формат (little-endian):
+    заголовок   BUNDLE_MAGIC, версия формата (u32), число записей (u32)
+    индекс      на каждую запись: смещение (u64), длина (u32),
+                mtime исходного файла в нс (i64), размер исходного файла (u32),
+                длина пути (u16), путь (UTF-8, разделитель "/")
+    данные      содержимое файлов (JSON в UTF-8) подряд
+
+Во время игры бандл отображается в память (mmap): при открытии читается
+только индекс, а запись разбирается из JSON при первом обращении.
+Если бандла нет, хранилище контента читает отдельные файлы.
+
+Бандл помнит mtime и размер исходных файлов: если файл рядом с бандлом
+изменился, хранилище читает его, а не устаревшую запись бандла.
+Чтобы снова читать всё из бандла, его нужно пересобрать:
+    python -m utils.bundle
+"""
+
+import json
+import mmap
+import os
+import struct
+
+from utils.content import CONTENT_ROOT
+
+BUNDLE_MAGIC = b"BHCBNDL\0"
+BUNDLE_FORMAT_VERSION = 2
+
+BUNDLE_PATH = os.path.join(CONTENT_ROOT, "data", "cache", "content.bundle")
+
+# Что упаковывается: папки с JSON-файлами и отдельные файлы
+BUNDLE_DIRS = [os.path.join("data", "dialogs"), os.path.join("data", "news")]
+BUNDLE_FILES = [os.path.join("characters", "characters.json")]
+
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<QIqIH")
+
+
+def bundle_key(relpath):
+    """Путь записи в бандле (одинаковый на всех ОС)"""
+    return relpath.replace(os.sep, "/")
+
+
+def _collect(root):
+    """Пути (относительно root) всех упаковываемых файлов"""
+    paths = []
+    for subdir in BUNDLE_DIRS:
+        directory = os.path.join(root, subdir)
+        if os.path.isdir(directory):
+            paths.extend(
+                os.path.join(subdir, filename)
+                for filename in sorted(os.listdir(directory))
+                if filename.endswith(".json")
+            )
+    paths.extend(p for p in BUNDLE_FILES if os.path.exists(os.path.join(root, p)))
+    return paths
+
+
+def build_bundle(root=CONTENT_ROOT, path=BUNDLE_PATH):
+    """
+    Собрать бандл из отдельных файлов контента.
+
+    JSON перед упаковкой проверяется и сжимается (без отступов).
+
+    Returns:
+        int: число упакованных файлов
+    """
+    blobs = []
+    for relpath in _collect(root):
+        source = os.path.join(root, relpath)
+        stat = os.stat(source)
+        with open(source, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        blob = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        blobs.append((bundle_key(relpath).encode("utf-8"), blob, (stat.st_mtime_ns, stat.st_size)))
+
+    index_size = sum(_ENTRY.size + len(key) for key, _, _ in blobs)
+    offset = _HEADER.size + index_size
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, len(blobs)))
+        for key, blob, (mtime_ns, size) in blobs:
+            f.write(_ENTRY.pack(offset, len(blob), mtime_ns, size, len(key)))
+            f.write(key)
+            offset += len(blob)
+        for _, blob, _ in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return len(blobs)
+
+
+class ContentBundle:
+    """
+    Бандл, отображённый в память. Запись разбирается из JSON только
+    при обращении к ней (результат запоминает хранилище контента).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Неподдерживаемый формат бандла: {path}")
+
+        # путь -> (смещение, длина, (mtime исходника в нс, размер исходника))
+        self._index = {}
+        position = _HEADER.size
+        for _ in range(count):
+            offset, length, mtime_ns, size, key_length = _ENTRY.unpack_from(self._mmap, position)
+            position += _ENTRY.size
+            key = self._mmap[position:position + key_length].decode("utf-8")
+            position += key_length
+            self._index[key] = (offset, length, (mtime_ns, size))
+
+    def __contains__(self, relpath):
+        return bundle_key(relpath) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def stamp(self, relpath):
+        """(mtime в нс, размер) исходного файла при сборке или None"""
+        entry = self._index.get(bundle_key(relpath))
+        return None if entry is None else entry[2]
+
+    def get(self, relpath):
+        """Данные записи или None, если её нет в бандле"""
+        entry = self._index.get(bundle_key(relpath))
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        return json.loads(self._mmap[offset:offset + length].decode("utf-8"))
+
+    def list(self, subdir, suffix=".json"):
+        """Имена файлов папки (без расширения) или None, если папки нет в бандле"""
+        prefix = bundle_key(subdir).rstrip("/") + "/"
+        names = sorted(
+            key[len(prefix):-len(suffix)]
+            for key in self._index
+            if key.startswith(prefix) and key.endswith(suffix) and "/" not in key[len(prefix):]
+        )
+        return names or None
+
+    def close(self):
+        self._mmap.close()
+
+
+def open_bundle(path=BUNDLE_PATH):
+    """Открыть бандл, если он собран; иначе None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return ContentBundle(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[ОШИБКА] Не удалось открыть бандл контента: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    count = build_bundle()
+    print(f"Бандл собран: {BUNDLE_PATH} ({count} файлов)")
@@ -0,0 +1,159 @@
+"""
+Единое хранилище игрового контента в памяти.
+
+Диалоги, новости и персонажи читаются с диска лениво, один раз,
+и дальше отдаются из памяти. Перед выдачей проверяется mtime файла:
+если файл изменился, перечитывается только он. Списки файлов в папках
+кэшируются так же — по mtime папки.
+
+Вместе с сырыми данными можно хранить построенные из них объекты
+(скомпилированный диалог, News): build-функция вызывается один раз
+на версию файла.
+
+Если собран бандл контента (utils/bundle.py), файлы берутся из
+отображённого в память бандла, пока исходный файл не изменился с момента
+сборки (mtime и размер записаны в бандле); изменённый файл читается
+с диска. Бандл без исходных файлов рядом (поставка игры) читается целиком.
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+# Корень репозитория: пути контента задаются относительно него
+CONTENT_ROOT = os.path.dirname(os.path.dirname(__file__))
+
+# Сколько записей держать в памяти (None — без ограничения)
+CONTENT_CACHE_MAX_ITEMS = None
+
+# Хранилище текущей сессии
+_repository = None
+
+
+class ContentRepository:
+    """Ленивый кэш JSON-файлов с инвалидацией по mtime и LRU-вытеснением"""
+
+    def __init__(self, root=CONTENT_ROOT, max_items=CONTENT_CACHE_MAX_ITEMS, bundle=None):
+        self.root = root
+        self.max_items = max_items
+        self.bundle = bundle  # ContentBundle или None
+        # (путь, build) -> (отпечаток файла, значение)
+        self._entries = OrderedDict()
+        # папка -> (mtime папки, имена файлов)
+        self._listings = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0   # Промахи из-за изменённого файла
+        self.evictions = 0
+
+    def _path(self, relpath):
+        return relpath if os.path.isabs(relpath) else os.path.join(self.root, relpath)
+
+    def get(self, relpath, build=None):
+        """
+        Содержимое JSON-файла (или build(данные) от него).
+
+        Args:
+            relpath: путь относительно корня (например "data/dialogs/intro.json")
+            build: функция, строящая объект из данных (вызывается один раз
+                   на версию файла); исключения build не перехватываются
+
+        Returns:
+            данные / построенный объект или None, если файла нет или JSON битый
+        """
+        path = self._path(relpath)
+        try:
+            stat = os.stat(path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+
+        # Запись бандла годится, пока исходный файл тот же, что при сборке
+        bundled = self.bundle.stamp(relpath) if self.bundle is not None else None
+        from_bundle = bundled is not None and (stamp is None or stamp == bundled)
+        if from_bundle:
+            stamp = bundled
+        elif stamp is None:
+            return None
+
+        key = (relpath, build)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        if entry is not None:
+            self.reloads += 1
+
+        value = self.bundle.get(relpath) if from_bundle else self._read(path)
+        if value is not None and build is not None:
+            value = build(value)
+        if value is None:
+            return None
+
+        self._entries[key] = (stamp, value)
+        self._entries.move_to_end(key)
+        if self.max_items is not None:
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def _read(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"[ОШИБКА] Ошибка парсинга JSON ({path}): {e}")
+            return None
+
+    def list(self, subdir, suffix=".json"):
+        """
+        Имена файлов папки (без расширения), кэш до изменения папки.
+        Список из бандла — только если самой папки на диске нет.
+        """
+        path = self._path(subdir)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            names = self.bundle.list(subdir, suffix) if self.bundle is not None else None
+            return names or []
+
+        cached = self._listings.get(subdir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        names = sorted(
+            filename[:-len(suffix)]
+            for filename in os.listdir(path)
+            if filename.endswith(suffix)
+        )
+        self._listings[subdir] = (mtime, names)
+        return names
+
+    def clear(self):
+        """Забыть всё загруженное (счётчики сохраняются)"""
+        self._entries.clear()
+        self._listings.clear()
+
+    def stats(self):
+        """Счётчики попаданий и промахов"""
+        return {
+            "items": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "evictions": self.evictions,
+        }
+
+
+def get_repository():
+    """Хранилище контента текущей сессии (с бандлом, если он собран)"""
+    global _repository
+    if _repository is None:
+        from utils.bundle import open_bundle
+        _repository = ContentRepository(bundle=open_bundle())
+    return _repository
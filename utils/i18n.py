@@ -0,0 +1,248 @@
+"""
+Локализация текста для игрока.
+
+Исходный язык — русский: тексты по умолчанию записаны в коде и JSON-контенте,
+для него каталоги не нужны и не загружаются. Переводы на другие языки
+лежат в data/locales/<язык>.json (плоский словарь {id сообщения: текст}).
+
+Каталог активного языка загружается лениво, при первом обращении к нему:
+JSON компилируется в компактный индексированный файл
+data/cache/locale_<язык>.cat (заголовок, отсортированная таблица смещений
+фиксированного размера, строки), который отображается в память.
+Поиск сообщения — двоичный поиск по таблице; декодируются только
+запрошенные строки. Каталоги общие для всех сессий и только для чтения.
+
+Идентификаторы сообщений:
+    menu.*, game.*          — меню и экраны игры
+    cargo.<id груза>        — названия грузов
+    ship.*                  — корабль и его модули
+    news.<id>.title/.text   — новости
+    dialog.<диалог>.<узел>  — текст узла, .<№ выбора> — текст выбора,
+    dialog.<диалог>.speaker — имя говорящего (.<узел>.speaker — если своё у узла)
+
+Язык выбирается переменной окружения BHC_LOCALE или set_locale().
+
+Компиляция всех каталогов и выгрузка текста контента для переводчиков:
+    python -m utils.i18n build
+    python -m utils.i18n extract > messages.json
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+
+from utils.content import CONTENT_ROOT
+
+SOURCE_LOCALE = "ru"
+
+LOCALES_DIR = os.path.join(CONTENT_ROOT, "data", "locales")
+CATALOG_CACHE_DIR = os.path.join(CONTENT_ROOT, "data", "cache")
+
+CATALOG_MAGIC = b"BHCCAT\0\0"
+CATALOG_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+# смещение id, длина id, смещение текста, длина текста
+_ENTRY = struct.Struct("<IHII")
+
+_active_locale = os.environ.get("BHC_LOCALE", SOURCE_LOCALE)
+
+# Загруженные каталоги: {язык: Catalog или None, если перевода нет}
+_catalogs = {}
+
+
+class Catalog:
+    """Скомпилированный каталог сообщений, отображённый в память"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Неподдерживаемый формат каталога: {path}")
+        # Уже найденные сообщения (и отсутствующие — None)
+        self._found = {}
+
+    def __len__(self):
+        return self._count
+
+    def _key(self, i):
+        key_offset, key_length, _, _ = _ENTRY.unpack_from(self._mmap, _HEADER.size + i * _ENTRY.size)
+        return self._mmap[key_offset:key_offset + key_length]
+
+    def get(self, message_id):
+        """Текст сообщения или None, если его нет в каталоге"""
+        if message_id in self._found:
+            return self._found[message_id]
+
+        key = message_id.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        text = None
+        if lo < self._count and self._key(lo) == key:
+            _, _, offset, length = _ENTRY.unpack_from(self._mmap, _HEADER.size + lo * _ENTRY.size)
+            text = self._mmap[offset:offset + length].decode("utf-8")
+        self._found[message_id] = text
+        return text
+
+
+def source_path(locale):
+    return os.path.join(LOCALES_DIR, f"{locale}.json")
+
+
+def catalog_path(locale):
+    return os.path.join(CATALOG_CACHE_DIR, f"locale_{locale}.cat")
+
+
+def compile_catalog(locale):
+    """
+    Скомпилировать data/locales/<язык>.json в индексированный файл.
+
+    Returns:
+        str: путь к скомпилированному каталогу
+    """
+    with open(source_path(locale), "r", encoding="utf-8") as f:
+        messages = json.load(f)
+
+    # Таблица сортируется по байтам id — так же сравнивает двоичный поиск
+    items = sorted(
+        (key.encode("utf-8"), text.encode("utf-8")) for key, text in messages.items()
+    )
+    offset = _HEADER.size + len(items) * _ENTRY.size
+    entries = []
+    for key, text in items:
+        entries.append(_ENTRY.pack(offset, len(key), offset + len(key), len(text)))
+        offset += len(key) + len(text)
+
+    path = catalog_path(locale)
+    if not os.path.exists(CATALOG_CACHE_DIR):
+        os.makedirs(CATALOG_CACHE_DIR)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(CATALOG_MAGIC, CATALOG_FORMAT_VERSION, len(items)))
+        f.writelines(entries)
+        for key, text in items:
+            f.write(key)
+            f.write(text)
+    os.replace(tmp_path, path)
+    return path
+
+
+def get_catalog(locale):
+    """Каталог языка (компилируется при первом обращении) или None"""
+    if locale in _catalogs:
+        return _catalogs[locale]
+
+    catalog = None
+    source = source_path(locale)
+    if locale != SOURCE_LOCALE and os.path.exists(source):
+        path = catalog_path(locale)
+        try:
+            if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source):
+                compile_catalog(locale)
+            catalog = Catalog(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[ОШИБКА] Не удалось загрузить каталог {locale}: {e}")
+    _catalogs[locale] = catalog
+    return catalog
+
+
+def available_locales():
+    """Исходный язык и языки, для которых есть каталоги"""
+    locales = {SOURCE_LOCALE}
+    if os.path.isdir(LOCALES_DIR):
+        locales.update(f[:-5] for f in os.listdir(LOCALES_DIR) if f.endswith(".json"))
+    return sorted(locales)
+
+
+def get_locale():
+    return _active_locale
+
+
+def set_locale(locale):
+    """Сменить язык; каталог загрузится при первом сообщении"""
+    global _active_locale
+    _active_locale = locale
+
+
+def translate(message_id):
+    """Перевод сообщения на активный язык или None (исходный язык / нет перевода)"""
+    if _active_locale == SOURCE_LOCALE or message_id is None:
+        return None
+    catalog = get_catalog(_active_locale)
+    if catalog is None:
+        return None
+    return catalog.get(message_id)
+
+
+def tr(message_id, default, **fields):
+    """
+    Текст сообщения на активном языке.
+
+    Args:
+        message_id: id сообщения в каталоге
+        default: текст на исходном языке (если перевода нет)
+        fields: значения для подстановки {имя} через str.format
+
+    Returns:
+        str
+    """
+    text = translate(message_id)
+    if text is None:
+        text = default
+    return text.format(**fields) if fields else text
+
+
+def extract_content_messages():
+    """Тексты контента (диалоги, новости) на исходном языке: {id: текст}"""
+    from dialog.loader import DIALOGS_DIR, get_dialog
+    from news.feed import NEWS_DIR, load_news_from_file
+    from utils.content import get_repository
+
+    repository = get_repository()
+    messages = {}
+    for name in repository.list(DIALOGS_DIR):
+        dialog = get_dialog(name)
+        if dialog is None:
+            continue
+        for node in dialog.nodes.values():
+            messages[node.message_id] = node.text
+            if node.speaker:
+                messages[node.speaker_id] = node.speaker
+            for choice in node.choices:
+                messages[choice.message_id] = choice.text
+    for name in repository.list(NEWS_DIR):
+        news = load_news_from_file(f"{name}.json")
+        if news is not None and news.id:
+            messages[f"news.{news.id}.title"] = news.title
+            messages[f"news.{news.id}.text"] = news.text
+    return messages
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "build"
+    if command == "build":
+        for locale in available_locales():
+            if locale != SOURCE_LOCALE:
+                print(f"Каталог {locale}: {compile_catalog(locale)}")
+    elif command == "extract":
+        print(json.dumps(extract_content_messages(), ensure_ascii=False, indent=2, sort_keys=True))
+    else:
+        print(f"[ОШИБКА] Неизвестная команда: {command} (build или extract)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,8 @@
 import json
 import os
 
+from utils.i18n import tr
+
 SAVE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saves")
 SAVE_FILE = os.path.join(SAVE_DIR, "savegame.json")
 
@@ -34,7 +36,7 @@ def save_game(state, filename=None):
             json.dump(data, f, ensure_ascii=False, indent=2)
         return True
     except Exception as e:
-        print(f"[ОШИБКА] Не удалось сохранить игру: {e}")
+        print(tr("game.save.failed", "[ОШИБКА] Не удалось сохранить игру: {error}", error=e))
         return False
 
 
@@ -51,7 +53,7 @@ def load_game(filename=None):
     filepath = filename if filename else SAVE_FILE
 
     if not os.path.exists(filepath):
-        print("[ОШИБКА] Файл сохранения не найден.")
+        print(tr("game.load.not_found", "[ОШИБКА] Файл сохранения не найден."))
         return None
 
     try:
@@ -62,7 +64,7 @@ def load_game(filename=None):
         state = GameState()
         state.from_dict(data)
 
-        print("Игра загружена!")
+        print(tr("game.load.done", "Игра загружена!"))
 
         # Запустить игровой цикл
         from core.game import game_loop
@@ -71,10 +73,10 @@ def load_game(filename=None):
         return state
 
     except json.JSONDecodeError as e:
-        print(f"[ОШИБКА] Повреждённый файл сохранения: {e}")
+        print(tr("game.load.corrupted", "[ОШИБКА] Повреждённый файл сохранения: {error}", error=e))
         return None
     except Exception as e:
-        print(f"[ОШИБКА] Не удалось загрузить игру: {e}")
+        print(tr("game.load.failed", "[ОШИБКА] Не удалось загрузить игру: {error}", error=e))
         return None
 
 